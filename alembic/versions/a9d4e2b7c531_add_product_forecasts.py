@@ -0,0 +1,40 @@
+"""add product_forecasts table
+
+Revision ID: a9d4e2b7c531
+Revises: f7a3c9e1d4b6
+Create Date: 2026-10-19 17:02:48.109365
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4e2b7c531'
+down_revision: Union[str, Sequence[str], None] = 'f7a3c9e1d4b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('product_forecasts',
+    sa.Column('product_id', sa.UUID(), nullable=False),
+    sa.Column('as_of', sa.Date(), nullable=False),
+    sa.Column('period_days', sa.Integer(), nullable=False),
+    sa.Column('history_periods', sa.Integer(), nullable=False),
+    sa.Column('moving_average', sa.Float(), nullable=False),
+    sa.Column('smoothed', sa.Float(), nullable=False),
+    sa.Column('seasonal_index', sa.Float(), nullable=True),
+    sa.Column('forecast', sa.Float(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('product_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('product_forecasts')
@@ -0,0 +1,52 @@
+"""add spend_rollups table
+
+Revision ID: b2f6c8d3e914
+Revises: a9d4e2b7c531
+Create Date: 2026-10-19 17:48:12.730524
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2f6c8d3e914'
+down_revision: Union[str, Sequence[str], None] = 'a9d4e2b7c531'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('spend_rollups',
+    sa.Column('supplier_id', sa.UUID(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('line_count', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Numeric(precision=14, scale=4), nullable=False),
+    sa.ForeignKeyConstraint(['supplier_id'], ['suppliers.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('supplier_id', 'month', 'status')
+    )
+    # Backfill from existing orders; afterwards the application keeps it current.
+    op.execute("""
+        INSERT INTO spend_rollups (supplier_id, month, status, order_count, line_count, total)
+        SELECT o.supplier_id,
+               CAST(date_trunc('month', o.created_at AT TIME ZONE 'UTC') AS date),
+               o.status,
+               count(*),
+               coalesce(sum(l.lines), 0),
+               coalesce(sum(o.total), 0)
+        FROM buy_orders o
+        LEFT JOIN (
+            SELECT order_id, count(*) AS lines FROM buy_order_items GROUP BY order_id
+        ) l ON l.order_id = o.id
+        GROUP BY 1, 2, 3
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('spend_rollups')
@@ -0,0 +1,44 @@
+"""add (updated_at, id) sync indexes and tombstones table
+
+Revision ID: c3e1f4a9b2d7
+Revises: a48d2b6c7351
+Create Date: 2026-10-19 10:12:44.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e1f4a9b2d7'
+down_revision: Union[str, Sequence[str], None] = 'a48d2b6c7351'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tombstones',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('resource', sa.String(length=40), nullable=False),
+    sa.Column('record_id', sa.String(length=80), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tombstones_resource_deleted_at_id', 'tombstones', ['resource', 'deleted_at', 'id'], unique=False)
+    op.create_index('ix_suppliers_updated_at_id', 'suppliers', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_products_updated_at_id', 'products', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_supplier_products_updated_at_keys', 'supplier_products', ['updated_at', 'supplier_id', 'product_id'], unique=False)
+    op.create_index('ix_buy_orders_updated_at_id', 'buy_orders', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_buy_orders_updated_at_id', table_name='buy_orders')
+    op.drop_index('ix_supplier_products_updated_at_keys', table_name='supplier_products')
+    op.drop_index('ix_products_updated_at_id', table_name='products')
+    op.drop_index('ix_suppliers_updated_at_id', table_name='suppliers')
+    op.drop_index('ix_tombstones_resource_deleted_at_id', table_name='tombstones')
+    op.drop_table('tombstones')
@@ -0,0 +1,27 @@
+"""add (supplier_id, status) index on buy_orders
+
+Revision ID: c4a7e9f2b810
+Revises: b2f6c8d3e914
+Create Date: 2026-10-19 19:02:37.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a7e9f2b810'
+down_revision: Union[str, Sequence[str], None] = 'b2f6c8d3e914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_buy_orders_supplier_id_status', 'buy_orders', ['supplier_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_buy_orders_supplier_id_status', table_name='buy_orders')
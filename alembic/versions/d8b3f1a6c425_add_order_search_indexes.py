@@ -0,0 +1,34 @@
+"""add order search indexes
+
+Revision ID: d8b3f1a6c425
+Revises: c4a7e9f2b810
+Create Date: 2026-10-19 19:41:53.906214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8b3f1a6c425'
+down_revision: Union[str, Sequence[str], None] = 'c4a7e9f2b810'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_buy_orders_created_at_id', 'buy_orders', ['created_at', 'id'], unique=False)
+    op.create_index('ix_buy_orders_total_id', 'buy_orders', ['total', 'id'], unique=False)
+    op.create_index('ix_buy_orders_notes_trgm', 'buy_orders', ['notes'], unique=False, postgresql_using='gin', postgresql_ops={'notes': 'gin_trgm_ops'})
+    op.create_index('ix_buy_order_items_product_id', 'buy_order_items', ['product_id', 'order_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_buy_order_items_product_id', table_name='buy_order_items')
+    op.drop_index('ix_buy_orders_notes_trgm', table_name='buy_orders', postgresql_using='gin', postgresql_ops={'notes': 'gin_trgm_ops'})
+    op.drop_index('ix_buy_orders_total_id', table_name='buy_orders')
+    op.drop_index('ix_buy_orders_created_at_id', table_name='buy_orders')
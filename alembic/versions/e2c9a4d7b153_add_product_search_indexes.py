@@ -0,0 +1,35 @@
+"""add product search indexes
+
+Revision ID: e2c9a4d7b153
+Revises: d8b3f1a6c425
+Create Date: 2026-10-19 20:14:08.562371
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c9a4d7b153'
+down_revision: Union[str, Sequence[str], None] = 'd8b3f1a6c425'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_products_sku_prefix', 'products', [sa.text('lower(sku) text_pattern_ops')], unique=False)
+    op.create_index('ix_products_name_prefix', 'products', [sa.text('lower(name) text_pattern_ops')], unique=False)
+    op.create_index('ix_products_name_trgm', 'products', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_products_description_trgm', 'products', ['description'], unique=False, postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_products_description_trgm', table_name='products', postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+    op.drop_index('ix_products_name_trgm', table_name='products', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.drop_index('ix_products_name_prefix', table_name='products')
+    op.drop_index('ix_products_sku_prefix', table_name='products')
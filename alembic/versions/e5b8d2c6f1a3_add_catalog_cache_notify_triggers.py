@@ -0,0 +1,65 @@
+"""add catalog cache NOTIFY triggers
+
+Revision ID: e5b8d2c6f1a3
+Revises: c3e1f4a9b2d7
+Create Date: 2026-10-19 14:03:27.581946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8d2c6f1a3'
+down_revision: Union[str, Sequence[str], None] = 'c3e1f4a9b2d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, cache kind) — payloads must match CatalogCache.handle_notification.
+TABLES = (
+    ('suppliers', 'suppliers'),
+    ('products', 'products'),
+    ('supplier_products', 'offers'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_notify is transactional: listeners only hear about committed rows, and
+    # duplicate payloads within one transaction are delivered once. INSERTs are not
+    # covered because missing rows are never cached.
+    op.execute("""
+        CREATE FUNCTION notify_catalog_cache() RETURNS trigger AS $$
+        DECLARE
+            rec record;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                rec := OLD;
+            ELSE
+                rec := NEW;
+            END IF;
+            IF TG_ARGV[0] = 'offers' THEN
+                PERFORM pg_notify(
+                    'catalog_cache', 'offers:' || rec.supplier_id || ':' || rec.product_id
+                );
+            ELSE
+                PERFORM pg_notify('catalog_cache', TG_ARGV[0] || ':' || rec.id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table, kind in TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_catalog_cache
+            AFTER UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION notify_catalog_cache('{kind}')
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _ in TABLES:
+        op.execute(f"DROP TRIGGER {table}_notify_catalog_cache ON {table}")
+    op.execute("DROP FUNCTION notify_catalog_cache()")
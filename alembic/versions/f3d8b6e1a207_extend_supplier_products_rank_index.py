@@ -0,0 +1,29 @@
+"""extend supplier_products price index with rank tie-breakers
+
+Revision ID: f3d8b6e1a207
+Revises: e2c9a4d7b153
+Create Date: 2026-10-19 21:06:44.270815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3d8b6e1a207'
+down_revision: Union[str, Sequence[str], None] = 'e2c9a4d7b153'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_supplier_products_offer_rank', 'supplier_products', ['product_id', 'unit_price', 'minimum_quantity', 'supplier_id'], unique=False)
+    op.drop_index('ix_supplier_products_product_id_unit_price', table_name='supplier_products')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_supplier_products_product_id_unit_price', 'supplier_products', ['product_id', 'unit_price'], unique=False)
+    op.drop_index('ix_supplier_products_offer_rank', table_name='supplier_products')
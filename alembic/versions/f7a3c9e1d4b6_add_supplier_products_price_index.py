@@ -0,0 +1,27 @@
+"""add (product_id, unit_price) index on supplier_products
+
+Revision ID: f7a3c9e1d4b6
+Revises: e5b8d2c6f1a3
+Create Date: 2026-10-19 16:21:05.442917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a3c9e1d4b6'
+down_revision: Union[str, Sequence[str], None] = 'e5b8d2c6f1a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_supplier_products_product_id_unit_price', 'supplier_products', ['product_id', 'unit_price'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_supplier_products_product_id_unit_price', table_name='supplier_products')
@@ -1,12 +1,18 @@
+import uuid
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.exceptions import ForbiddenError, ValidationError
+from app.core.profiling import PROFILE_HEADER, is_valid_token
 from app.core.security import decode_token
 from app.db.session import get_db
+from app.schemas.common import MAX_LOOKUP_IDS
+from app.schemas.sync import ChangeWindow, SyncCursor
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
@@ -34,3 +40,68 @@ async def get_current_user_id(token: Token) -> str:
 
 
 CurrentUserID = Annotated[str, Depends(get_current_user_id)]
+
+# ── List endpoints ────────────────────────────────────────────────────────────
+
+DEFAULT_PAGE_SIZE = 20
+
+# Query/header params shared by list endpoints. ``limit`` is unbounded when the client
+# asks for an NDJSON stream and falls back to DEFAULT_PAGE_SIZE for regular JSON pages.
+PageLimit = Annotated[
+    int | None,
+    Query(description=f"Page size (default {DEFAULT_PAGE_SIZE}; unbounded when streaming NDJSON)."),
+]
+AcceptHeader = Annotated[str | None, Header(alias="Accept", include_in_schema=False)]
+
+# ── Conditional GETs ──────────────────────────────────────────────────────────
+
+IfNoneMatch = Annotated[
+    str | None,
+    Header(alias="If-None-Match", description="ETag from a previous response; 304 if unchanged."),
+]
+
+
+async def get_change_window(
+    updated_since: Annotated[
+        datetime | None, Query(description="Only rows changed at or after this instant.")
+    ] = None,
+    cursor: Annotated[
+        str | None, Query(description="Resume an incremental sync (from X-Next-Cursor).")
+    ] = None,
+) -> ChangeWindow | None:
+    """Incremental-sync mode: set by either parameter; the cursor wins when both are sent."""
+    if updated_since is None and cursor is None:
+        return None
+    return ChangeWindow(
+        updated_since=updated_since,
+        after=SyncCursor.decode(cursor) if cursor is not None else None,
+    )
+
+
+Changes = Annotated[ChangeWindow | None, Depends(get_change_window)]
+
+
+async def get_lookup_ids(
+    ids: Annotated[str, Query(description=f"Comma-separated ids (at most {MAX_LOOKUP_IDS}).")],
+) -> list[uuid.UUID]:
+    try:
+        parsed = [uuid.UUID(part.strip()) for part in ids.split(",") if part.strip()]
+    except ValueError as exc:
+        raise ValidationError("ids must be a comma-separated list of UUIDs.") from exc
+    if not parsed or len(parsed) > MAX_LOOKUP_IDS:
+        raise ValidationError(f"Between 1 and {MAX_LOOKUP_IDS} ids are required.")
+    return parsed
+
+
+LookupIds = Annotated[list[uuid.UUID], Depends(get_lookup_ids)]
+
+
+async def require_profiling_token(
+    token: Annotated[str | None, Header(alias=PROFILE_HEADER)] = None,
+) -> None:
+    """Guard for the profile store: the caller must present the profiling secret."""
+    if not is_valid_token(token):
+        raise ForbiddenError("A valid profiling token is required.")
+
+
+ProfilingAccess = Depends(require_profiling_token)
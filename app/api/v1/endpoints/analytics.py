@@ -0,0 +1,27 @@
+from datetime import date
+
+from fastapi import APIRouter, Query, Response
+
+from app.api.deps import DBSession
+from app.core.responses import RawJSONResponse
+from app.schemas.analytics import ABCResponse, SpendDimension
+from app.services.analytics import AnalyticsService
+
+router = APIRouter(tags=["analytics"])
+
+
+@router.get("/abc", response_model=ABCResponse)
+async def abc_classification(
+    db: DBSession,
+    dimension: SpendDimension = SpendDimension.PRODUCTS,
+    date_from: date | None = Query(default=None, description="Inclusive (order created_at)."),
+    date_to: date | None = Query(default=None, description="Exclusive (order created_at)."),
+    a_share: float = Query(default=0.8, gt=0, le=1, description="Cumulative spend share of A."),
+    b_share: float = Query(default=0.95, gt=0, le=1, description="Cumulative share of A + B."),
+) -> Response:
+    """Products or suppliers ranked by committed spend and classed A/B/C (Pareto)."""
+    return RawJSONResponse(
+        await AnalyticsService.abc(
+            db, dimension, date_from=date_from, date_to=date_to, a_share=a_share, b_share=b_share
+        )
+    )
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Response
+
+from app.api.deps import DBSession
+from app.core.responses import RawJSONResponse
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.services.batch import BatchService
+
+router = APIRouter(tags=["batch"])
+
+
+@router.post("", response_model=BatchResponse)
+async def run_batch(db: DBSession, body: BatchRequest) -> Response:
+    """Run service operations in order, in a single transaction (all or nothing)."""
+    results = await BatchService.run(db, body.operations)
+    return RawJSONResponse({"results": results})
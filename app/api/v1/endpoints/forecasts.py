@@ -0,0 +1,24 @@
+import uuid
+
+from fastapi import APIRouter, Query
+
+from app.api.deps import DBSession
+from app.schemas.forecast import ProductForecastResponse
+from app.services.forecast import ForecastService
+
+router = APIRouter(tags=["forecasts"])
+
+
+@router.get("", response_model=list[ProductForecastResponse])
+async def list_forecasts(
+    db: DBSession,
+    skip: int = 0,
+    limit: int = Query(default=20, ge=1, le=1000),
+) -> list[ProductForecastResponse]:
+    """Latest forecast per product, as of the last ``python -m app.cli.forecast`` run."""
+    return await ForecastService.list_forecasts(db, skip=skip, limit=limit)  # type: ignore[return-value]
+
+
+@router.get("/{product_id}", response_model=ProductForecastResponse)
+async def get_forecast(db: DBSession, product_id: uuid.UUID) -> ProductForecastResponse:
+    return await ForecastService.get_forecast(db, product_id)  # type: ignore[return-value]
@@ -1,9 +1,11 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from sqlalchemy import text
 
-from app.api.deps import DBSession
+from app.api.deps import CurrentUserID, DBSession
 from app.core.config import settings
-from app.schemas.common import HealthResponse
+from app.db.metrics import pool_wait_stats
+from app.db.session import engine
+from app.schemas.common import HealthResponse, PoolStatusResponse
 
 router = APIRouter(tags=["health"])
 
@@ -23,3 +25,31 @@ async def health_check(db: DBSession) -> HealthResponse:
         environment=settings.ENVIRONMENT,
         database=db_status,
     )
+
+
+@router.get("/health/pool", response_model=PoolStatusResponse)
+async def pool_status(
+    _user: CurrentUserID,
+    reset_peak: bool = Query(
+        default=False, description="Start a new window for wait_peak_ms after this read."
+    ),
+) -> PoolStatusResponse:
+    """Connection-pool occupancy and cumulative acquire wait for this worker (bearer token).
+
+    ``wait_peak_ms`` is the longest wait since the last read with ``reset_peak``, so a
+    single poller (the load test) can get a per-stage maximum; ``wait_max_ms`` never resets.
+    """
+    pool = engine.pool
+    waits = pool_wait_stats.snapshot(reset_peak=reset_peak)
+    return PoolStatusResponse(
+        pid=waits.pid,
+        size=pool.size(),  # type: ignore[attr-defined]
+        checked_out=pool.checkedout(),  # type: ignore[attr-defined]
+        overflow=max(0, pool.overflow()),  # type: ignore[attr-defined]
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        acquisitions=waits.acquisitions,
+        timeouts=waits.timeouts,
+        wait_total_ms=waits.wait_total_ms,
+        wait_max_ms=waits.wait_max_ms,
+        wait_peak_ms=waits.wait_peak_ms,
+    )
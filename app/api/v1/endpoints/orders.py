@@ -1,9 +1,31 @@
 import uuid
+from datetime import date, datetime
+from decimal import Decimal
 
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from app.api.deps import DBSession
-from app.models.buy_order import OrderStatus
+from app.api.deps import (
+    DEFAULT_PAGE_SIZE,
+    AcceptHeader,
+    Changes,
+    DBSession,
+    IfNoneMatch,
+    LookupIds,
+    PageLimit,
+)
+from app.core.response_cache import response_cache
+from app.core.responses import (
+    NDJSON_RESPONSES,
+    ModelResponse,
+    NDJSONResponse,
+    NotModifiedResponse,
+    RawJSONResponse,
+    etag_matches,
+    wants_ndjson,
+)
+from app.models.buy_order import BuyOrder, OrderStatus
+from app.models.supplier import Supplier
 from app.schemas.buy_order import (
     BuyOrderCreate,
     BuyOrderItemCreate,
@@ -14,22 +36,65 @@ from app.schemas.buy_order import (
     BuyOrderUpdate,
     BuyOrderWithItems,
 )
+from app.schemas.cart import CartOptimizeRequest, CartPlan
+from app.schemas.common import LookupRequest, LookupResponse
+from app.schemas.export import ExportFormat
+from app.schemas.order_search import (
+    MAX_SEARCH_PAGE_SIZE,
+    OrderSearch,
+    OrderSearchCursor,
+    OrderSort,
+)
+from app.schemas.reorder import ReorderRequest, ReorderResult, ReorderSuggestion
+from app.schemas.sparse import Fieldset
 from app.services.buy_order import BuyOrderService
+from app.services.cart import CartService
+from app.services.export import OrderExportService
+from app.services.reorder import ReorderService
 
 router = APIRouter(tags=["orders"])
 
 
-@router.get("", response_model=list[BuyOrderResponse])
+@router.get("", response_model=list[BuyOrderResponse], responses=NDJSON_RESPONSES)
 async def list_orders(
+    request: Request,
     db: DBSession,
+    accept: AcceptHeader = None,
     skip: int = 0,
-    limit: int = 20,
+    limit: PageLimit = None,
     supplier_id: uuid.UUID | None = Query(default=None),
     order_status: OrderStatus | None = Query(default=None, alias="status"),
-) -> list[BuyOrderResponse]:
-    return await BuyOrderService.list_orders(  # type: ignore[return-value]
-        db, skip=skip, limit=limit, supplier_id=supplier_id, status=order_status
+    changes: Changes = None,
+) -> Response:
+    if wants_ndjson(accept):
+        return NDJSONResponse(
+            BuyOrderService.stream_orders(
+                db,
+                skip=skip,
+                limit=limit,
+                supplier_id=supplier_id,
+                status=order_status,
+                changes=changes,
+            )
+        )
+    limit = DEFAULT_PAGE_SIZE if limit is None else limit
+    if changes is None:
+        return await response_cache.json(
+            request,
+            (BuyOrder.__tablename__, Supplier.__tablename__),  # rows embed the supplier
+            lambda: BuyOrderService.list_orders(
+                db, skip=skip, limit=limit, supplier_id=supplier_id, status=order_status
+            ),
+        )
+    orders = await BuyOrderService.list_orders(
+        db,
+        skip=skip,
+        limit=limit,
+        supplier_id=supplier_id,
+        status=order_status,
+        changes=changes,
     )
+    return RawJSONResponse(orders, headers=changes.page_headers(orders))
 
 
 @router.post("", response_model=BuyOrderResponse, status_code=status.HTTP_201_CREATED)
@@ -37,9 +102,141 @@ async def create_order(db: DBSession, body: BuyOrderCreate) -> BuyOrderResponse:
     return await BuyOrderService.create_order(db, body)  # type: ignore[return-value]
 
 
+@router.post("/optimize", response_model=CartPlan)
+async def optimize_cart(db: DBSession, body: CartOptimizeRequest) -> CartPlan:
+    """Cheapest split of a cart across suppliers, as proposed DRAFT orders (nothing is saved)."""
+    return await CartService.optimize(db, body)
+
+
+@router.get(
+    "/reorder-suggestions",
+    response_model=list[ReorderSuggestion],
+    responses=NDJSON_RESPONSES,
+)
+async def list_reorder_suggestions(
+    db: DBSession,
+    accept: AcceptHeader = None,
+    skip: int = 0,
+    limit: PageLimit = None,
+    supplier_id: uuid.UUID | None = Query(default=None),
+) -> Response:
+    """Products below their preferred offer's optimal quantity, and how much to order."""
+    if wants_ndjson(accept):
+        return NDJSONResponse(
+            ReorderService.stream_suggestions(db, skip=skip, limit=limit, supplier_id=supplier_id)
+        )
+    limit = DEFAULT_PAGE_SIZE if limit is None else limit
+    return RawJSONResponse(
+        await ReorderService.list_suggestions(db, skip=skip, limit=limit, supplier_id=supplier_id)
+    )
+
+
+@router.post("/reorder", response_model=ReorderResult, status_code=status.HTTP_201_CREATED)
+async def create_reorder_orders(db: DBSession, body: ReorderRequest) -> Response:
+    """Create one DRAFT order per supplier with every current reorder suggestion."""
+    return RawJSONResponse(
+        await ReorderService.create_orders(db, body), status_code=status.HTTP_201_CREATED
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {f.media_type: {} for f in ExportFormat}}},
+)
+async def export_order_lines(
+    db: DBSession,
+    fmt: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+    statuses: list[OrderStatus] | None = Query(
+        default=None, alias="status", description="Defaults to CONFIRMED, SENT and RECEIVED."
+    ),
+    created_from: date | None = Query(default=None, description="Inclusive (order created_at)."),
+    created_to: date | None = Query(default=None, description="Exclusive (order created_at)."),
+) -> StreamingResponse:
+    """Flattened order lines (order + supplier + product columns) for a date range."""
+    OrderExportService.check_format(fmt)
+    return StreamingResponse(
+        OrderExportService.stream(
+            db, fmt, statuses=statuses, created_from=created_from, created_to=created_to
+        ),
+        media_type=fmt.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="order-lines.{fmt.extension}"'
+        },
+    )
+
+
+@router.get("/search", response_model=list[BuyOrderResponse])
+async def search_orders(
+    db: DBSession,
+    supplier_id: uuid.UUID | None = Query(default=None),
+    statuses: list[OrderStatus] | None = Query(default=None, alias="status"),
+    created_from: datetime | None = Query(default=None, description="Inclusive."),
+    created_to: datetime | None = Query(default=None, description="Exclusive."),
+    total_min: Decimal | None = Query(default=None),
+    total_max: Decimal | None = Query(default=None),
+    product_id: uuid.UUID | None = Query(
+        default=None, description="Only orders with a line for this product."
+    ),
+    notes: str | None = Query(
+        default=None, min_length=3, max_length=200, description="Case-insensitive substring."
+    ),
+    sort: OrderSort = OrderSort.CREATED_AT_DESC,
+    cursor: str | None = Query(default=None, description="From X-Next-Cursor."),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_SEARCH_PAGE_SIZE),
+) -> Response:
+    """Filtered, sorted orders, keyset-paginated: follow ``X-Next-Cursor`` until it is absent.
+
+    ``status`` may be repeated. A cursor only resumes the sort it was issued for.
+    """
+    search = OrderSearch(
+        supplier_id=supplier_id,
+        statuses=tuple(statuses or ()),
+        created_from=created_from,
+        created_to=created_to,
+        total_min=total_min,
+        total_max=total_max,
+        product_id=product_id,
+        notes=notes,
+    )
+    orders = await BuyOrderService.search_orders(
+        db, search, sort=sort, cursor=cursor, limit=limit
+    )
+    return RawJSONResponse(orders, headers=OrderSearchCursor.page_headers(orders, sort, limit))
+
+
+@router.get("/lookup", response_model=LookupResponse[BuyOrderResponse])
+async def lookup_orders(db: DBSession, ids: LookupIds) -> Response:
+    """Batch read: ``?ids=a,b,c``; ids that do not exist come back in ``missing``."""
+    return RawJSONResponse(await BuyOrderService.lookup_orders(db, ids))
+
+
+@router.post("/lookup", response_model=LookupResponse[BuyOrderResponse])
+async def lookup_orders_by_body(db: DBSession, body: LookupRequest) -> Response:
+    """Same as ``GET /lookup`` for id lists too long for a query string."""
+    return RawJSONResponse(await BuyOrderService.lookup_orders(db, body.ids))
+
+
 @router.get("/{order_id}", response_model=BuyOrderWithItems)
-async def get_order(db: DBSession, order_id: uuid.UUID) -> BuyOrderWithItems:
-    return await BuyOrderService.get_order_with_items(db, order_id)  # type: ignore[return-value]
+async def get_order(
+    db: DBSession,
+    order_id: uuid.UUID,
+    if_none_match: IfNoneMatch = None,
+    fields: str | None = Query(default=None, description="Comma-separated top-level fields."),
+    include: str | None = Query(
+        default=None, description="Relations to embed: supplier, items, items.product."
+    ),
+) -> Response:
+    fieldset = Fieldset.parse(BuyOrderWithItems, fields=fields, include=include)
+    # Versioned before the load; see get_supplier.
+    etag = await BuyOrderService.get_order_etag(db, order_id, fieldset)
+    if etag_matches(if_none_match, etag):
+        return NotModifiedResponse(etag)
+    order = await BuyOrderService.get_order_with_items(db, order_id, include=fieldset.include)
+    headers = {"ETag": etag}
+    if fieldset.is_full:
+        return ModelResponse(BuyOrderWithItems, order, headers=headers)
+    return RawJSONResponse(fieldset.dump(order), headers=headers)
 
 
 @router.patch("/{order_id}", response_model=BuyOrderResponse)
@@ -57,8 +254,9 @@ async def delete_order(db: DBSession, order_id: uuid.UUID) -> None:
 @router.patch("/{order_id}/status", response_model=BuyOrderWithItems)
 async def transition_order_status(
     db: DBSession, order_id: uuid.UUID, body: BuyOrderStatusUpdate
-) -> BuyOrderWithItems:
-    return await BuyOrderService.transition_status(db, order_id, body.status)  # type: ignore[return-value]
+) -> Response:
+    order = await BuyOrderService.transition_status(db, order_id, body.status)
+    return ModelResponse(BuyOrderWithItems, order)
 
 
 # ── Order items ───────────────────────────────────────────────────────────────
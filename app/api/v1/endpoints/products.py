@@ -1,22 +1,60 @@
 import uuid
+from typing import Annotated
 
-from fastapi import APIRouter, File, UploadFile, status
+from fastapi import APIRouter, File, Query, Request, Response, UploadFile, status
 
-from app.api.deps import DBSession
+from app.api.deps import (
+    DEFAULT_PAGE_SIZE,
+    AcceptHeader,
+    Changes,
+    DBSession,
+    LookupIds,
+    PageLimit,
+)
 from app.core.exceptions import ValidationError
+from app.core.response_cache import response_cache
+from app.core.responses import NDJSON_RESPONSES, NDJSONResponse, RawJSONResponse, wants_ndjson
+from app.models.product import Product
+from app.schemas.common import LookupRequest, LookupResponse
 from app.schemas.product import ProductCreate, ProductImportResult, ProductResponse, ProductUpdate
+from app.schemas.product_search import (
+    MAX_PRODUCT_SEARCH_PAGE_SIZE,
+    ProductSearchCursor,
+    ProductSearchHit,
+)
+from app.schemas.supplier_product import (
+    MAX_OFFERS_PER_PRODUCT,
+    ProductOffer,
+    ProductOffers,
+    ProductOffersRequest,
+)
 from app.services.product import ProductService
 
 router = APIRouter(tags=["products"])
 
 
-@router.get("", response_model=list[ProductResponse])
+@router.get("", response_model=list[ProductResponse], responses=NDJSON_RESPONSES)
 async def list_products(
+    request: Request,
     db: DBSession,
+    accept: AcceptHeader = None,
     skip: int = 0,
-    limit: int = 20,
-) -> list[ProductResponse]:
-    return await ProductService.list_products(db, skip=skip, limit=limit)  # type: ignore[return-value]
+    limit: PageLimit = None,
+    changes: Changes = None,
+) -> Response:
+    if wants_ndjson(accept):
+        return NDJSONResponse(
+            ProductService.stream_products(db, skip=skip, limit=limit, changes=changes)
+        )
+    limit = DEFAULT_PAGE_SIZE if limit is None else limit
+    if changes is None:
+        return await response_cache.json(
+            request,
+            (Product.__tablename__,),
+            lambda: ProductService.list_products(db, skip=skip, limit=limit),
+        )
+    products = await ProductService.list_products(db, skip=skip, limit=limit, changes=changes)
+    return RawJSONResponse(products, headers=changes.page_headers(products))
 
 
 @router.post("", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
@@ -35,11 +73,65 @@ async def import_products(
     return await ProductService.import_from_csv(db, content)
 
 
+@router.get("/search", response_model=list[ProductSearchHit])
+async def search_products(
+    db: DBSession,
+    q: str = Query(
+        min_length=2, max_length=100, description="SKU prefix or name/description text."
+    ),
+    cursor: str | None = Query(default=None, description="From X-Next-Cursor."),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PRODUCT_SEARCH_PAGE_SIZE),
+) -> Response:
+    """Ranked product search, keyset-paginated: follow ``X-Next-Cursor`` until it is absent.
+
+    SKU matches (exact, then prefix) rank above name and description matches.
+    """
+    q = q.strip()
+    if len(q) < 2:
+        raise ValidationError("q must have at least 2 non-blank characters.")
+    products = await ProductService.search_products(db, q, cursor=cursor, limit=limit)
+    return RawJSONResponse(products, headers=ProductSearchCursor.page_headers(products, q, limit))
+
+
+@router.get("/lookup", response_model=LookupResponse[ProductResponse])
+async def lookup_products(db: DBSession, ids: LookupIds) -> Response:
+    """Batch read: ``?ids=a,b,c``; ids that do not exist come back in ``missing``."""
+    return RawJSONResponse(await ProductService.lookup_products(db, ids))
+
+
+@router.post("/lookup", response_model=LookupResponse[ProductResponse])
+async def lookup_products_by_body(db: DBSession, body: LookupRequest) -> Response:
+    """Same as ``GET /lookup`` for id lists too long for a query string."""
+    return RawJSONResponse(await ProductService.lookup_products(db, body.ids))
+
+
+@router.get("/offers", response_model=LookupResponse[ProductOffers])
+async def lookup_offers(
+    db: DBSession,
+    ids: LookupIds,
+    per_product: Annotated[int, Query(ge=1, le=MAX_OFFERS_PER_PRODUCT)] = 1,
+) -> Response:
+    """Cheapest ``per_product`` offers for each of ``?ids=a,b,c``; unknown ids in ``missing``."""
+    return RawJSONResponse(await ProductService.lookup_offers(db, ids, per_product))
+
+
+@router.post("/offers", response_model=LookupResponse[ProductOffers])
+async def lookup_offers_by_body(db: DBSession, body: ProductOffersRequest) -> Response:
+    """Same as ``GET /offers`` for id lists too long for a query string."""
+    return RawJSONResponse(await ProductService.lookup_offers(db, body.ids, body.per_product))
+
+
 @router.get("/{product_id}", response_model=ProductResponse)
 async def get_product(db: DBSession, product_id: uuid.UUID) -> ProductResponse:
     return await ProductService.get_product(db, product_id)  # type: ignore[return-value]
 
 
+@router.get("/{product_id}/offers", response_model=list[ProductOffer])
+async def list_product_offers(db: DBSession, product_id: uuid.UUID) -> Response:
+    """Every supplier offering the product, cheapest first; unpriced offers last."""
+    return RawJSONResponse(await ProductService.list_offers(db, product_id))
+
+
 @router.patch("/{product_id}", response_model=ProductResponse)
 async def update_product(
     db: DBSession, product_id: uuid.UUID, body: ProductUpdate
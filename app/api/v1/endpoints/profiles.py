@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.api.deps import ProfilingAccess
+from app.core.exceptions import NotFoundError
+from app.core.profiling import get_profile_path, list_profiles
+from app.schemas.profile import ProfileInfo
+
+router = APIRouter(tags=["profiles"], dependencies=[ProfilingAccess])
+
+
+@router.get("", response_model=list[ProfileInfo])
+async def list_stored_profiles() -> list[ProfileInfo]:
+    profiles = []
+    for path in list_profiles():
+        stat = path.stat()
+        profiles.append(
+            ProfileInfo(
+                name=path.name,
+                size_bytes=stat.st_size,
+                created_at=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            )
+        )
+    return profiles
+
+
+@router.get("/{name}", response_class=PlainTextResponse)
+async def get_stored_profile(name: str) -> str:
+    """Collapsed stacks, ready for flamegraph.pl or speedscope."""
+    path = get_profile_path(name)
+    if path is None:
+        raise NotFoundError("Profile", name)
+    return path.read_text()
@@ -0,0 +1,34 @@
+import uuid
+from datetime import date
+
+from fastapi import APIRouter, Query, Response
+
+from app.api.deps import DBSession
+from app.core.responses import RawJSONResponse
+from app.models.buy_order import OrderStatus
+from app.schemas.report import SpendRollupResponse
+from app.services.report import ReportService
+
+router = APIRouter(tags=["reports"])
+
+
+@router.get("/spend", response_model=list[SpendRollupResponse])
+async def spend_report(
+    db: DBSession,
+    supplier_id: uuid.UUID | None = Query(default=None),
+    statuses: list[OrderStatus] | None = Query(
+        default=None, alias="status", description="Repeatable; all statuses by default."
+    ),
+    month_from: date | None = Query(default=None, description="Inclusive; any day of the month."),
+    month_to: date | None = Query(default=None, description="Inclusive; any day of the month."),
+) -> Response:
+    """Order count, line count and total per supplier, month and status (from the rollup)."""
+    return RawJSONResponse(
+        await ReportService.spend(
+            db,
+            supplier_id=supplier_id,
+            statuses=statuses,
+            month_from=month_from,
+            month_to=month_to,
+        )
+    )
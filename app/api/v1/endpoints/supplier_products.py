@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Response
+
+from app.api.deps import DEFAULT_PAGE_SIZE, Changes, DBSession, PageLimit
+from app.core.responses import RawJSONResponse
+from app.schemas.supplier_product import SupplierProductResponse
+from app.services.supplier import SupplierService
+
+router = APIRouter(tags=["suppliers"])
+
+# Offers are keyed by (supplier_id, product_id); sync cursors carry both.
+_KEYS = ("supplier_id", "product_id")
+
+
+@router.get("", response_model=list[SupplierProductResponse])
+async def list_all_supplier_products(
+    db: DBSession,
+    skip: int = 0,
+    limit: PageLimit = None,
+    changes: Changes = None,
+) -> Response:
+    """Offers across all suppliers, for mirrors (see ``/suppliers/{id}/products``)."""
+    rows = await SupplierService.list_all_supplier_products(
+        db, skip=skip, limit=DEFAULT_PAGE_SIZE if limit is None else limit, changes=changes
+    )
+    headers = changes.page_headers(rows, keys=_KEYS) if changes else None
+    return RawJSONResponse(rows, headers=headers)
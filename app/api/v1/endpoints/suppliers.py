@@ -1,22 +1,83 @@
 import uuid
 
-from fastapi import APIRouter, status
-
-from app.api.deps import DBSession
-from app.schemas.supplier import SupplierCreate, SupplierResponse, SupplierUpdate, SupplierWithProducts
+from fastapi import APIRouter, Query, Request, Response, status
+
+from app.api.deps import (
+    DEFAULT_PAGE_SIZE,
+    AcceptHeader,
+    Changes,
+    DBSession,
+    IfNoneMatch,
+    LookupIds,
+    PageLimit,
+)
+from app.core.response_cache import response_cache
+from app.core.responses import (
+    NDJSON_RESPONSES,
+    ModelResponse,
+    NDJSONResponse,
+    NotModifiedResponse,
+    RawJSONResponse,
+    etag_matches,
+    wants_ndjson,
+)
+from app.models.buy_order import BuyOrder
+from app.models.supplier import Supplier
+from app.models.supplier_product import SupplierProduct
+from app.schemas.common import LookupRequest, LookupResponse
+from app.schemas.supplier import (
+    SupplierCreate,
+    SupplierResponse,
+    SupplierUpdate,
+    SupplierWithProducts,
+    SupplierWithStats,
+)
 from app.schemas.supplier_product import SupplierProductCreate, SupplierProductResponse, SupplierProductUpdate
+from app.schemas.sparse import Fieldset
 from app.services.supplier import SupplierService
 
 router = APIRouter(tags=["suppliers"])
 
 
-@router.get("", response_model=list[SupplierResponse])
+@router.get(
+    "",
+    response_model=list[SupplierWithStats] | list[SupplierResponse],
+    responses=NDJSON_RESPONSES,
+)
 async def list_suppliers(
+    request: Request,
     db: DBSession,
+    accept: AcceptHeader = None,
     skip: int = 0,
-    limit: int = 20,
-) -> list[SupplierResponse]:
-    return await SupplierService.list_suppliers(db, skip=skip, limit=limit)  # type: ignore[return-value]
+    limit: PageLimit = None,
+    changes: Changes = None,
+    with_stats: bool = Query(
+        default=False,
+        description="Add product count and open order count/value to every supplier.",
+    ),
+) -> Response:
+    if wants_ndjson(accept):
+        return NDJSONResponse(
+            SupplierService.stream_suppliers(
+                db, skip=skip, limit=limit, changes=changes, with_stats=with_stats
+            )
+        )
+    limit = DEFAULT_PAGE_SIZE if limit is None else limit
+    if changes is None:
+        tables: tuple[str, ...] = (Supplier.__tablename__,)
+        if with_stats:
+            tables += (SupplierProduct.__tablename__, BuyOrder.__tablename__)
+        return await response_cache.json(
+            request,
+            tables,
+            lambda: SupplierService.list_suppliers(
+                db, skip=skip, limit=limit, with_stats=with_stats
+            ),
+        )
+    suppliers = await SupplierService.list_suppliers(
+        db, skip=skip, limit=limit, changes=changes, with_stats=with_stats
+    )
+    return RawJSONResponse(suppliers, headers=changes.page_headers(suppliers))
 
 
 @router.post("", response_model=SupplierResponse, status_code=status.HTTP_201_CREATED)
@@ -24,9 +85,42 @@ async def create_supplier(db: DBSession, body: SupplierCreate) -> SupplierRespon
     return await SupplierService.create_supplier(db, body)  # type: ignore[return-value]
 
 
+@router.get("/lookup", response_model=LookupResponse[SupplierResponse])
+async def lookup_suppliers(db: DBSession, ids: LookupIds) -> Response:
+    """Batch read: ``?ids=a,b,c``; ids that do not exist come back in ``missing``."""
+    return RawJSONResponse(await SupplierService.lookup_suppliers(db, ids))
+
+
+@router.post("/lookup", response_model=LookupResponse[SupplierResponse])
+async def lookup_suppliers_by_body(db: DBSession, body: LookupRequest) -> Response:
+    """Same as ``GET /lookup`` for id lists too long for a query string."""
+    return RawJSONResponse(await SupplierService.lookup_suppliers(db, body.ids))
+
+
 @router.get("/{supplier_id}", response_model=SupplierWithProducts)
-async def get_supplier(db: DBSession, supplier_id: uuid.UUID) -> SupplierWithProducts:
-    return await SupplierService.get_supplier_with_products(db, supplier_id)  # type: ignore[return-value]
+async def get_supplier(
+    db: DBSession,
+    supplier_id: uuid.UUID,
+    if_none_match: IfNoneMatch = None,
+    fields: str | None = Query(default=None, description="Comma-separated top-level fields."),
+    include: str | None = Query(
+        default=None,
+        description="Relations to embed: supplier_products, supplier_products.product.",
+    ),
+) -> Response:
+    fieldset = Fieldset.parse(SupplierWithProducts, fields=fields, include=include)
+    # Versioned before the load: a write landing in between yields an ETag older than
+    # the body (one extra 200 later), never a newer one pinning a stale body.
+    etag = await SupplierService.get_supplier_etag(db, supplier_id, fieldset)
+    if etag_matches(if_none_match, etag):
+        return NotModifiedResponse(etag)
+    supplier = await SupplierService.get_supplier_with_products(
+        db, supplier_id, include=fieldset.include
+    )
+    headers = {"ETag": etag}
+    if fieldset.is_full:
+        return ModelResponse(SupplierWithProducts, supplier, headers=headers)
+    return RawJSONResponse(fieldset.dump(supplier), headers=headers)
 
 
 @router.patch("/{supplier_id}", response_model=SupplierResponse)
@@ -47,8 +141,9 @@ async def delete_supplier(db: DBSession, supplier_id: uuid.UUID) -> None:
 @router.get("/{supplier_id}/products", response_model=list[SupplierProductResponse])
 async def list_supplier_products(
     db: DBSession, supplier_id: uuid.UUID
-) -> list[SupplierProductResponse]:
-    return await SupplierService.list_supplier_products(db, supplier_id)  # type: ignore[return-value]
+) -> Response:
+    supplier_products = await SupplierService.list_supplier_products(db, supplier_id)
+    return ModelResponse(list[SupplierProductResponse], supplier_products)
 
 
 @router.post(
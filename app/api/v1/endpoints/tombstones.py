@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Query, Response
+
+from app.api.deps import Changes, DBSession
+from app.core.responses import ModelResponse
+from app.models.tombstone import SyncResource
+from app.schemas.sync import ChangeWindow, TombstoneResponse
+from app.services.sync import SyncService
+
+router = APIRouter(tags=["sync"])
+
+
+@router.get("", response_model=list[TombstoneResponse])
+async def list_tombstones(
+    db: DBSession,
+    resource: SyncResource,
+    changes: Changes = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> Response:
+    """Deletions of ``resource``, oldest first; ``updated_since`` filters on ``deleted_at``."""
+    tombstones = await SyncService.list_tombstones(db, resource, changes, limit=limit)
+    headers = (changes or ChangeWindow()).page_headers(tombstones, timestamp="deleted_at")
+    return ModelResponse(list[TombstoneResponse], tombstones, headers=headers)
@@ -1,10 +1,31 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import health, orders, products, suppliers
+from app.api.v1.endpoints import (
+    analytics,
+    batch,
+    forecasts,
+    health,
+    orders,
+    products,
+    profiles,
+    reports,
+    supplier_products,
+    suppliers,
+    tombstones,
+)
 
 api_router = APIRouter()
 
 api_router.include_router(health.router)
 api_router.include_router(suppliers.router, prefix="/suppliers", tags=["suppliers"])
+api_router.include_router(
+    supplier_products.router, prefix="/supplier-products", tags=["suppliers"]
+)
 api_router.include_router(products.router, prefix="/products", tags=["products"])
 api_router.include_router(orders.router, prefix="/orders", tags=["orders"])
+api_router.include_router(batch.router, prefix="/batch", tags=["batch"])
+api_router.include_router(forecasts.router, prefix="/forecasts", tags=["forecasts"])
+api_router.include_router(tombstones.router, prefix="/tombstones", tags=["sync"])
+api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
+api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(profiles.router, prefix="/profiles", tags=["profiles"])
@@ -0,0 +1,53 @@
+"""Export order lines to a file, same dataset as ``GET /api/v1/orders/export``.
+
+    python -m app.cli.export_orders --from 2026-09-01 --to 2026-10-01 -o september.csv
+    python -m app.cli.export_orders --format parquet --status RECEIVED -o received.parquet
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import date
+
+from app.db.session import AsyncSessionLocal
+from app.models.buy_order import OrderStatus
+from app.schemas.export import ExportFormat
+from app.services.export import OrderExportService
+
+
+async def _export(args: argparse.Namespace) -> None:
+    fmt = ExportFormat(args.format)
+    OrderExportService.check_format(fmt)
+    out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")  # noqa: SIM115
+    try:
+        async with AsyncSessionLocal() as session:
+            async for chunk in OrderExportService.stream(
+                session,
+                fmt,
+                statuses=args.status,
+                created_from=args.created_from,
+                created_to=args.created_to,
+            ):
+                out.write(chunk)
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Export flattened order lines.")
+    parser.add_argument("--format", choices=[f.value for f in ExportFormat], default="csv")
+    parser.add_argument(
+        "--status",
+        action="append",
+        type=OrderStatus,
+        help="repeatable; defaults to CONFIRMED, SENT and RECEIVED",
+    )
+    parser.add_argument("--from", dest="created_from", type=date.fromisoformat)
+    parser.add_argument("--to", dest="created_to", type=date.fromisoformat, help="exclusive")
+    parser.add_argument("-o", "--output", default="-", help="file path, or - for stdout")
+    asyncio.run(_export(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
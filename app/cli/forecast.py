@@ -0,0 +1,34 @@
+"""Refit demand forecasts for every product from RECEIVED order lines.
+
+    python -m app.cli.forecast
+    python -m app.cli.forecast --as-of 2026-10-01
+"""
+
+import argparse
+import asyncio
+from datetime import date, datetime, timezone
+
+from app.db.session import AsyncSessionLocal
+from app.services.forecast import ForecastService
+
+
+async def _run(as_of: date) -> None:
+    async with AsyncSessionLocal() as session:
+        result = await ForecastService.run(session, as_of)
+        await session.commit()
+    print(f"Forecast {result.products} products as of {result.as_of.isoformat()}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Refit per-product demand forecasts.")
+    parser.add_argument(
+        "--as-of",
+        type=date.fromisoformat,
+        default=datetime.now(timezone.utc).date(),
+        help="history up to (excluding) this day; defaults to today (UTC)",
+    )
+    asyncio.run(_run(parser.parse_args(argv).as_of))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Recompute the spend rollups from every order (after a restore, or to audit drift).
+
+    python -m app.cli.rebuild_spend_rollups
+"""
+
+import asyncio
+
+from app.db.session import AsyncSessionLocal
+from app.services.report import ReportService
+
+
+async def _rebuild() -> None:
+    async with AsyncSessionLocal() as session:
+        buckets = await ReportService.rebuild_spend(session)
+        await session.commit()
+    print(f"Rebuilt {buckets} spend rollup buckets")
+
+
+def main() -> None:
+    asyncio.run(_rebuild())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Misses that waited on another caller's in-flight load instead of querying.
+    coalesced: int = 0
+    evictions: int = 0
+
+
+class _LoadAbandoned(Exception):
+    """Set on a shared load whose owner was cancelled; waiters retry instead."""
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache with a per-entry TTL and single-flight loading.
+
+    Concurrent misses for one key share a single loader call. If the caller running that
+    load is cancelled (say, its client disconnected), the callers waiting on it are not:
+    one of them takes the load over. ``None`` results are returned but not stored, so
+    lookups of rows that do not exist yet never go stale. ``ttl <= 0`` disables caching
+    (every call loads).
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._inflight: dict[K, asyncio.Future[V | None]] = {}
+        # Bumped by every invalidation; a load that started under an older epoch may
+        # have read pre-invalidation data, so its result is returned but not stored.
+        self._epoch = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        self._epoch += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._entries.clear()
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V | None]]) -> V | None:
+        if self.ttl <= 0:
+            return await loader()
+
+        value = self.get(key)
+        if value is not None:
+            self.stats.hits += 1
+            return value
+        self.stats.misses += 1
+
+        while (pending := self._inflight.get(key)) is not None:
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except _LoadAbandoned:
+                # Its result may have been stored by the next owner in the meantime.
+                value = self.get(key)
+                if value is not None:
+                    return value
+
+        future: asyncio.Future[V | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        epoch = self._epoch
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.set_exception(_LoadAbandoned())
+            future.exception()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Retrieve it so an unawaited future does not log "exception never retrieved".
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        if value is not None and epoch == self._epoch:
+            self.set(key, value)
+        future.set_result(value)
+        return value
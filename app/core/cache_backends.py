@@ -0,0 +1,249 @@
+"""Shared (cross-process) cache tier behind a small backend interface.
+
+``SHARED_CACHE_URL`` picks the backend: ``redis://…`` / ``rediss://…`` for deployments,
+``memory://`` for a single process (and tests). Backends store opaque bytes; the
+:class:`SharedCache` front adds namespacing, pydantic (de)serialization and versioning:
+
+* every key carries :data:`KEY_VERSION`, bumped when a cached schema changes shape so
+  pods on a new release never read payloads written by the old one;
+* every namespace has a generation counter, and every key a version counter, stored next
+  to the data. Values are written tagged with the generation and version read before
+  their loader ran, and a read fetches both counters in the same round trip, so
+  :meth:`SharedCache.invalidate_all` is a single ``INCR`` that orphans the whole
+  namespace and :meth:`SharedCache.invalidate` an ``INCR`` per key. A reader that loaded
+  the old row before an invalidation and writes it back afterwards tags it with the old
+  version, so it is never served. Version counters expire :data:`VERSION_TTL_FACTOR`
+  times the value TTL after their last bump, long after any value tagged before it.
+
+Backend failures are logged and treated as misses: the shared tier only ever saves work.
+"""
+
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Protocol, TypeVar
+
+from pydantic import BaseModel
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+KEY_VERSION = 2
+# Per-key version counters outlive the values they guard by this factor of the value TTL.
+VERSION_TTL_FACTOR = 2
+
+
+class CacheBackendError(Exception):
+    """The backend could not be reached or rejected a command."""
+
+
+class CacheBackend(Protocol):
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]: ...
+
+    async def set_many(self, items: Mapping[str, bytes], ttl: float) -> None: ...
+
+    async def delete_many(self, keys: Sequence[str]) -> None: ...
+
+    async def incr(self, key: str) -> int: ...
+
+    async def incr_many(self, keys: Sequence[str], ttl: float) -> None:
+        """Increment each key and (re)set its expiry to ``ttl`` seconds."""
+        ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryBackend:
+    """Process-local stand-in with the same semantics as the Redis backend."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._data: dict[str, tuple[float | None, bytes]] = {}
+
+    def _get(self, key: str) -> bytes | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[key]
+            return None
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        return [self._get(key) for key in keys]
+
+    async def set_many(self, items: Mapping[str, bytes], ttl: float) -> None:
+        expires_at = self._clock() + ttl
+        for key, value in items.items():
+            self._data[key] = (expires_at, value)
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        value = int(self._get(key) or 0) + 1
+        self._data[key] = (None, str(value).encode())
+        return value
+
+    async def incr_many(self, keys: Sequence[str], ttl: float) -> None:
+        expires_at = self._clock() + ttl
+        for key in keys:
+            value = int(self._get(key) or 0) + 1
+            self._data[key] = (expires_at, str(value).encode())
+
+    async def close(self) -> None:
+        self._data.clear()
+
+
+class RedisBackend:
+    """Any client speaking the ``redis.asyncio`` API (Redis, Valkey, KeyDB, fakeredis)."""
+
+    def __init__(self, client: Any) -> None:
+        import redis.exceptions
+
+        self._client = client
+        self._errors = (redis.exceptions.RedisError, OSError)
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        import redis.asyncio
+
+        return cls(redis.asyncio.from_url(url))
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        try:
+            return list(await self._client.mget(keys))
+        except self._errors as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    async def set_many(self, items: Mapping[str, bytes], ttl: float) -> None:
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, value, px=max(1, int(ttl * 1000)))
+                await pipe.execute()
+        except self._errors as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        try:
+            await self._client.delete(*keys)
+        except self._errors as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    async def incr(self, key: str) -> int:
+        try:
+            return int(await self._client.incr(key))
+        except self._errors as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    async def incr_many(self, keys: Sequence[str], ttl: float) -> None:
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.incr(key)
+                    pipe.pexpire(key, max(1, int(ttl * 1000)))
+                await pipe.execute()
+        except self._errors as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def backend_from_url(url: str) -> CacheBackend:
+    if url.startswith("memory://"):
+        return MemoryBackend()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackend.from_url(url)
+    raise ValueError(f"Unsupported SHARED_CACHE_URL scheme: {url!r}")
+
+
+@dataclass
+class SharedLookup:
+    """Hits by key, plus the generation and versions to tag values loaded for the misses."""
+
+    values: dict[str, Any] = field(default_factory=dict)
+    generation: int = 0
+    versions: dict[str, int] = field(default_factory=dict)
+
+    def tag(self, key: str) -> bytes:
+        return f"{self.generation}.{self.versions.get(key, 0)}".encode()
+
+
+class SharedCache:
+    def __init__(self, backend: CacheBackend, ttl: float, prefix: str = "soc") -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:v{KEY_VERSION}:{namespace}:{key}"
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"{self.prefix}:v{KEY_VERSION}:{namespace}:#generation"
+
+    def _version_key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:v{KEY_VERSION}:{namespace}:{key}#version"
+
+    async def get_many(
+        self, namespace: str, keys: Sequence[str], model: type[M]
+    ) -> SharedLookup:
+        names = [self._generation_key(namespace)]
+        for key in keys:
+            names += (self._key(namespace, key), self._version_key(namespace, key))
+        try:
+            raw = await self.backend.get_many(names)
+        except CacheBackendError as exc:
+            logger.warning("Shared cache read failed", namespace=namespace, error=str(exc))
+            # Generation -1 never matches, so nothing loaded now gets written back.
+            return SharedLookup(generation=-1)
+        lookup = SharedLookup(generation=int(raw[0] or 0))
+        for index, key in enumerate(keys):
+            payload, version = raw[1 + 2 * index], raw[2 + 2 * index]
+            lookup.versions[key] = int(version or 0)
+            if payload is None:
+                continue
+            tag, _, body = payload.partition(b":")
+            if tag == lookup.tag(key):
+                lookup.values[key] = model.model_validate_json(body)
+        return lookup
+
+    async def set_many(
+        self, namespace: str, values: Mapping[str, BaseModel], lookup: SharedLookup
+    ) -> None:
+        """Write values loaded after ``lookup``, tagged with what it read."""
+        if not values or lookup.generation < 0:
+            return
+        items = {
+            self._key(namespace, key): lookup.tag(key) + b":" + value.model_dump_json().encode()
+            for key, value in values.items()
+        }
+        try:
+            await self.backend.set_many(items, self.ttl)
+        except CacheBackendError as exc:
+            logger.warning("Shared cache write failed", namespace=namespace, error=str(exc))
+
+    async def invalidate(self, namespace: str, keys: Sequence[str]) -> None:
+        """Bump each key's version (orphaning in-flight write-backs) and drop its value."""
+        try:
+            await self.backend.incr_many(
+                [self._version_key(namespace, k) for k in keys], self.ttl * VERSION_TTL_FACTOR
+            )
+            await self.backend.delete_many([self._key(namespace, k) for k in keys])
+        except CacheBackendError as exc:
+            logger.warning("Shared cache delete failed", namespace=namespace, error=str(exc))
+
+    async def invalidate_all(self, namespace: str) -> None:
+        try:
+            await self.backend.incr(self._generation_key(namespace))
+        except CacheBackendError as exc:
+            logger.warning("Shared cache delete failed", namespace=namespace, error=str(exc))
+
+    async def close(self) -> None:
+        await self.backend.close()
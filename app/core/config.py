@@ -1,7 +1,7 @@
 from functools import lru_cache
 from typing import Literal
 
-from pydantic import AnyHttpUrl, PostgresDsn, field_validator
+from pydantic import AnyHttpUrl, Field, PostgresDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -30,6 +30,9 @@ class Settings(BaseSettings):
 
     # ── Database ─────────────────────────────────────────────────────────────
     DATABASE_URL: PostgresDsn  # must be set in .env
+    DB_POOL_SIZE: int = Field(default=10, ge=1)
+    DB_MAX_OVERFLOW: int = Field(default=20, ge=0)
+    DB_POOL_TIMEOUT: float = Field(default=30.0, gt=0)
 
     # Async DSN derived automatically (asyncpg driver)
     @field_validator("DATABASE_URL", mode="before")
@@ -39,10 +42,61 @@ class Settings(BaseSettings):
             return v.replace("postgresql://", "postgresql+asyncpg://", 1)
         return v
 
+    # ── Incremental sync ─────────────────────────────────────────────────────
+    # Sync pages only return rows stamped at least this long ago, so a transaction that
+    # commits late (its rows carry flush-time stamps) cannot be skipped by a cursor.
+    SYNC_SETTLE_SECONDS: float = Field(default=60.0, ge=0)
+
+    # ── Catalog cache ────────────────────────────────────────────────────────
+    # In-process cache for supplier / product / offer lookups on the order path.
+    CATALOG_CACHE_SIZE: int = Field(default=10_000, ge=1)  # entries per entity type
+    CATALOG_CACHE_TTL: float = Field(default=60.0, ge=0)  # seconds; 0 disables
+    # Evict entries on NOTIFY from the catalog table triggers (other workers' writes). Off by
+    # default: it holds one extra connection per worker and needs the trigger migration.
+    # Without it other workers' writes are seen within CATALOG_CACHE_TTL.
+    CATALOG_CACHE_LISTEN: bool = False
+
+    # ── Shared cache ─────────────────────────────────────────────────────────
+    # Cross-pod tier behind the catalog cache: redis://host:6379/0, or memory:// for a
+    # single process. Unset keeps caching per process.
+    SHARED_CACHE_URL: str | None = None
+    SHARED_CACHE_TTL: float = Field(default=300.0, gt=0)  # seconds
+
+    # ── Price matrix ─────────────────────────────────────────────────────────
+    # Memory-mapped offer terms shared by all workers on a host; unset disables.
+    # Cross-worker freshness relies on CATALOG_CACHE_LISTEN; enable it with more than one worker.
+    PRICE_MATRIX_PATH: str | None = None
+    PRICE_MATRIX_REFRESH_INTERVAL: float = Field(default=30.0, gt=0)  # seconds
+    PRICE_MATRIX_FULL_REBUILD_AFTER: float = Field(default=3600.0, gt=0)  # seconds
+
+    # ── Response cache ───────────────────────────────────────────────────────
+    # Rendered list responses, keyed by query and invalidated on committed writes.
+    RESPONSE_CACHE_SIZE: int = Field(default=1_000, ge=1)
+    RESPONSE_CACHE_TTL: float = Field(default=0.0, ge=0)  # seconds; 0 (default) disables
+
+    # ── Analytics ────────────────────────────────────────────────────────────
+    # Per-process cache of analytics results; cleared when an order changes status.
+    ANALYTICS_CACHE_SIZE: int = Field(default=256, ge=1)
+    ANALYTICS_CACHE_TTL: float = Field(default=300.0, ge=0)  # seconds; 0 disables
+
+    # ── Demand forecasting ───────────────────────────────────────────────────
+    # Fitted by `python -m app.cli.forecast` from RECEIVED order lines.
+    FORECAST_PERIOD_DAYS: int = Field(default=7, ge=1)
+    FORECAST_WINDOW: int = Field(default=8, ge=1)  # periods in the moving average
+    FORECAST_ALPHA: float = Field(default=0.3, gt=0, le=1)  # exponential smoothing factor
+    FORECAST_SEASON_LENGTH: int = Field(default=52, ge=0)  # periods per season; 0 disables
+
     # ── Logging ──────────────────────────────────────────────────────────────
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: Literal["json", "console"] = "console"
 
+    # ── Profiling ────────────────────────────────────────────────────────────
+    PROFILING_SECRET: str | None = None  # enables on-demand profiling when set
+    PROFILING_SAMPLE_RATE: float = Field(default=0.0, ge=0.0, le=1.0)
+    PROFILING_INTERVAL_MS: float = Field(default=5.0, gt=0)
+    PROFILING_DIR: str = "/tmp/supplier_order_core/profiles"
+    PROFILING_MAX_FILES: int = Field(default=500, ge=1)
+
     @property
     def is_production(self) -> bool:
         return self.ENVIRONMENT == "production"
@@ -0,0 +1,86 @@
+"""Per-product demand models over a regular series of period totals.
+
+:func:`period_series` buckets daily totals into periods of ``period_days`` ending at
+``as_of``; missing periods count as zero demand. :func:`fit_demand` fits three models on
+that series:
+
+* moving average of the last ``window`` periods;
+* simple exponential smoothing (factor ``alpha``) of the deseasonalized series;
+* multiplicative seasonality: with at least two full seasons of history, each phase of the
+  season gets an index (its mean over the overall mean), and the forecast for the next
+  period is the smoothed level times the next phase's index.
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True, slots=True)
+class DemandFit:
+    history_periods: int
+    moving_average: float
+    smoothed: float
+    seasonal_index: float | None
+    forecast: float
+
+
+def period_series(
+    daily: Iterable[tuple[date, float]], as_of: date, period_days: int
+) -> list[float]:
+    """Totals per period, oldest first, from the first period with demand up to ``as_of``.
+
+    Days on or after ``as_of`` are ignored.
+    """
+    totals: dict[int, float] = {}
+    for day, quantity in daily:
+        age = (as_of - day).days
+        if age <= 0:
+            continue
+        back = (age - 1) // period_days  # 0 = the period ending at as_of
+        totals[back] = totals.get(back, 0.0) + quantity
+    if not totals:
+        return []
+    return [totals.get(back, 0.0) for back in range(max(totals), -1, -1)]
+
+
+def _seasonal_indices(series: Sequence[float], season_length: int) -> list[float] | None:
+    if season_length < 2 or len(series) < 2 * season_length:
+        return None
+    mean = sum(series) / len(series)
+    if mean <= 0:
+        return None
+    # Align phases on the most recent period so every phase has whole seasons behind it.
+    offset = len(series) % season_length
+    indices = []
+    for phase in range(season_length):
+        values = series[offset + phase :: season_length]
+        indices.append(sum(values) / len(values) / mean)
+    return indices
+
+
+def fit_demand(
+    series: Sequence[float], window: int, alpha: float, season_length: int
+) -> DemandFit:
+    """Fit the demand models on a non-empty series of period totals (oldest first)."""
+    recent = series[-window:]
+    moving_average = sum(recent) / len(recent)
+
+    indices = _seasonal_indices(series, season_length)
+    offset = len(series) % season_length if indices is not None else 0
+    level: float | None = None
+    for position, value in enumerate(series):
+        if indices is not None:
+            index = indices[(position - offset) % season_length]
+            if index == 0:
+                continue  # a phase that never sees demand says nothing about the level
+            value /= index
+        level = value if level is None else alpha * value + (1 - alpha) * level
+    smoothed = level or 0.0
+
+    seasonal_index = None
+    forecast = smoothed
+    if indices is not None:
+        seasonal_index = indices[(len(series) - offset) % season_length]
+        forecast = smoothed * seasonal_index
+    return DemandFit(len(series), moving_average, smoothed, seasonal_index, forecast)
@@ -0,0 +1,221 @@
+"""Memory-mapped, read-only snapshot of offer terms shared by every worker on a host.
+
+File layout: a fixed header, then one fixed-size record per ``(supplier_id, product_id)``
+sorted by the 32 raw UUID bytes, so lookups are a binary search over the mapping and the
+pages live once in the OS page cache however many workers map them. Snapshots are never
+modified in place: :func:`write_matrix` writes a sibling temp file and ``os.replace``-s
+it, and readers remap when the inode changes.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+
+MAGIC = b"SOCPM\x00\x00\x01"
+# magic, record count, offers / tombstones watermarks (µs), build start and last full
+# build start (wall-clock seconds)
+_HEADER = struct.Struct("<8sQqqdd")
+# supplier_id, product_id, unit_price × PRICE_SCALE (NULL_PRICE if unset), min, optimal
+_RECORD = struct.Struct("<16s16sqdd")
+_KEY_SIZE = 32
+
+PRICE_EXPONENT = 4  # matches Numeric(12, 4)
+PRICE_SCALE = 10**PRICE_EXPONENT
+NULL_PRICE = -(2**63)
+
+
+@dataclass(frozen=True)
+class MatrixHeader:
+    count: int
+    offers_watermark: int
+    tombstones_watermark: int
+    started_at: float
+    full_started_at: float
+
+
+@dataclass(frozen=True)
+class OfferRecord:
+    key: bytes  # supplier_id.bytes + product_id.bytes
+    unit_price: Decimal | None
+    minimum_quantity: float
+    optimal_quantity: float
+
+    @classmethod
+    def build(
+        cls,
+        supplier_id: uuid.UUID,
+        product_id: uuid.UUID,
+        unit_price: Decimal | None,
+        minimum_quantity: float,
+        optimal_quantity: float,
+    ) -> "OfferRecord":
+        return cls(
+            supplier_id.bytes + product_id.bytes, unit_price, minimum_quantity, optimal_quantity
+        )
+
+    def pack(self) -> bytes:
+        price = NULL_PRICE if self.unit_price is None else int(self.unit_price * PRICE_SCALE)
+        return _RECORD.pack(
+            self.key[:16], self.key[16:], price, self.minimum_quantity, self.optimal_quantity
+        )
+
+    @classmethod
+    def unpack(cls, raw: bytes | memoryview) -> "OfferRecord":
+        supplier, product, price, minimum, optimal = _RECORD.unpack(raw)
+        unit_price = None if price == NULL_PRICE else Decimal(price).scaleb(-PRICE_EXPONENT)
+        return cls(supplier + product, unit_price, minimum, optimal)
+
+
+def offer_key(supplier_id: uuid.UUID, product_id: uuid.UUID) -> bytes:
+    return supplier_id.bytes + product_id.bytes
+
+
+class PriceMatrix:
+    """A mapped snapshot. Lookups are synchronous and allocation-light."""
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as f:
+            self.inode = os.fstat(f.fileno()).st_ino
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, *rest = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or len(self._map) != _HEADER.size + count * _RECORD.size:
+            self._map.close()
+            raise ValueError(f"{path} is not a price matrix snapshot")
+        self.header = MatrixHeader(count, *rest)
+
+    def __len__(self) -> int:
+        return self.header.count
+
+    def close(self) -> None:
+        self._map.close()
+
+    def _offset(self, index: int) -> int:
+        return _HEADER.size + index * _RECORD.size
+
+    def get(self, key: bytes) -> OfferRecord | None:
+        lo, hi = 0, self.header.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = self._offset(mid)
+            probe = self._map[offset : offset + _KEY_SIZE]
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return OfferRecord.unpack(self._map[offset : offset + _RECORD.size])
+        return None
+
+    def records(self) -> Iterator[OfferRecord]:
+        view = memoryview(self._map)[_HEADER.size :]
+        try:
+            for index in range(self.header.count):
+                start = index * _RECORD.size
+                yield OfferRecord.unpack(view[start : start + _RECORD.size])
+        finally:
+            view.release()
+
+
+def merge_records(
+    base: Iterable[OfferRecord],
+    upserts: Iterable[OfferRecord],
+    deletes: Iterable[bytes] = (),
+) -> Iterator[OfferRecord]:
+    """Sorted ``base`` with ``upserts`` applied and ``deletes`` removed, still sorted.
+
+    Streams ``base`` (an existing snapshot), so memory stays proportional to the change set.
+    """
+    changes: dict[bytes, OfferRecord | None] = dict.fromkeys(deletes)
+    for record in upserts:
+        changes[record.key] = record
+    pending = sorted(changes.items())
+    i = 0
+    for record in base:
+        while i < len(pending) and pending[i][0] < record.key:
+            if pending[i][1] is not None:
+                yield pending[i][1]  # type: ignore[misc]
+            i += 1
+        if i < len(pending) and pending[i][0] == record.key:
+            if pending[i][1] is not None:
+                yield pending[i][1]  # type: ignore[misc]
+            i += 1
+            continue
+        yield record
+    for _, record in pending[i:]:
+        if record is not None:
+            yield record
+
+
+class MatrixWriter:
+    """Writes a snapshot next to ``path``; :meth:`commit` swaps it in atomically.
+
+    Records must arrive sorted by key (e.g. ``ORDER BY supplier_id, product_id``: UUIDs
+    sort by their bytes in both Postgres and the hex form SQLite stores).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        self._file = os.fdopen(fd, "wb")
+        self._file.write(b"\0" * _HEADER.size)
+        self._previous = b""
+        self.count = 0
+
+    def write(self, record: OfferRecord) -> None:
+        if record.key <= self._previous:
+            raise ValueError("price matrix records must be sorted and unique")
+        self._file.write(record.pack())
+        self._previous = record.key
+        self.count += 1
+
+    def commit(
+        self,
+        offers_watermark: int,
+        tombstones_watermark: int,
+        started_at: float,
+        full_started_at: float,
+    ) -> None:
+        self._file.seek(0)
+        self._file.write(
+            _HEADER.pack(
+                MAGIC,
+                self.count,
+                offers_watermark,
+                tombstones_watermark,
+                started_at,
+                full_started_at,
+            )
+        )
+        self._file.close()
+        os.replace(self._tmp, self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        os.unlink(self._tmp)
+
+
+def write_matrix(
+    path: Path,
+    records: Iterable[OfferRecord],
+    offers_watermark: int,
+    tombstones_watermark: int,
+    started_at: float,
+    full_started_at: float,
+) -> int:
+    """Atomically replace the snapshot at ``path``; ``records`` must be sorted by key."""
+    writer = MatrixWriter(path)
+    try:
+        for record in records:
+            writer.write(record)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.commit(offers_watermark, tombstones_watermark, started_at, full_started_at)
+    return writer.count
@@ -0,0 +1,161 @@
+import asyncio
+import hmac
+import random
+import re
+import sys
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+PROFILE_HEADER = "X-Profile-Token"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_SUFFIX = ".collapsed"
+
+_PROFILE_NAME_RE = re.compile(r"^[A-Za-z0-9_.-]+\.collapsed$")
+
+
+def is_valid_token(token: str | None) -> bool:
+    if not settings.PROFILING_SECRET or not token:
+        return False
+    return hmac.compare_digest(token.encode(), settings.PROFILING_SECRET.encode())
+
+
+class StackSampler:
+    """Samples the call stack of one thread at a fixed interval.
+
+    Stacks are aggregated in collapsed format (``frame;frame;frame count``), which
+    flamegraph.pl, speedscope and most flamegraph viewers read directly. Requests run
+    on the event loop thread, so samples include any other coroutine interleaved with
+    the profiled one — profile under representative load rather than in isolation.
+    """
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self.samples: Counter[str] = Counter()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self.samples[_collapse(frame)] += 1
+
+    def render(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+def _collapse(frame: FrameType | None) -> str:
+    names: list[str] = []
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "?")
+        names.append(f"{module}:{frame.f_code.co_qualname}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+# ── Storage ───────────────────────────────────────────────────────────────────
+
+
+def _profile_dir() -> Path:
+    return Path(settings.PROFILING_DIR)
+
+
+def _new_profile_name(method: str, path: str) -> str:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", path).strip("-")[:80] or "root"
+    return f"{stamp}_{method}_{slug}_{uuid.uuid4().hex[:8]}{PROFILE_SUFFIX}"
+
+
+def _write_profile(name: str, content: str) -> None:
+    directory = _profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / name).write_text(content)
+
+    existing = sorted(directory.glob(f"*{PROFILE_SUFFIX}"))
+    for stale in existing[: max(0, len(existing) - settings.PROFILING_MAX_FILES)]:
+        stale.unlink(missing_ok=True)
+
+
+def list_profiles() -> list[Path]:
+    directory = _profile_dir()
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob(f"*{PROFILE_SUFFIX}"), reverse=True)
+
+
+def get_profile_path(name: str) -> Path | None:
+    if not _PROFILE_NAME_RE.match(name):
+        return None
+    path = _profile_dir() / name
+    return path if path.is_file() else None
+
+
+# ── Middleware ────────────────────────────────────────────────────────────────
+
+
+class ProfilingMiddleware:
+    """Runs selected requests under a :class:`StackSampler`.
+
+    A request is profiled when it carries the profiling secret in the ``X-Profile-Token``
+    header (never the query string, which ends up in access logs) or when it falls into
+    the continuous ``PROFILING_SAMPLE_RATE`` sample.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if scope["path"].startswith(f"{settings.API_V1_PREFIX}/profiles"):
+            return False
+        if settings.PROFILING_SECRET:
+            headers = dict(scope.get("headers") or [])
+            token = headers.get(PROFILE_HEADER.lower().encode())
+            if token is not None and is_valid_token(token.decode("latin-1")):
+                return True
+        rate = settings.PROFILING_SAMPLE_RATE
+        return rate > 0 and random.random() < rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        name = _new_profile_name(scope["method"], scope["path"])
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((PROFILE_ID_HEADER.lower().encode(), name.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler = StackSampler(threading.get_ident(), settings.PROFILING_INTERVAL_MS / 1000)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            # Joining the sampler thread can take up to one interval: not on the loop.
+            await asyncio.to_thread(sampler.stop)
+            try:
+                await asyncio.to_thread(_write_profile, name, sampler.render())
+            except OSError as exc:
+                logger.warning("Failed to store profile", profile=name, error=str(exc))
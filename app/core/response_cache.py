@@ -0,0 +1,81 @@
+"""Optional per-process cache of rendered list responses.
+
+Entries are keyed by request path and query plus the write generation of every table
+the response reads. A committed ORM write to one of those tables bumps its generation,
+which makes older entries unreachable (they age out by LRU/TTL). Writes from other
+workers are picked up from catalog NOTIFY payloads where available and otherwise after
+at most ``RESPONSE_CACHE_TTL`` seconds.
+"""
+
+from collections import Counter
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Sequence
+from typing import Any
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from pydantic_core import to_json
+from sqlalchemy import event
+from sqlalchemy.orm import Session, UOWTransaction
+
+from app.core.cache import CacheStats, TTLCache
+from app.core.config import settings
+
+_TOUCHED = "response_cache_touched"
+
+
+def request_key(request: Request) -> str:
+    """Path plus query with parameters sorted, so ``?a=1&b=2`` and ``?b=2&a=1`` share."""
+    return f"{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+
+
+class ResponseCache:
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._entries: TTLCache[tuple[Hashable, ...], bytes] = TTLCache(maxsize, ttl)
+        self._generations: Counter[str] = Counter()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._entries.stats
+
+    def bump(self, tables: Iterable[str]) -> None:
+        for table in tables:
+            self._generations[table] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def json(
+        self, request: Request, tables: Sequence[str], load: Callable[[], Awaitable[Any]]
+    ) -> Response:
+        """``load()`` rendered as JSON, served from cache while ``tables`` are unchanged."""
+
+        async def render() -> bytes:
+            return to_json(await load())
+
+        key = (request_key(request), *(self._generations[table] for table in tables))
+        body = await self._entries.get_or_load(key, render)
+        return Response(body, media_type="application/json")
+
+    def touch(self, session: Session, tables: Iterable[str]) -> None:
+        """Bump ``tables`` when ``session`` commits; for bulk writes that skip the flush."""
+        touched: set[str] = session.info.setdefault(_TOUCHED, set())
+        touched.update(tables)
+
+    def _after_flush(self, session: Session, _flush_context: UOWTransaction) -> None:
+        self.touch(
+            session,
+            (obj.__table__.name for obj in (*session.new, *session.dirty, *session.deleted)),
+        )
+
+    def _after_commit(self, session: Session) -> None:
+        self.bump(session.info.pop(_TOUCHED, ()))
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(_TOUCHED, None)
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL)
+
+event.listen(Session, "after_flush", response_cache._after_flush)
+event.listen(Session, "after_commit", response_cache._after_commit)
+event.listen(Session, "after_rollback", response_cache._after_rollback)
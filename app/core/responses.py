@@ -0,0 +1,128 @@
+import hashlib
+from collections.abc import AsyncIterable, Sequence
+from functools import cache
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency (pip install .[perf])
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class: orjson when installed, stdlib ``json`` otherwise.
+
+    Both produce compact UTF-8 output that decodes to the same values. Bodies are
+    byte-identical except for floats written in exponent notation, which each encoder
+    spells its own way (``1e+16`` vs ``1e16``).
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
+
+
+@cache
+def _adapter(schema: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(schema)
+
+
+def dump_model(schema: Any, content: Any) -> Any:
+    """Validate ORM objects into ``schema`` and return JSON-compatible Python data."""
+    adapter = _adapter(schema)
+    return adapter.dump_python(adapter.validate_python(content, from_attributes=True), mode="json")
+
+
+class ModelResponse(Response):
+    """Validates ORM objects into ``schema`` once and serializes them in pydantic-core.
+
+    Returning this from an endpoint skips FastAPI's ``response_model`` round trip
+    (validate → Python dict → ``json.dumps``); the endpoint keeps ``response_model``
+    for the OpenAPI schema. Output decodes to the same values as the default path; only
+    floats in exponent notation are spelled differently (pydantic writes ``1e-7`` where
+    ``json.dumps`` writes ``1e-07``).
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        schema: Any,
+        content: Any,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        adapter = _adapter(schema)
+        body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+        super().__init__(body, status_code=status_code, headers=headers)
+
+
+class RawJSONResponse(Response):
+    """Serializes already-shaped plain data (dicts, lists, rows) with pydantic-core.
+
+    Decimals, UUIDs and datetimes render exactly as they do through the schemas.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# ``responses=`` entry documenting the NDJSON alternative on list endpoints.
+NDJSON_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}}}
+}
+
+
+def wants_ndjson(accept: str | None) -> bool:
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+class NDJSONResponse(StreamingResponse):
+    """Streams batches of plain rows as newline-delimited JSON, one chunk per batch."""
+
+    def __init__(
+        self,
+        batches: AsyncIterable[Sequence[Any]],
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(
+            _encode_lines(batches),
+            status_code=status_code,
+            headers=headers,
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+
+async def _encode_lines(batches: AsyncIterable[Sequence[Any]]) -> AsyncIterable[bytes]:
+    async for batch in batches:
+        if batch:
+            yield b"".join(to_json(row) + b"\n" for row in batch)
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over version ``parts`` (timestamps, row counts, representation)."""
+    return f'"{hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    # If-None-Match uses the weak comparison (RFC 9110 §13.1.2): W/ prefixes are ignored.
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class NotModifiedResponse(Response):
+    def __init__(self, etag: str) -> None:
+        super().__init__(status_code=304, headers={"ETag": etag})
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DDL, DateTime, event, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -10,6 +10,15 @@ class Base(DeclarativeBase):
     """Shared declarative base for all ORM models."""
 
 
+# The trigram GIN indexes need pg_trgm. Migrations create it; this covers create_all
+# (benchmark seeds and resets) on a fresh database.
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 class TimestampMixin:
     """Adds created_at / updated_at to any model."""
 
@@ -0,0 +1,59 @@
+import os
+import threading
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PoolWaitSnapshot:
+    pid: int
+    acquisitions: int
+    timeouts: int
+    wait_total_ms: float
+    wait_max_ms: float
+    wait_peak_ms: float
+
+
+class PoolWaitStats:
+    """Cumulative time requests spend waiting for a pooled DB connection.
+
+    Counters only ever grow, so callers (e.g. load tests) compute per-interval rates
+    from the difference between two snapshots. A maximum cannot be diffed that way, so
+    besides the all-time ``wait_max`` there is a ``wait_peak`` that a snapshot can reset:
+    the longest wait since the previous resetting snapshot.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._acquisitions = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_peak = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._acquisitions += 1
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+            self._wait_peak = max(self._wait_peak, seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self, reset_peak: bool = False) -> PoolWaitSnapshot:
+        with self._lock:
+            peak = self._wait_peak
+            if reset_peak:
+                self._wait_peak = 0.0
+            return PoolWaitSnapshot(
+                pid=os.getpid(),
+                acquisitions=self._acquisitions,
+                timeouts=self._timeouts,
+                wait_total_ms=round(self._wait_total * 1000, 3),
+                wait_max_ms=round(self._wait_max * 1000, 3),
+                wait_peak_ms=round(peak * 1000, 3),
+            )
+
+
+pool_wait_stats = PoolWaitStats()
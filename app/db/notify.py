@@ -0,0 +1,94 @@
+"""Background ``LISTEN`` on a Postgres channel over a dedicated connection.
+
+The connection is opened with asyncpg directly rather than checked out of the engine
+pool, so a long-lived listener never takes a slot away from requests. It reconnects
+after connection loss; ``on_connect`` runs after every (re)connect, since anything sent
+while the listener was down is lost.
+"""
+
+import asyncio
+from collections.abc import Callable
+from contextlib import suppress
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    """``postgresql+asyncpg://…`` → the plain ``postgresql://…`` DSN asyncpg accepts."""
+    return make_url(database_url).set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+
+
+class PgListener:
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        handler: Callable[[str], None],
+        on_connect: Callable[[], None] | None = None,
+        retry_interval: float = 5.0,
+    ) -> None:
+        self.dsn = dsn
+        self.channel = channel
+        self._handler = handler
+        self._on_connect = on_connect
+        self._retry_interval = retry_interval
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"listen:{self.channel}")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def dispatch(self, payload: str) -> None:
+        """Pass ``payload`` to the handler; one it rejects is logged and dropped."""
+        try:
+            self._handler(payload)
+        except Exception as exc:
+            logger.warning(
+                "Ignoring malformed notification",
+                channel=self.channel,
+                payload=payload,
+                error=str(exc),
+            )
+
+    def _on_notification(self, _conn: object, _pid: int, _channel: str, payload: str) -> None:
+        self.dispatch(payload)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                conn = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as exc:
+                logger.warning("LISTEN connection failed", channel=self.channel, error=str(exc))
+                await asyncio.sleep(self._retry_interval)
+                continue
+
+            lost = asyncio.Event()
+            conn.add_termination_listener(lambda _conn, lost=lost: lost.set())
+            try:
+                await conn.add_listener(self.channel, self._on_notification)
+                if self._on_connect is not None:
+                    self._on_connect()
+                logger.info("Listening", channel=self.channel)
+                await lost.wait()
+                logger.warning("LISTEN connection lost", channel=self.channel)
+            except (OSError, asyncpg.PostgresError) as exc:
+                logger.warning("LISTEN failed", channel=self.channel, error=str(exc))
+            finally:
+                if not conn.is_closed():
+                    conn.terminate()
+            await asyncio.sleep(self._retry_interval)
@@ -1,18 +1,44 @@
+import time
 from collections.abc import AsyncGenerator
 
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.db.metrics import pool_wait_stats
+from app.repositories.cache import catalog_cache
 
 logger = get_logger(__name__)
 
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Records in ``pool_wait_stats`` how long each checkout waited for a connection.
+
+    Timed at the pool, so a request only checks a connection out (and is only counted)
+    once it first talks to the database.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except PoolTimeoutError:
+            pool_wait_stats.record_timeout()
+            raise
+        pool_wait_stats.record(time.perf_counter() - started)
+        return entry
+
+
 engine = create_async_engine(
     str(settings.DATABASE_URL),
     echo=settings.DEBUG,
+    poolclass=TimedQueuePool,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -27,6 +53,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
+            await catalog_cache.invalidate_shared(session)
             await session.commit()
         except Exception:
             await session.rollback()
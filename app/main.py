@@ -1,4 +1,5 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from collections.abc import AsyncGenerator
 
 from fastapi import FastAPI, Request, status
@@ -9,10 +10,34 @@ from app.api.v1.router import api_router
 from app.core.config import settings
 from app.core.exceptions import AppException
 from app.core.logging import get_logger, setup_logging
+from app.core.profiling import ProfilingMiddleware
+from app.core.response_cache import response_cache
+from app.core.responses import FastJSONResponse
+from app.db.notify import PgListener, asyncpg_dsn
+from app.db.session import AsyncSessionLocal
+from app.repositories.cache import NOTIFY_CHANNEL, CacheKind, catalog_cache
+from app.repositories.price_matrix import price_matrix
+from app.services.analytics import SPEND_CHANGED_PAYLOAD, abc_cache
 
 logger = get_logger(__name__)
 
 
+def handle_catalog_notification(payload: str) -> None:
+    """Route a payload heard on the catalog cache channel to the caches it concerns."""
+    if payload == SPEND_CHANGED_PAYLOAD:
+        abc_cache.clear()
+        return
+    catalog_cache.handle_notification(payload)
+    response_cache.bump([CacheKind(payload.partition(":")[0]).table])
+
+
+def _on_listener_connect() -> None:
+    # Notifications sent while disconnected are lost.
+    catalog_cache.clear()
+    response_cache.clear()
+    abc_cache.clear()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     setup_logging()
@@ -22,7 +47,32 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         version=settings.APP_VERSION,
         environment=settings.ENVIRONMENT,
     )
+    listener: PgListener | None = None
+    if settings.CATALOG_CACHE_LISTEN and (
+        settings.CATALOG_CACHE_TTL > 0
+        or settings.RESPONSE_CACHE_TTL > 0
+        or settings.ANALYTICS_CACHE_TTL > 0
+        or price_matrix.enabled
+    ):
+        listener = PgListener(
+            asyncpg_dsn(str(settings.DATABASE_URL)),
+            NOTIFY_CHANNEL,
+            handle_catalog_notification,
+            on_connect=_on_listener_connect,
+        )
+        listener.start()
+    refresher: asyncio.Task[None] | None = None
+    if price_matrix.enabled:
+        refresher = asyncio.create_task(price_matrix.run(AsyncSessionLocal))
     yield
+    if refresher is not None:
+        refresher.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresher
+        price_matrix.close()
+    if listener is not None:
+        await listener.stop()
+    await catalog_cache.close()
     logger.info("Shutting down")
 
 
@@ -32,6 +82,7 @@ def create_app() -> FastAPI:
         version=settings.APP_VERSION,
         docs_url="/docs" if not settings.is_production else None,
         redoc_url="/redoc" if not settings.is_production else None,
+        default_response_class=FastJSONResponse,
         lifespan=lifespan,
     )
 
@@ -43,6 +94,7 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(ProfilingMiddleware)
 
     # ── Exception handlers ────────────────────────────────────────────────────
     @app.exception_handler(AppException)
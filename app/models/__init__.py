@@ -1,6 +1,9 @@
 # Import all models here so Alembic can detect them for autogenerate.
 from app.models.buy_order import BuyOrder  # noqa: F401
 from app.models.buy_order_item import BuyOrderItem  # noqa: F401
+from app.models.forecast import ProductForecast  # noqa: F401
 from app.models.product import Product  # noqa: F401
+from app.models.spend_rollup import SpendRollup  # noqa: F401
 from app.models.supplier import Supplier  # noqa: F401
 from app.models.supplier_product import SupplierProduct  # noqa: F401
+from app.models.tombstone import Tombstone  # noqa: F401
@@ -3,7 +3,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Numeric, String
+from sqlalchemy import ForeignKey, Index, Numeric, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -31,9 +31,27 @@ ALLOWED_TRANSITIONS: dict[OrderStatus, set[OrderStatus]] = {
     OrderStatus.CANCELLED: set(),
 }
 
+# Orders not yet received or cancelled: their quantities are still on the way.
+OPEN_STATUSES = (OrderStatus.DRAFT, OrderStatus.CONFIRMED, OrderStatus.SENT)
+
 
 class BuyOrder(BaseModel):
     __tablename__ = "buy_orders"
+    __table_args__ = (
+        Index("ix_buy_orders_updated_at_id", "updated_at", "id"),
+        # Per-supplier order lookups and aggregates (supplier stats, filtered lists).
+        Index("ix_buy_orders_supplier_id_status", "supplier_id", "status"),
+        # Range filters and keyset sorting in order search.
+        Index("ix_buy_orders_created_at_id", "created_at", "id"),
+        Index("ix_buy_orders_total_id", "total", "id"),
+        # Substring search on notes (needs pg_trgm; see app.db.base for create_all).
+        Index(
+            "ix_buy_orders_notes_trgm",
+            "notes",
+            postgresql_using="gin",
+            postgresql_ops={"notes": "gin_trgm_ops"},
+        ),
+    )
 
     supplier_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
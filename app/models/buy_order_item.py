@@ -2,7 +2,7 @@ import uuid
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Numeric, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Numeric, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,6 +17,8 @@ class BuyOrderItem(BaseModel):
     __tablename__ = "buy_order_items"
     __table_args__ = (
         UniqueConstraint("order_id", "product_id", name="uq_buy_order_items_order_product"),
+        # "Orders containing product X" (EXISTS probes in order search, reorder on-order).
+        Index("ix_buy_order_items_product_id", "product_id", "order_id"),
     )
 
     order_id: Mapped[uuid.UUID] = mapped_column(
@@ -0,0 +1,32 @@
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ProductForecast(Base):
+    """Latest demand forecast per product, replaced wholesale by each forecast run."""
+
+    __tablename__ = "product_forecasts"
+
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # History runs up to (excluding) as_of, in periods of period_days.
+    as_of: Mapped[date] = mapped_column(Date, nullable=False)
+    period_days: Mapped[int] = mapped_column(nullable=False)
+    history_periods: Mapped[int] = mapped_column(nullable=False)
+    moving_average: Mapped[float] = mapped_column(nullable=False)
+    smoothed: Mapped[float] = mapped_column(nullable=False)
+    # Demand in the next period relative to the average period; NULL without enough history.
+    seasonal_index: Mapped[float | None] = mapped_column(nullable=True)
+    forecast: Mapped[float] = mapped_column(nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, UniqueConstraint
+from sqlalchemy import Index, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import BaseModel
@@ -11,7 +11,23 @@ if TYPE_CHECKING:
 
 class Product(BaseModel):
     __tablename__ = "products"
-    __table_args__ = (UniqueConstraint("sku", name="uq_products_sku"),)
+    __table_args__ = (
+        UniqueConstraint("sku", name="uq_products_sku"),
+        Index("ix_products_updated_at_id", "updated_at", "id"),
+        # Substring and fuzzy product search (need pg_trgm; see app.db.base for create_all).
+        Index(
+            "ix_products_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_products_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     sku: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -24,3 +40,16 @@ class Product(BaseModel):
         back_populates="product",
         cascade="all, delete-orphan",
     )
+
+
+# Case-insensitive prefix (typeahead) search; expression indexes need the mapped columns.
+Index(
+    "ix_products_sku_prefix",
+    func.lower(Product.sku).label("sku_lower"),
+    postgresql_ops={"sku_lower": "text_pattern_ops"},
+)
+Index(
+    "ix_products_name_prefix",
+    func.lower(Product.name).label("name_lower"),
+    postgresql_ops={"name_lower": "text_pattern_ops"},
+)
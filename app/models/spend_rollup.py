@@ -0,0 +1,33 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, ForeignKey, Numeric, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SpendRollup(Base):
+    """Order count, line count and spend per supplier, month and status.
+
+    Kept current by the order service on every write that moves an order's status, total
+    or lines; ``python -m app.cli.rebuild_spend_rollups`` recomputes it from scratch.
+    """
+
+    __tablename__ = "spend_rollups"
+
+    supplier_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("suppliers.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # First day of the month (UTC) the order was created in.
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    order_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    line_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    total: Mapped[Decimal] = mapped_column(
+        Numeric(precision=14, scale=4), nullable=False, default=Decimal("0")
+    )
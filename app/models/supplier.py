@@ -1,7 +1,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, UniqueConstraint
+from sqlalchemy import Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import BaseModel
@@ -12,7 +12,10 @@ if TYPE_CHECKING:
 
 class Supplier(BaseModel):
     __tablename__ = "suppliers"
-    __table_args__ = (UniqueConstraint("name", name="uq_suppliers_name"),)
+    __table_args__ = (
+        UniqueConstraint("name", name="uq_suppliers_name"),
+        Index("ix_suppliers_updated_at_id", "updated_at", "id"),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -2,7 +2,7 @@ import uuid
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Numeric, PrimaryKeyConstraint
+from sqlalchemy import ForeignKey, Index, Numeric, PrimaryKeyConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,6 +17,18 @@ class SupplierProduct(TimestampMixin, Base):
     __tablename__ = "supplier_products"
     __table_args__ = (
         PrimaryKeyConstraint("supplier_id", "product_id", name="pk_supplier_products"),
+        Index(
+            "ix_supplier_products_updated_at_keys", "updated_at", "supplier_id", "product_id"
+        ),
+        # Reverse lookup, already in rank order: offers for a product, cheapest first, ties
+        # broken by minimum quantity and supplier (see list_ranked_offers).
+        Index(
+            "ix_supplier_products_offer_rank",
+            "product_id",
+            "unit_price",
+            "minimum_quantity",
+            "supplier_id",
+        ),
     )
 
     supplier_id: Mapped[uuid.UUID] = mapped_column(
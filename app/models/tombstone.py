@@ -0,0 +1,31 @@
+import uuid
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import DateTime, Index, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SyncResource(str, Enum):
+    SUPPLIERS = "suppliers"
+    PRODUCTS = "products"
+    SUPPLIER_PRODUCTS = "supplier_products"
+    ORDERS = "orders"
+
+
+class Tombstone(Base):
+    """Deletion record for incremental sync; one row per deleted resource instance."""
+
+    __tablename__ = "tombstones"
+    __table_args__ = (Index("ix_tombstones_resource_deleted_at_id", "resource", "deleted_at", "id"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    resource: Mapped[SyncResource] = mapped_column(String(40), nullable=False)
+    # The deleted row's id; "<supplier_id>/<product_id>" for supplier_products.
+    record_id: Mapped[str] = mapped_column(String(80), nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
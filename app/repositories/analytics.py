@@ -0,0 +1,45 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.buy_order import BuyOrder, OrderStatus
+from app.models.buy_order_item import BuyOrderItem
+from app.models.product import Product
+from app.models.supplier import Supplier
+from app.schemas.analytics import SpendDimension
+
+# Spend is what was committed to a supplier: confirmed orders onwards, unless cancelled.
+COMMITTED_STATUSES = (OrderStatus.CONFIRMED, OrderStatus.SENT, OrderStatus.RECEIVED)
+
+
+class AnalyticsRepository:
+    @staticmethod
+    async def spend_by(
+        session: AsyncSession,
+        dimension: SpendDimension,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> Sequence[Row[Any]]:
+        """``(id, name, spend)`` per product or supplier, one GROUP BY over order lines."""
+        if dimension is SpendDimension.PRODUCTS:
+            key, name, entity = BuyOrderItem.product_id, Product.name, Product
+            on = Product.id == BuyOrderItem.product_id
+        else:
+            key, name, entity = BuyOrder.supplier_id, Supplier.name, Supplier
+            on = Supplier.id == BuyOrder.supplier_id
+        stmt = (
+            select(key.label("id"), name.label("name"), func.sum(BuyOrderItem.subtotal))
+            .join(BuyOrder, BuyOrder.id == BuyOrderItem.order_id)
+            .join(entity, on)
+            .where(BuyOrder.status.in_(COMMITTED_STATUSES))
+            .group_by(key, name)
+        )
+        if created_from is not None:
+            stmt = stmt.where(BuyOrder.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(BuyOrder.created_at < created_to)
+        result = await session.execute(stmt)
+        return result.all()
@@ -1,28 +1,79 @@
 import uuid
+from collections.abc import AsyncIterator, Collection
 from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Row, Select, exists, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.buy_order import BuyOrder, OrderStatus
 from app.models.buy_order_item import BuyOrderItem
+from app.models.product import Product
 from app.models.supplier import Supplier
-from app.schemas.buy_order import BuyOrderCreate, BuyOrderUpdate
+from app.models.tombstone import SyncResource
+from app.repositories.options import selectin_paths
+from app.repositories.projection import Projection
+from app.repositories.search import LIKE_ESCAPE, escape_like
+from app.repositories.sync import apply_change_window
+from app.repositories.tombstone import TombstoneRepository
+from app.schemas.buy_order import BuyOrderCreate, BuyOrderResponse, BuyOrderUpdate
+from app.schemas.order_search import OrderSearch, OrderSearchCursor, OrderSort
+from app.schemas.sync import ChangeWindow
+
+_LIST_PROJECTION = Projection(BuyOrderResponse, BuyOrder, related={"supplier": Supplier})
+
+_SORT_COLUMNS: dict[str, ColumnElement[Any]] = {
+    "created_at": BuyOrder.created_at,  # type: ignore[dict-item]
+    "total": BuyOrder.total,  # type: ignore[dict-item]
+}
+
+
+def _search_filters(search: OrderSearch) -> list[ColumnElement[bool]]:
+    """``search`` as WHERE clauses, each backed by an index on Postgres.
+
+    Supplier/status use ix_buy_orders_supplier_id_status, date and total ranges the
+    (created_at, id) / (total, id) indexes, the product filter an EXISTS probe on
+    ix_buy_order_items_product_id and the notes match a pg_trgm GIN index.
+    """
+    clauses: list[ColumnElement[bool]] = []
+    if search.supplier_id is not None:
+        clauses.append(BuyOrder.supplier_id == search.supplier_id)
+    if search.statuses:
+        clauses.append(BuyOrder.status.in_(search.statuses))
+    if search.created_from is not None:
+        clauses.append(BuyOrder.created_at >= search.created_from)
+    if search.created_to is not None:
+        clauses.append(BuyOrder.created_at < search.created_to)
+    if search.total_min is not None:
+        clauses.append(BuyOrder.total >= search.total_min)
+    if search.total_max is not None:
+        clauses.append(BuyOrder.total <= search.total_max)
+    if search.product_id is not None:
+        clauses.append(
+            exists().where(
+                BuyOrderItem.product_id == search.product_id,
+                BuyOrderItem.order_id == BuyOrder.id,
+            )
+        )
+    if search.notes:
+        pattern = f"%{escape_like(search.notes)}%"
+        clauses.append(BuyOrder.notes.ilike(pattern, escape=LIKE_ESCAPE))
+    return clauses
 
 
 class BuyOrderRepository:
     @staticmethod
-    async def get_all(
-        session: AsyncSession,
-        skip: int = 0,
-        limit: int = 20,
-        supplier_id: uuid.UUID | None = None,
-        status: OrderStatus | None = None,
-    ) -> list[BuyOrder]:
+    def _list_stmt(
+        skip: int,
+        limit: int | None,
+        supplier_id: uuid.UUID | None,
+        status: OrderStatus | None,
+        changes: ChangeWindow | None,
+    ) -> Select[Any]:
         stmt = (
-            select(BuyOrder)
-            .options(selectinload(BuyOrder.supplier))
+            select(*_LIST_PROJECTION.columns)
+            .join(Supplier, Supplier.id == BuyOrder.supplier_id)
             .offset(skip)
             .limit(limit)
         )
@@ -30,8 +81,79 @@ class BuyOrderRepository:
             stmt = stmt.where(BuyOrder.supplier_id == supplier_id)
         if status is not None:
             stmt = stmt.where(BuyOrder.status == status)
+        return apply_change_window(stmt, changes, BuyOrder.updated_at, (BuyOrder.id,))
+
+    @staticmethod
+    async def list_rows(
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 20,
+        supplier_id: uuid.UUID | None = None,
+        status: OrderStatus | None = None,
+        changes: ChangeWindow | None = None,
+    ) -> list[dict[str, Any]]:
+        """One joined, column-projected query shaped as ``BuyOrderResponse`` dicts."""
+        stmt = BuyOrderRepository._list_stmt(skip, limit, supplier_id, status, changes)
         result = await session.execute(stmt)
-        return list(result.scalars().all())
+        return _LIST_PROJECTION.shape_all(result.all())
+
+    @staticmethod
+    def stream_rows(
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int | None = None,
+        supplier_id: uuid.UUID | None = None,
+        status: OrderStatus | None = None,
+        changes: ChangeWindow | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Same rows as :meth:`list_rows`, in batches off a server-side cursor."""
+        stmt = BuyOrderRepository._list_stmt(skip, limit, supplier_id, status, changes)
+        return _LIST_PROJECTION.stream(session, stmt)
+
+    @staticmethod
+    async def search_rows(
+        session: AsyncSession,
+        search: OrderSearch,
+        sort: OrderSort = OrderSort.CREATED_AT_DESC,
+        after: OrderSearchCursor | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """A keyset page of ``BuyOrderResponse`` dicts matching ``search``, in ``sort`` order.
+
+        Ties on the sort value are broken by id, so ``after`` resumes exactly past the
+        last row of the previous page.
+        """
+        column = _SORT_COLUMNS[sort.field]
+        stmt = (
+            select(*_LIST_PROJECTION.columns)
+            .join(Supplier, Supplier.id == BuyOrder.supplier_id)
+            .where(*_search_filters(search))
+            .limit(limit)
+        )
+        position = tuple_(column, BuyOrder.id)
+        if sort.descending:
+            if after is not None:
+                stmt = stmt.where(position < tuple_(after.value, after.id))
+            stmt = stmt.order_by(column.desc(), BuyOrder.id.desc())
+        else:
+            if after is not None:
+                stmt = stmt.where(position > tuple_(after.value, after.id))
+            stmt = stmt.order_by(column, BuyOrder.id)
+        result = await session.execute(stmt)
+        return _LIST_PROJECTION.shape_all(result.all())
+
+    @staticmethod
+    async def list_rows_by_ids(
+        session: AsyncSession, ids: Collection[uuid.UUID]
+    ) -> list[dict[str, Any]]:
+        """``BuyOrderResponse`` dicts for whichever of ``ids`` exist, in one query."""
+        stmt = (
+            select(*_LIST_PROJECTION.columns)
+            .join(Supplier, Supplier.id == BuyOrder.supplier_id)
+            .where(BuyOrder.id.in_(ids))
+        )
+        result = await session.execute(stmt)
+        return _LIST_PROJECTION.shape_all(result.all())
 
     @staticmethod
     async def get_by_id(session: AsyncSession, order_id: uuid.UUID) -> BuyOrder | None:
@@ -43,17 +165,40 @@ class BuyOrderRepository:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def get_with_items(session: AsyncSession, order_id: uuid.UUID) -> BuyOrder | None:
+    async def get_with_items(
+        session: AsyncSession,
+        order_id: uuid.UUID,
+        include: Collection[str] | None = None,
+    ) -> BuyOrder | None:
+        """Load an order with the requested relations (default: supplier, items, items.product)."""
+        if include is None:
+            include = ("supplier", "items.product")
         result = await session.execute(
             select(BuyOrder)
             .where(BuyOrder.id == order_id)
-            .options(
-                selectinload(BuyOrder.supplier),
-                selectinload(BuyOrder.items).selectinload(BuyOrderItem.product),
-            )
+            .options(*selectin_paths(BuyOrder, include))
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_version(session: AsyncSession, order_id: uuid.UUID) -> Row[Any] | None:
+        """Everything :meth:`get_with_items` renders changes with, in one aggregate row."""
+        result = await session.execute(
+            select(
+                BuyOrder.updated_at,
+                Supplier.updated_at,
+                func.count(BuyOrderItem.id),
+                func.max(BuyOrderItem.updated_at),
+                func.max(Product.updated_at),
+            )
+            .join(Supplier, Supplier.id == BuyOrder.supplier_id)
+            .outerjoin(BuyOrderItem, BuyOrderItem.order_id == BuyOrder.id)
+            .outerjoin(Product, Product.id == BuyOrderItem.product_id)
+            .where(BuyOrder.id == order_id)
+            .group_by(BuyOrder.id, BuyOrder.updated_at, Supplier.updated_at)
+        )
+        return result.one_or_none()
+
     @staticmethod
     async def create(session: AsyncSession, data: BuyOrderCreate) -> BuyOrder:
         order = BuyOrder(
@@ -94,5 +239,6 @@ class BuyOrderRepository:
 
     @staticmethod
     async def delete(session: AsyncSession, order: BuyOrder) -> None:
+        await TombstoneRepository.record(session, SyncResource.ORDERS, [str(order.id)])
         await session.delete(order)
         await session.flush()
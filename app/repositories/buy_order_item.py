@@ -1,11 +1,36 @@
 import uuid
+from collections.abc import AsyncIterator, Collection, Sequence
+from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.models.buy_order import BuyOrder, OrderStatus
 from app.models.buy_order_item import BuyOrderItem
+from app.models.product import Product
+from app.models.supplier import Supplier
+from app.repositories.projection import STREAM_BATCH_SIZE
+
+# Flattened order-line export: one row per line, denormalized with order, supplier and
+# product attributes. Labels double as the export's column names.
+_EXPORT_COLUMNS = (
+    BuyOrder.id.label("order_id"),
+    BuyOrder.status.label("order_status"),
+    BuyOrder.created_at.label("order_created_at"),
+    Supplier.id.label("supplier_id"),
+    Supplier.name.label("supplier_name"),
+    Product.id.label("product_id"),
+    Product.sku.label("product_sku"),
+    Product.name.label("product_name"),
+    Product.unit.label("unit"),
+    BuyOrderItem.quantity.label("quantity"),
+    BuyOrderItem.unit_price.label("unit_price"),
+    BuyOrderItem.subtotal.label("subtotal"),
+)
+EXPORT_COLUMN_NAMES = tuple(c.name for c in _EXPORT_COLUMNS)
 
 
 class BuyOrderItemRepository:
@@ -82,3 +107,32 @@ class BuyOrderItemRepository:
     async def delete(session: AsyncSession, item: BuyOrderItem) -> None:
         await session.delete(item)
         await session.flush()
+
+    @staticmethod
+    async def stream_export_rows(
+        session: AsyncSession,
+        statuses: Collection[OrderStatus],
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[Sequence[Row[Any]]]:
+        """Order lines joined with supplier and product, off a server-side cursor.
+
+        Columns follow ``EXPORT_COLUMN_NAMES``. ``created_from`` is inclusive and
+        ``created_to`` exclusive, both on the order's ``created_at``.
+        """
+        stmt = (
+            select(*_EXPORT_COLUMNS)
+            .join(BuyOrder, BuyOrder.id == BuyOrderItem.order_id)
+            .join(Supplier, Supplier.id == BuyOrder.supplier_id)
+            .join(Product, Product.id == BuyOrderItem.product_id)
+            .where(BuyOrder.status.in_([OrderStatus(s).value for s in statuses]))
+            .order_by(BuyOrder.created_at, BuyOrder.id, Product.sku)
+        )
+        if created_from is not None:
+            stmt = stmt.where(BuyOrder.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(BuyOrder.created_at < created_to)
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            yield rows
@@ -0,0 +1,201 @@
+"""Session-aware front for the in-process catalog cache.
+
+Entries are immutable snapshots (response schemas), never ORM instances, so they can be
+shared across sessions. Write paths call :meth:`CatalogCache.invalidate` with their
+session: the entry is dropped immediately, the session bypasses the cache for that key
+until it ends (so it never caches its own uncommitted rows), and the key is dropped
+again after commit in case another request re-cached the old row in between.
+
+Other workers hear about committed writes through Postgres: triggers on the catalog
+tables ``pg_notify`` :data:`NOTIFY_CHANNEL` with ``<kind>:<key>`` payloads, and each
+worker's listener (see ``app.main``) feeds them to :meth:`CatalogCache.handle_notification`.
+
+With ``SHARED_CACHE_URL`` set, in-process misses fall through to a shared tier (Redis)
+before the database, so a pod starts warm. The writing worker invalidates its keys there
+twice: just before commit (:meth:`CatalogCache.invalidate_shared`, awaited, so no pod
+that hears the NOTIFY can still find the old payload) and again after commit (orphaning
+anything re-loaded from the not-yet-committed database in between). Invalidation bumps a
+per-key version, so a reader whose load raced either one cannot write a stale value back.
+"""
+
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from enum import Enum
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.cache_backends import SharedCache, backend_from_url
+from app.core.config import settings
+from app.schemas.product import ProductResponse
+from app.schemas.supplier import SupplierResponse
+from app.schemas.supplier_product import SupplierProductTerms
+
+T = TypeVar("T")
+
+_DIRTY = "catalog_cache_dirty"
+# Invalidation key meaning "every entry of this kind".
+ALL = "*"
+# Written to by the notify_catalog_cache() trigger function.
+NOTIFY_CHANNEL = "catalog_cache"
+
+
+class CacheKind(str, Enum):
+    SUPPLIERS = "suppliers"
+    PRODUCTS = "products"
+    OFFERS = "offers"  # keyed by (supplier_id, product_id)
+
+    @property
+    def table(self) -> str:
+        return "supplier_products" if self is CacheKind.OFFERS else self.value
+
+
+# Snapshot schema cached for each kind (deserialization target for the shared tier).
+_MODELS: dict[CacheKind, type[BaseModel]] = {
+    CacheKind.SUPPLIERS: SupplierResponse,
+    CacheKind.PRODUCTS: ProductResponse,
+    CacheKind.OFFERS: SupplierProductTerms,
+}
+
+
+def encode_key(kind: CacheKind, key: Hashable) -> str:
+    """``<id>`` or, for offers, ``<supplier_id>:<product_id>`` (as in NOTIFY payloads)."""
+    if kind is CacheKind.OFFERS and key != ALL:
+        supplier_id, product_id = key  # type: ignore[misc]
+        return f"{supplier_id}:{product_id}"
+    return str(key)
+
+
+def decode_key(kind: CacheKind, raw: str) -> Hashable:
+    if raw == ALL:
+        return ALL
+    if kind is CacheKind.OFFERS:
+        supplier_id, product_id = raw.split(":")
+        return (uuid.UUID(supplier_id), uuid.UUID(product_id))
+    return uuid.UUID(raw)
+
+
+class CatalogCache:
+    def __init__(self, maxsize: int, ttl: float, shared: SharedCache | None = None) -> None:
+        self.caches: dict[CacheKind, TTLCache[Hashable, Any]] = {
+            kind: TTLCache(maxsize, ttl) for kind in CacheKind
+        }
+        self.shared = shared
+        # Called with (kind, key) on every eviction: local writes, commits and NOTIFYs.
+        self.listeners: list[Callable[[CacheKind, Hashable], None]] = []
+        self._pending: set[asyncio.Task[None]] = set()
+
+    def is_dirty(self, session: AsyncSession, kind: CacheKind, key: Hashable) -> bool:
+        """Whether ``session`` has written ``key`` and must read it from the database."""
+        dirty: set[tuple[CacheKind, Hashable]] = session.info.get(_DIRTY, set())
+        return (kind, key) in dirty or (kind, ALL) in dirty
+
+    async def get(
+        self,
+        session: AsyncSession,
+        kind: CacheKind,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T | None]],
+    ) -> T | None:
+        if self.is_dirty(session, kind, key):
+            return await loader()
+        if self.shared is None:
+            return await self.caches[kind].get_or_load(key, loader)
+        return await self.caches[kind].get_or_load(
+            key, lambda: self._load_shared(kind, key, loader)
+        )
+
+    async def _load_shared(
+        self, kind: CacheKind, key: Hashable, loader: Callable[[], Awaitable[T | None]]
+    ) -> T | None:
+        assert self.shared is not None
+        name = encode_key(kind, key)
+        lookup = await self.shared.get_many(kind.value, [name], _MODELS[kind])
+        if name in lookup.values:
+            return lookup.values[name]  # type: ignore[no-any-return]
+        value = await loader()
+        if isinstance(value, BaseModel):
+            await self.shared.set_many(kind.value, {name: value}, lookup)
+        return value
+
+    def invalidate(self, session: AsyncSession, kind: CacheKind, key: Hashable = ALL) -> None:
+        self._drop(kind, key)
+        session.info.setdefault(_DIRTY, set()).add((kind, key))
+
+    async def invalidate_shared(self, session: AsyncSession) -> None:
+        """Invalidate ``session``'s written keys in the shared tier; await right before commit."""
+        dirty = session.info.get(_DIRTY)
+        if self.shared is not None and dirty:
+            await self._drop_shared(list(dirty))
+
+    def clear(self) -> None:
+        for cache in self.caches.values():
+            cache.clear()
+
+    def handle_notification(self, payload: str) -> None:
+        """Evict the entry named by a ``suppliers:<id>`` / ``offers:<sid>:<pid>`` payload."""
+        raw_kind, _, raw_key = payload.partition(":")
+        kind = CacheKind(raw_kind)
+        self._drop(kind, decode_key(kind, raw_key))
+
+    async def close(self) -> None:
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self.shared is not None:
+            await self.shared.close()
+
+    def _drop(self, kind: CacheKind, key: Hashable) -> None:
+        if key == ALL:
+            self.caches[kind].clear()
+        else:
+            self.caches[kind].invalidate(key)
+        for listener in self.listeners:
+            listener(kind, key)
+
+    async def _drop_shared(self, dirty: Iterable[tuple[CacheKind, Hashable]]) -> None:
+        assert self.shared is not None
+        keys: dict[CacheKind, list[str]] = {}
+        for kind, key in dirty:
+            if key == ALL:
+                await self.shared.invalidate_all(kind.value)
+            else:
+                keys.setdefault(kind, []).append(encode_key(kind, key))
+        for kind, names in keys.items():
+            await self.shared.invalidate(kind.value, names)
+
+    def _after_commit(self, session: Session) -> None:
+        dirty = session.info.pop(_DIRTY, set())
+        for kind, key in dirty:
+            self._drop(kind, key)
+        if self.shared is not None and dirty:
+            # Session events are synchronous; the shared-tier delete runs alongside.
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:  # sync caller (scripts); entries expire by TTL
+                return
+            task = loop.create_task(self._drop_shared(dirty))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    def _after_rollback(self, session: Session) -> None:
+        # Nothing reached the database; entries cached by other sessions are still valid.
+        session.info.pop(_DIRTY, None)
+
+
+catalog_cache = CatalogCache(
+    settings.CATALOG_CACHE_SIZE,
+    settings.CATALOG_CACHE_TTL,
+    shared=(
+        SharedCache(backend_from_url(settings.SHARED_CACHE_URL), settings.SHARED_CACHE_TTL)
+        if settings.SHARED_CACHE_URL
+        else None
+    ),
+)
+
+event.listen(Session, "after_commit", catalog_cache._after_commit)
+event.listen(Session, "after_rollback", catalog_cache._after_rollback)
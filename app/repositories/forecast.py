@@ -0,0 +1,65 @@
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from datetime import date, datetime, time, timezone
+from typing import Any
+
+from sqlalchemy import Date, delete, func, insert, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.buy_order import BuyOrder, OrderStatus
+from app.models.buy_order_item import BuyOrderItem
+from app.models.forecast import ProductForecast
+
+# Rows per server-side cursor round trip while reading history, and per INSERT.
+HISTORY_BATCH_SIZE = 10_000
+INSERT_BATCH_SIZE = 5000
+
+
+class ForecastRepository:
+    @staticmethod
+    async def stream_received_demand(
+        session: AsyncSession, as_of: date
+    ) -> AsyncIterator[Sequence[Any]]:
+        """``(product_id, day, quantity)`` daily totals of RECEIVED lines before ``as_of``.
+
+        One query, ordered by product then day, read in batches off a server-side cursor.
+        RECEIVED is terminal, so an order's ``updated_at`` is when it was received.
+        """
+        day = type_coerce(func.date(BuyOrder.updated_at), Date)
+        stmt = (
+            select(BuyOrderItem.product_id, day.label("day"), func.sum(BuyOrderItem.quantity))
+            .join(BuyOrder, BuyOrder.id == BuyOrderItem.order_id)
+            .where(
+                BuyOrder.status == OrderStatus.RECEIVED,
+                BuyOrder.updated_at < datetime.combine(as_of, time.min, tzinfo=timezone.utc),
+            )
+            .group_by(BuyOrderItem.product_id, day)
+            .order_by(BuyOrderItem.product_id, day)
+            .execution_options(yield_per=HISTORY_BATCH_SIZE)
+        )
+        result = await session.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
+
+    @staticmethod
+    async def replace_all(session: AsyncSession, rows: Sequence[dict[str, Any]]) -> None:
+        """Swap the whole forecast table for ``rows`` (visible to others on commit)."""
+        await session.execute(delete(ProductForecast))
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            await session.execute(insert(ProductForecast), rows[start : start + INSERT_BATCH_SIZE])
+
+    @staticmethod
+    async def get(session: AsyncSession, product_id: uuid.UUID) -> ProductForecast | None:
+        return await session.get(ProductForecast, product_id)
+
+    @staticmethod
+    async def list(
+        session: AsyncSession, skip: int = 0, limit: int = 20
+    ) -> Sequence[ProductForecast]:
+        result = await session.execute(
+            select(ProductForecast)
+            .order_by(ProductForecast.product_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.scalars().all()
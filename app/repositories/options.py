@@ -0,0 +1,19 @@
+from collections.abc import Iterable
+
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+
+def selectin_paths(model: type, paths: Iterable[str]) -> list[LoaderOption]:
+    """``selectinload`` chains for dotted relationship paths such as ``items.product``."""
+    paths = set(paths)
+    leaves = [p for p in paths if not any(q.startswith(f"{p}.") for q in paths)]
+    options: list[LoaderOption] = []
+    for path in sorted(leaves):
+        current, loader = model, None
+        for part in path.split("."):
+            attr = getattr(current, part)
+            loader = selectinload(attr) if loader is None else loader.selectinload(attr)
+            current = attr.property.mapper.class_
+        options.append(loader)  # type: ignore[arg-type]
+    return options
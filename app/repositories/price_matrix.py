@@ -0,0 +1,282 @@
+"""Builds, refreshes and serves the host-wide offer-terms snapshot.
+
+Every worker maps the same file (``PRICE_MATRIX_PATH``). A background task in each worker
+rebuilds it when offers change; an exclusive ``flock`` makes sure only one process per host
+does the work. Rebuilds are incremental: the previous snapshot is merged with offers whose
+``updated_at`` moved and offers tombstoned since its watermarks, re-reading a short lag
+window so transactions that committed after stamping their rows are not missed. A full
+rebuild runs when there is no usable snapshot or it is older than
+``PRICE_MATRIX_FULL_REBUILD_AFTER``.
+
+Only positive hits are served, and never for a key that changed (per the catalog cache's
+eviction feed: local writes, commits and NOTIFYs) after the snapshot started building;
+those callers fall back to the catalog cache and the database.
+"""
+
+import asyncio
+import fcntl
+import os
+import time
+import uuid
+from collections.abc import Hashable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.price_matrix import (
+    MatrixWriter,
+    OfferRecord,
+    PriceMatrix,
+    merge_records,
+    offer_key,
+    write_matrix,
+)
+from app.models.supplier_product import SupplierProduct
+from app.models.tombstone import SyncResource, Tombstone
+from app.repositories.cache import ALL, CacheKind, catalog_cache
+from app.schemas.supplier_product import SupplierProductTerms
+
+logger = get_logger(__name__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# How far behind a watermark incremental rebuilds re-read (commit lag cover).
+WATERMARK_LAG = timedelta(seconds=60)
+# Rebuilds triggered by changes are at least this far apart (seconds).
+MIN_REBUILD_SPACING = 1.0
+_POLL_INTERVAL = 0.5
+
+_OFFER_COLUMNS = (
+    SupplierProduct.supplier_id,
+    SupplierProduct.product_id,
+    SupplierProduct.unit_price,
+    SupplierProduct.minimum_quantity,
+    SupplierProduct.optimal_quantity,
+    SupplierProduct.updated_at,
+)
+
+
+def _micros(ts: datetime) -> int:
+    if ts.tzinfo is None:  # SQLite hands back naive UTC
+        ts = ts.replace(tzinfo=timezone.utc)
+    return (ts - _EPOCH) // timedelta(microseconds=1)
+
+
+def _at(micros: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _record(row: Row[Any]) -> OfferRecord:
+    supplier_id, product_id, unit_price, minimum, optimal, _ = row
+    return OfferRecord.build(supplier_id, product_id, unit_price, minimum, optimal)
+
+
+def _tombstoned_key(record_id: str) -> bytes:
+    supplier_id, product_id = record_id.split("/")
+    return offer_key(uuid.UUID(supplier_id), uuid.UUID(product_id))
+
+
+class PriceMatrixStore:
+    def __init__(
+        self, path: Path | None, refresh_interval: float, full_rebuild_after: float
+    ) -> None:
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.full_rebuild_after = full_rebuild_after
+        self._matrix: PriceMatrix | None = None
+        # Wall-clock time each key last changed: comparable with the snapshot's
+        # started_at across every process on the host.
+        self._changed: dict[bytes, float] = {}
+        self._all_changed_at = 0.0
+        self._stale = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def lookup(
+        self, supplier_id: uuid.UUID, product_id: uuid.UUID
+    ) -> SupplierProductTerms | None:
+        matrix = self._matrix
+        if matrix is None:
+            return None
+        key = offer_key(supplier_id, product_id)
+        started_at = matrix.header.started_at
+        if self._all_changed_at >= started_at or self._changed.get(key, 0.0) >= started_at:
+            return None
+        record = matrix.get(key)
+        if record is None:
+            return None
+        return SupplierProductTerms(
+            minimum_quantity=record.minimum_quantity,
+            optimal_quantity=record.optimal_quantity,
+            unit_price=record.unit_price,
+        )
+
+    def note_change(self, kind: CacheKind, key: Hashable) -> None:
+        if not self.enabled or kind is not CacheKind.OFFERS:
+            return
+        now = time.time()
+        if key == ALL:
+            self._all_changed_at = now
+        else:
+            supplier_id, product_id = key  # type: ignore[misc]
+            self._changed[offer_key(supplier_id, product_id)] = now
+        self._stale = True
+
+    def reload(self) -> None:
+        """Map the current snapshot if another process (or we) replaced it."""
+        assert self.path is not None
+        try:
+            inode = os.stat(self.path).st_ino
+        except FileNotFoundError:
+            return
+        if self._matrix is not None and self._matrix.inode == inode:
+            return
+        try:
+            matrix = PriceMatrix(self.path)
+        except (OSError, ValueError) as exc:
+            logger.warning("Unreadable price matrix", path=str(self.path), error=str(exc))
+            return
+        previous, self._matrix = self._matrix, matrix
+        if previous is not None:
+            previous.close()
+        started_at = matrix.header.started_at
+        self._changed = {k: t for k, t in self._changed.items() if t >= started_at}
+
+    async def build(self, session: AsyncSession) -> int | None:
+        """Rebuild the snapshot; ``None`` if another process holds the build lock."""
+        assert self.path is not None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_name(self.path.name + ".lock"), "w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return None
+            started_at = time.time()
+            base = self._base_snapshot(started_at)
+            if base is None:
+                return await self._build_full(session, started_at)
+            return await self._build_incremental(session, base, started_at)
+
+    def _base_snapshot(self, now: float) -> PriceMatrix | None:
+        assert self.path is not None
+        try:
+            base = PriceMatrix(self.path)
+        except (OSError, ValueError):
+            return None
+        if now - base.header.full_started_at > self.full_rebuild_after:
+            base.close()
+            return None
+        return base
+
+    async def _build_full(self, session: AsyncSession, started_at: float) -> int:
+        assert self.path is not None
+        tombstones_at = await session.scalar(
+            select(func.max(Tombstone.deleted_at)).where(
+                Tombstone.resource == SyncResource.SUPPLIER_PRODUCTS.value
+            )
+        )
+        offers_wm = 0
+        writer = MatrixWriter(self.path)
+        try:
+            stream = await session.stream(
+                select(*_OFFER_COLUMNS)
+                .order_by(SupplierProduct.supplier_id, SupplierProduct.product_id)
+                .execution_options(yield_per=10_000)
+            )
+            async for rows in stream.partitions():
+                for row in rows:
+                    writer.write(_record(row))
+                    offers_wm = max(offers_wm, _micros(row.updated_at))
+        except BaseException:
+            writer.abort()
+            raise
+        tombstones_wm = _micros(tombstones_at) if tombstones_at is not None else 0
+        writer.commit(offers_wm, tombstones_wm, started_at, started_at)
+        logger.info("Price matrix rebuilt", offers=writer.count, full=True)
+        return writer.count
+
+    async def _build_incremental(
+        self, session: AsyncSession, base: PriceMatrix, started_at: float
+    ) -> int:
+        assert self.path is not None
+        header = base.header
+        changed = (
+            await session.execute(
+                select(*_OFFER_COLUMNS).where(
+                    SupplierProduct.updated_at >= _at(header.offers_watermark) - WATERMARK_LAG
+                )
+            )
+        ).all()
+        deleted = (
+            await session.execute(
+                select(Tombstone.record_id, Tombstone.deleted_at).where(
+                    Tombstone.resource == SyncResource.SUPPLIER_PRODUCTS.value,
+                    Tombstone.deleted_at >= _at(header.tombstones_watermark) - WATERMARK_LAG,
+                )
+            )
+        ).all()
+        upserts = [_record(row) for row in changed]
+        live = {record.key for record in upserts}
+        # A tombstone older than the row's re-insert must not remove it.
+        deletes = [
+            key for key in (_tombstoned_key(r.record_id) for r in deleted) if key not in live
+        ]
+        offers_wm = max([header.offers_watermark, *(_micros(r.updated_at) for r in changed)])
+        tombstones_wm = max(
+            [header.tombstones_watermark, *(_micros(r.deleted_at) for r in deleted)]
+        )
+        try:
+            count = await asyncio.to_thread(
+                write_matrix,
+                self.path,
+                merge_records(base.records(), upserts, deletes),
+                offers_wm,
+                tombstones_wm,
+                started_at,
+                header.full_started_at,
+            )
+        finally:
+            base.close()
+        logger.info(
+            "Price matrix rebuilt", offers=count, changed=len(upserts), deleted=len(deletes)
+        )
+        return count
+
+    async def run(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Keep this worker's mapping current, rebuilding on changes and periodically."""
+        assert self.path is not None
+        self.reload()
+        last_build = float("-inf")
+        while True:
+            now = time.monotonic()
+            if (self._stale and now - last_build >= MIN_REBUILD_SPACING) or (
+                now - last_build >= self.refresh_interval
+            ):
+                self._stale = False
+                last_build = now
+                try:
+                    async with session_factory() as session:
+                        await self.build(session)
+                except Exception as exc:
+                    logger.warning("Price matrix rebuild failed", error=str(exc))
+            self.reload()
+            await asyncio.sleep(_POLL_INTERVAL)
+
+    def close(self) -> None:
+        if self._matrix is not None:
+            self._matrix.close()
+            self._matrix = None
+
+
+price_matrix = PriceMatrixStore(
+    Path(settings.PRICE_MATRIX_PATH) if settings.PRICE_MATRIX_PATH else None,
+    settings.PRICE_MATRIX_REFRESH_INTERVAL,
+    settings.PRICE_MATRIX_FULL_REBUILD_AFTER,
+)
+catalog_cache.listeners.append(price_matrix.note_change)
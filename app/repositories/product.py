@@ -1,23 +1,154 @@
 import uuid
+from collections.abc import AsyncIterator, Collection
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Integer, Select, and_, case, cast, func, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.product import Product
-from app.schemas.product import ProductCreate, ProductUpdate
+from app.models.supplier_product import SupplierProduct
+from app.models.tombstone import SyncResource
+from app.repositories.cache import CacheKind, catalog_cache
+from app.repositories.projection import Projection
+from app.repositories.search import LIKE_ESCAPE, escape_like
+from app.repositories.sync import apply_change_window
+from app.repositories.tombstone import TombstoneRepository
+from app.schemas.product import ProductCreate, ProductResponse, ProductUpdate
+from app.schemas.product_search import TRIGRAM_MIN_LENGTH, ProductSearchCursor
+from app.schemas.sync import ChangeWindow
+
+_LIST_PROJECTION = Projection(ProductResponse, Product)
+
+# Score tiers: any SKU hit outranks any name/description similarity (at most 1500).
+_SKU_EXACT, _SKU_PREFIX, _NAME_WEIGHT, _DESCRIPTION_WEIGHT = 3000, 2000, 1000, 500
+
+
+def _search_terms(dialect: str, q: str) -> tuple[ColumnElement[bool], ColumnElement[int]]:
+    """WHERE clause and integer score for query ``q``.
+
+    On Postgres every branch of the match is index-backed: ``lower(sku)`` and
+    ``lower(name)`` prefixes by text_pattern_ops btrees, substring and fuzzy (``<%``,
+    word similarity) matches by pg_trgm GIN indexes on name and description. The test
+    suite's SQLite has no pg_trgm, so there substrings score a flat weight instead.
+    """
+    needle = q.lower()
+    prefix = escape_like(needle) + "%"
+    sku = func.lower(Product.sku)
+    name = func.lower(Product.name)
+    sku_prefix = sku.like(prefix, escape=LIKE_ESCAPE)
+    score: ColumnElement[int] = case(
+        (sku == needle, _SKU_EXACT), (sku_prefix, _SKU_PREFIX), else_=0
+    )
+    if len(q) < TRIGRAM_MIN_LENGTH:
+        name_prefix = name.like(prefix, escape=LIKE_ESCAPE)
+        return or_(sku_prefix, name_prefix), score + case((name_prefix, _NAME_WEIGHT), else_=0)
+
+    contains = f"%{escape_like(q)}%"
+    description = func.coalesce(Product.description, "")
+    if dialect == "sqlite":
+        name_match = Product.name.ilike(contains, escape=LIKE_ESCAPE)
+        description_match = Product.description.ilike(contains, escape=LIKE_ESCAPE)
+        score = (
+            score
+            + case((name_match, _NAME_WEIGHT), else_=0)
+            + case((description_match, _DESCRIPTION_WEIGHT), else_=0)
+        )
+        return or_(sku_prefix, name_match, description_match), score
+
+    name_match = or_(
+        Product.name.ilike(contains, escape=LIKE_ESCAPE), literal(q).op("<%")(Product.name)
+    )
+    description_match = Product.description.ilike(contains, escape=LIKE_ESCAPE)
+    score = (
+        score
+        + cast(func.round(_NAME_WEIGHT * func.word_similarity(q, Product.name)), Integer)
+        + cast(func.round(_DESCRIPTION_WEIGHT * func.word_similarity(q, description)), Integer)
+    )
+    return or_(sku_prefix, name_match, description_match), score
 
 
 class ProductRepository:
     @staticmethod
-    async def get_all(session: AsyncSession, skip: int = 0, limit: int = 20) -> list[Product]:
-        result = await session.execute(select(Product).offset(skip).limit(limit))
-        return list(result.scalars().all())
+    def _list_stmt(skip: int, limit: int | None, changes: ChangeWindow | None) -> Select[Any]:
+        stmt = select(*_LIST_PROJECTION.columns).offset(skip).limit(limit)
+        return apply_change_window(stmt, changes, Product.updated_at, (Product.id,))
+
+    @staticmethod
+    async def list_rows(
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 20,
+        changes: ChangeWindow | None = None,
+    ) -> list[dict[str, Any]]:
+        """Column-projected page shaped as ``ProductResponse`` dicts."""
+        result = await session.execute(ProductRepository._list_stmt(skip, limit, changes))
+        return _LIST_PROJECTION.shape_all(result.all())
+
+    @staticmethod
+    def stream_rows(
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int | None = None,
+        changes: ChangeWindow | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Same rows as :meth:`list_rows`, in batches off a server-side cursor."""
+        return _LIST_PROJECTION.stream(session, ProductRepository._list_stmt(skip, limit, changes))
+
+    @staticmethod
+    async def search_rows(
+        session: AsyncSession,
+        q: str,
+        after: ProductSearchCursor | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """A page of ``ProductSearchHit`` dicts matching ``q``, best first.
+
+        Ordered by ``(score desc, sku)``; SKUs are unique, so ``after`` resumes exactly
+        past the last hit of the previous page.
+        """
+        match, score = _search_terms(session.get_bind().dialect.name, q)
+        stmt = (
+            select(*_LIST_PROJECTION.columns, score.label("score"))
+            .where(match)
+            .order_by(score.desc(), Product.sku)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(
+                or_(score < after.score, and_(score == after.score, Product.sku > after.sku))
+            )
+        result = await session.execute(stmt)
+        rows = []
+        for row in result.all():
+            hit = _LIST_PROJECTION.shape(row)
+            hit["score"] = row.score
+            rows.append(hit)
+        return rows
+
+    @staticmethod
+    async def list_rows_by_ids(
+        session: AsyncSession, ids: Collection[uuid.UUID]
+    ) -> list[dict[str, Any]]:
+        """``ProductResponse`` dicts for whichever of ``ids`` exist, in one query."""
+        stmt = select(*_LIST_PROJECTION.columns).where(Product.id.in_(ids))
+        result = await session.execute(stmt)
+        return _LIST_PROJECTION.shape_all(result.all())
 
     @staticmethod
     async def get_by_id(session: AsyncSession, product_id: uuid.UUID) -> Product | None:
         result = await session.execute(select(Product).where(Product.id == product_id))
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_snapshot(session: AsyncSession, product_id: uuid.UUID) -> ProductResponse | None:
+        """Read-only, cached view of a product for existence checks on hot paths."""
+
+        async def load() -> ProductResponse | None:
+            product = await ProductRepository.get_by_id(session, product_id)
+            return None if product is None else ProductResponse.model_validate(product)
+
+        return await catalog_cache.get(session, CacheKind.PRODUCTS, product_id, load)
+
     @staticmethod
     async def get_by_sku(session: AsyncSession, sku: str) -> Product | None:
         result = await session.execute(select(Product).where(Product.sku == sku))
@@ -42,5 +173,15 @@ class ProductRepository:
 
     @staticmethod
     async def delete(session: AsyncSession, product: Product) -> None:
+        # Offer links go with it (ORM cascade); mirrors need to hear about those too.
+        links = await session.execute(
+            select(SupplierProduct.supplier_id, SupplierProduct.product_id).where(
+                SupplierProduct.product_id == product.id
+            )
+        )
+        await TombstoneRepository.record(
+            session, SyncResource.SUPPLIER_PRODUCTS, (f"{s}/{p}" for s, p in links.all())
+        )
+        await TombstoneRepository.record(session, SyncResource.PRODUCTS, [str(product.id)])
         await session.delete(product)
         await session.flush()
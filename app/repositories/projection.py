@@ -0,0 +1,65 @@
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.sparse import nested_model
+
+# Rows fetched per server-side cursor round trip when streaming.
+STREAM_BATCH_SIZE = 1000
+
+
+class Projection:
+    """Column-level SELECT list for a response schema, shaped back into plain dicts.
+
+    Scalar schema fields map to columns of ``model``; nested schema fields listed in
+    ``related`` map to columns of that related (joined) model. Rows are reshaped into
+    dicts in schema field order, so serializing them gives the same JSON as validating
+    ORM entities through the schema — without identity-map or validation overhead.
+    """
+
+    def __init__(
+        self,
+        schema: type[BaseModel],
+        model: type,
+        related: dict[str, type] | None = None,
+    ) -> None:
+        self.columns: list[ColumnElement[Any]] = []
+        self._layout: list[tuple[str, int | list[tuple[str, int]]]] = []
+        for name, info in schema.model_fields.items():
+            nested = nested_model(info.annotation)
+            if nested is None:
+                self._layout.append((name, self._add(model, name, name)))
+            elif related and name in related:
+                sub = [
+                    (sub_name, self._add(related[name], sub_name, f"{name}__{sub_name}"))
+                    for sub_name, sub_info in nested.model_fields.items()
+                    if nested_model(sub_info.annotation) is None
+                ]
+                self._layout.append((name, sub))
+
+    def _add(self, model: type, column: str, label: str) -> int:
+        self.columns.append(model.__table__.c[column].label(label))  # type: ignore[attr-defined]
+        return len(self.columns) - 1
+
+    def shape(self, row: Sequence[Any]) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        for name, index in self._layout:
+            if isinstance(index, int):
+                out[name] = row[index]
+            else:
+                out[name] = {sub: row[i] for sub, i in index}
+        return out
+
+    def shape_all(self, rows: Sequence[Sequence[Any]]) -> list[dict[str, Any]]:
+        return [self.shape(row) for row in rows]
+
+    async def stream(
+        self, session: AsyncSession, stmt: Select[Any], batch_size: int = STREAM_BATCH_SIZE
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Run ``stmt`` on a server-side cursor and yield shaped rows one batch at a time."""
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            yield self.shape_all(rows)
@@ -0,0 +1,197 @@
+"""Set-based reorder suggestions over the whole catalog.
+
+A product needs reordering when its position (``stock`` plus quantity still open on
+DRAFT, CONFIRMED and SENT orders) is below its preferred offer's ``optimal_quantity``. The
+preferred offer is the cheapest one (unpriced offers last, as in
+``SupplierProductRepository.list_ranked_offers``), and the suggested quantity tops the
+position up to ``optimal_quantity`` but never goes below the offer's
+``minimum_quantity``. All of it is one query: the arithmetic runs column-wise inside the
+database instead of row by row in Python.
+"""
+
+import uuid
+from collections.abc import AsyncIterator, Iterable, Sequence
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Select, case, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.buy_order import OPEN_STATUSES, BuyOrder, OrderStatus
+from app.models.buy_order_item import BuyOrderItem
+from app.models.product import Product
+from app.models.supplier_product import SupplierProduct
+from app.repositories.projection import STREAM_BATCH_SIZE
+from app.repositories.spend import SpendRollupRepository, month_of
+
+# Rows per INSERT when creating draft orders in bulk.
+INSERT_BATCH_SIZE = 5000
+# pg_advisory_xact_lock key held while drafting reorders (any app-unique bigint).
+REORDER_LOCK_KEY = 0x52454F52444552
+
+
+def _suggestions_stmt(supplier_id: uuid.UUID | None) -> Select[Any]:
+    on_order = (
+        select(
+            BuyOrderItem.product_id,
+            func.sum(BuyOrderItem.quantity).label("on_order"),
+        )
+        .join(BuyOrder, BuyOrder.id == BuyOrderItem.order_id)
+        .where(BuyOrder.status.in_(OPEN_STATUSES))
+        .group_by(BuyOrderItem.product_id)
+        .subquery()
+    )
+    preferred = select(
+        SupplierProduct.product_id,
+        SupplierProduct.supplier_id,
+        SupplierProduct.unit_price,
+        SupplierProduct.minimum_quantity,
+        SupplierProduct.optimal_quantity,
+        func.row_number()
+        .over(
+            partition_by=SupplierProduct.product_id,
+            order_by=(
+                SupplierProduct.unit_price.asc().nulls_last(),
+                SupplierProduct.minimum_quantity,
+                SupplierProduct.supplier_id,
+            ),
+        )
+        .label("rank"),
+    ).subquery()
+    on_order_qty = func.coalesce(on_order.c.on_order, 0.0)
+    shortfall = preferred.c.optimal_quantity - (Product.stock + on_order_qty)
+    stmt = (
+        select(
+            Product.id.label("product_id"),
+            Product.sku,
+            Product.stock,
+            on_order_qty.label("on_order"),
+            preferred.c.supplier_id,
+            preferred.c.unit_price,
+            preferred.c.minimum_quantity,
+            preferred.c.optimal_quantity,
+            case(
+                (shortfall < preferred.c.minimum_quantity, preferred.c.minimum_quantity),
+                else_=shortfall,
+            ).label("quantity"),
+        )
+        .join(preferred, preferred.c.product_id == Product.id)
+        .outerjoin(on_order, on_order.c.product_id == Product.id)
+        .where(preferred.c.rank == 1, shortfall > 0)
+        .order_by(preferred.c.supplier_id, Product.id)
+    )
+    if supplier_id is not None:
+        stmt = stmt.where(preferred.c.supplier_id == supplier_id)
+    return stmt
+
+
+def _subtotal(row: Any) -> Decimal:
+    return Decimal(str(row.quantity)) * (row.unit_price or Decimal("0"))
+
+
+def _batches(rows: Sequence[dict[str, Any]], size: int) -> Iterable[Sequence[dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+class ReorderRepository:
+    @staticmethod
+    async def list_rows(
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 20,
+        supplier_id: uuid.UUID | None = None,
+    ) -> list[dict[str, Any]]:
+        stmt = _suggestions_stmt(supplier_id).offset(skip).limit(limit)
+        result = await session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    @staticmethod
+    async def stream_rows(
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int | None = None,
+        supplier_id: uuid.UUID | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Every suggestion, in batches off a server-side cursor."""
+        stmt = _suggestions_stmt(supplier_id).offset(skip).limit(limit)
+        result = await session.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        async for rows in result.mappings().partitions():
+            yield [dict(row) for row in rows]
+
+    @staticmethod
+    async def create_draft_orders(
+        session: AsyncSession, supplier_id: uuid.UUID | None = None, notes: str | None = None
+    ) -> list[dict[str, Any]]:
+        """One DRAFT order per supplier holding all its suggested lines.
+
+        Writes with bulk INSERTs (a few statements, not one flush per row); returns the new
+        orders as ``{"id", "supplier_id", "items", "total"}``.
+
+        On Postgres, concurrent calls are serialised with a transaction-scoped advisory
+        lock: otherwise both would see the same shortfall and draft it twice. Under READ
+        COMMITTED the caller that waited then sees the first one's drafts as on order.
+        """
+        if session.get_bind().dialect.name == "postgresql":
+            await session.execute(select(func.pg_advisory_xact_lock(REORDER_LOCK_KEY)))
+        rows = (await session.execute(_suggestions_stmt(supplier_id))).all()
+        orders: dict[uuid.UUID, dict[str, Any]] = {}
+        items: list[dict[str, Any]] = []
+        for row in rows:
+            order = orders.get(row.supplier_id)
+            if order is None:
+                order = orders[row.supplier_id] = {
+                    "id": uuid.uuid4(),
+                    "supplier_id": row.supplier_id,
+                    "items": 0,
+                    "total": Decimal("0"),
+                }
+            subtotal = _subtotal(row)
+            order["items"] += 1
+            order["total"] += subtotal
+            items.append(
+                {
+                    "id": uuid.uuid4(),
+                    "order_id": order["id"],
+                    "product_id": row.product_id,
+                    "quantity": row.quantity,
+                    "subtotal": subtotal,
+                }
+            )
+        if not orders:
+            return []
+        # Stamped here rather than by the server so the spend rollup month matches.
+        now = datetime.now(timezone.utc)
+        await session.execute(
+            insert(BuyOrder),
+            [
+                {
+                    "id": o["id"],
+                    "supplier_id": o["supplier_id"],
+                    "status": OrderStatus.DRAFT,
+                    "notes": notes,
+                    "total": o["total"],
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for o in orders.values()
+            ],
+        )
+        for batch in _batches(items, INSERT_BATCH_SIZE):
+            await session.execute(insert(BuyOrderItem), batch)
+        await SpendRollupRepository.apply(
+            session,
+            [
+                {
+                    "supplier_id": o["supplier_id"],
+                    "month": month_of(now),
+                    "status": OrderStatus.DRAFT,
+                    "order_count": 1,
+                    "line_count": o["items"],
+                    "total": o["total"],
+                }
+                for o in orders.values()
+            ],
+        )
+        return list(orders.values())
@@ -0,0 +1,9 @@
+"""Helpers shared by the text-search queries."""
+
+# Escape character passed to LIKE/ILIKE alongside patterns built with :func:`escape_like`.
+LIKE_ESCAPE = "\\"
+
+
+def escape_like(text: str) -> str:
+    """``text`` with LIKE wildcards escaped, so it matches literally inside a pattern."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,147 @@
+"""Incrementally maintained spend rollups (see :class:`~app.models.spend_rollup.SpendRollup`).
+
+Writers apply signed deltas with an atomic upsert (``count = count + delta``), so
+concurrent transactions touching the same bucket never lose updates. Buckets that drop
+to zero orders are left in place; they read as zero spend.
+"""
+
+import uuid
+from collections.abc import Collection, Sequence
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import ColumnElement, Date, cast, delete, func, insert, select, type_coerce
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.buy_order import BuyOrder, OrderStatus
+from app.models.buy_order_item import BuyOrderItem
+from app.models.spend_rollup import SpendRollup
+from app.models.supplier import Supplier
+
+_BUCKET = ("supplier_id", "month", "status")
+
+
+def month_of(timestamp: datetime) -> date:
+    """The rollup month of an order created at ``timestamp`` (naive values are UTC)."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc)
+    return timestamp.date().replace(day=1)
+
+
+def _dialect(session: AsyncSession) -> str:
+    return session.get_bind().dialect.name
+
+
+def _month_expr(dialect: str, column: ColumnElement[datetime]) -> ColumnElement[date]:
+    # The test suite runs on SQLite; everything else is Postgres.
+    if dialect == "sqlite":
+        return type_coerce(func.date(column, "start of month"), Date)
+    return cast(func.date_trunc("month", func.timezone("UTC", column)), Date)
+
+
+def order_delta(
+    order: BuyOrder,
+    *,
+    status: str | None = None,
+    orders: int = 0,
+    lines: int = 0,
+    total: Decimal = Decimal("0"),
+) -> dict[str, Any]:
+    """A rollup delta for ``order``'s bucket (or the same supplier/month in ``status``)."""
+    return {
+        "supplier_id": order.supplier_id,
+        "month": month_of(order.created_at),
+        "status": status or order.status,
+        "order_count": orders,
+        "line_count": lines,
+        "total": total,
+    }
+
+
+class SpendRollupRepository:
+    @staticmethod
+    async def apply(session: AsyncSession, deltas: Sequence[dict[str, Any]]) -> None:
+        """Add ``order_count``/``line_count``/``total`` deltas to their buckets.
+
+        Each delta carries ``supplier_id``, ``month``, ``status`` and all three amounts.
+        """
+        deltas = [d for d in deltas if d["order_count"] or d["line_count"] or d["total"]]
+        if not deltas:
+            return
+        dialect = sqlite if _dialect(session) == "sqlite" else postgresql
+        stmt = dialect.insert(SpendRollup)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=_BUCKET,
+            set_={
+                name: getattr(SpendRollup, name) + getattr(stmt.excluded, name)
+                for name in ("order_count", "line_count", "total")
+            },
+        )
+        await session.execute(stmt, deltas)
+
+    @staticmethod
+    async def rebuild(session: AsyncSession) -> int:
+        """Recompute every bucket from ``buy_orders``; returns the number of buckets."""
+        lines = (
+            select(BuyOrderItem.order_id, func.count().label("lines"))
+            .group_by(BuyOrderItem.order_id)
+            .subquery()
+        )
+        month = _month_expr(_dialect(session), BuyOrder.created_at)
+        source = (
+            select(
+                BuyOrder.supplier_id,
+                month,
+                BuyOrder.status,
+                func.count(),
+                func.coalesce(func.sum(lines.c.lines), 0),
+                func.coalesce(func.sum(BuyOrder.total), 0),
+            )
+            .outerjoin(lines, lines.c.order_id == BuyOrder.id)
+            .group_by(BuyOrder.supplier_id, month, BuyOrder.status)
+        )
+        await session.execute(delete(SpendRollup))
+        await session.execute(
+            insert(SpendRollup).from_select(
+                [*_BUCKET, "order_count", "line_count", "total"], source
+            )
+        )
+        return await session.scalar(select(func.count()).select_from(SpendRollup)) or 0
+
+    @staticmethod
+    async def list_rows(
+        session: AsyncSession,
+        supplier_id: uuid.UUID | None = None,
+        statuses: Collection[OrderStatus] | None = None,
+        month_from: date | None = None,
+        month_to: date | None = None,
+    ) -> list[dict[str, Any]]:
+        stmt = (
+            select(
+                SpendRollup.supplier_id,
+                Supplier.name.label("supplier_name"),
+                SpendRollup.month,
+                SpendRollup.status,
+                SpendRollup.order_count,
+                SpendRollup.line_count,
+                SpendRollup.total,
+            )
+            .join(Supplier, Supplier.id == SpendRollup.supplier_id)
+            .where(SpendRollup.order_count != 0)
+            .order_by(
+                SpendRollup.month, Supplier.name, SpendRollup.supplier_id, SpendRollup.status
+            )
+        )
+        if supplier_id is not None:
+            stmt = stmt.where(SpendRollup.supplier_id == supplier_id)
+        if statuses:
+            stmt = stmt.where(SpendRollup.status.in_(statuses))
+        if month_from is not None:
+            stmt = stmt.where(SpendRollup.month >= month_from.replace(day=1))
+        if month_to is not None:
+            stmt = stmt.where(SpendRollup.month <= month_to.replace(day=1))
+        result = await session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
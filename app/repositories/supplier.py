@@ -1,25 +1,127 @@
 import uuid
+from collections.abc import AsyncIterator, Collection, Sequence
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.models.buy_order import OPEN_STATUSES, BuyOrder
+from app.models.product import Product
 from app.models.supplier import Supplier
 from app.models.supplier_product import SupplierProduct
-from app.schemas.supplier import SupplierCreate, SupplierUpdate
+from app.models.tombstone import SyncResource
+from app.repositories.cache import CacheKind, catalog_cache
+from app.repositories.options import selectin_paths
+from app.repositories.projection import STREAM_BATCH_SIZE, Projection
+from app.repositories.sync import apply_change_window
+from app.repositories.tombstone import TombstoneRepository
+from app.schemas.supplier import SupplierCreate, SupplierResponse, SupplierUpdate
+from app.schemas.sync import ChangeWindow
+
+_LIST_PROJECTION = Projection(SupplierResponse, Supplier)
+
+# Per-row aggregates for ``with_stats`` lists. Correlated on the supplier, so they run only
+# for the rows of the page (index probes on supplier_products' primary key and
+# ix_buy_orders_supplier_id_status) instead of aggregating both tables whole.
+_open_orders = BuyOrder.supplier_id == Supplier.id, BuyOrder.status.in_(OPEN_STATUSES)
+_STATS_COLUMNS = (
+    select(func.count())
+    .where(SupplierProduct.supplier_id == Supplier.id)
+    .scalar_subquery()
+    .label("product_count"),
+    select(func.count()).where(*_open_orders).scalar_subquery().label("open_order_count"),
+    select(func.coalesce(func.sum(BuyOrder.total), 0))
+    .where(*_open_orders)
+    .scalar_subquery()
+    .label("open_order_value"),
+)
+
+
+def _shape_with_stats(rows: Sequence[Sequence[Any]]) -> list[dict[str, Any]]:
+    width = len(_LIST_PROJECTION.columns)
+    out = []
+    for row in rows:
+        product_count, open_order_count, open_order_value = row[width:]
+        shaped = _LIST_PROJECTION.shape(row)
+        shaped["stats"] = {
+            "product_count": product_count,
+            "open_order_count": open_order_count,
+            "open_order_value": open_order_value,
+        }
+        out.append(shaped)
+    return out
 
 
 class SupplierRepository:
     @staticmethod
-    async def get_all(session: AsyncSession, skip: int = 0, limit: int = 20) -> list[Supplier]:
-        result = await session.execute(select(Supplier).offset(skip).limit(limit))
-        return list(result.scalars().all())
+    def _list_stmt(
+        skip: int, limit: int | None, changes: ChangeWindow | None, with_stats: bool = False
+    ) -> Select[Any]:
+        columns = [*_LIST_PROJECTION.columns, *(_STATS_COLUMNS if with_stats else ())]
+        stmt = select(*columns).offset(skip).limit(limit)
+        return apply_change_window(stmt, changes, Supplier.updated_at, (Supplier.id,))
+
+    @staticmethod
+    async def list_rows(
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 20,
+        changes: ChangeWindow | None = None,
+        with_stats: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Column-projected page shaped as ``SupplierResponse`` dicts.
+
+        With ``with_stats`` each row also carries ``stats`` (``SupplierWithStats``), computed
+        in the same query.
+        """
+        stmt = SupplierRepository._list_stmt(skip, limit, changes, with_stats)
+        result = await session.execute(stmt)
+        if with_stats:
+            return _shape_with_stats(result.all())
+        return _LIST_PROJECTION.shape_all(result.all())
+
+    @staticmethod
+    async def stream_rows(
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int | None = None,
+        changes: ChangeWindow | None = None,
+        with_stats: bool = False,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Same rows as :meth:`list_rows`, in batches off a server-side cursor."""
+        stmt = SupplierRepository._list_stmt(skip, limit, changes, with_stats)
+        if not with_stats:
+            async for batch in _LIST_PROJECTION.stream(session, stmt):
+                yield batch
+            return
+        result = await session.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        async for rows in result.partitions():
+            yield _shape_with_stats(rows)
+
+    @staticmethod
+    async def list_rows_by_ids(
+        session: AsyncSession, ids: Collection[uuid.UUID]
+    ) -> list[dict[str, Any]]:
+        """``SupplierResponse`` dicts for whichever of ``ids`` exist, in one query."""
+        stmt = select(*_LIST_PROJECTION.columns).where(Supplier.id.in_(ids))
+        result = await session.execute(stmt)
+        return _LIST_PROJECTION.shape_all(result.all())
 
     @staticmethod
     async def get_by_id(session: AsyncSession, supplier_id: uuid.UUID) -> Supplier | None:
         result = await session.execute(select(Supplier).where(Supplier.id == supplier_id))
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_snapshot(session: AsyncSession, supplier_id: uuid.UUID) -> SupplierResponse | None:
+        """Read-only, cached view of a supplier for existence checks on hot paths."""
+
+        async def load() -> SupplierResponse | None:
+            supplier = await SupplierRepository.get_by_id(session, supplier_id)
+            return None if supplier is None else SupplierResponse.model_validate(supplier)
+
+        return await catalog_cache.get(session, CacheKind.SUPPLIERS, supplier_id, load)
+
     @staticmethod
     async def get_by_name(session: AsyncSession, name: str) -> Supplier | None:
         result = await session.execute(select(Supplier).where(Supplier.name == name))
@@ -27,17 +129,41 @@ class SupplierRepository:
 
     @staticmethod
     async def get_with_products(
-        session: AsyncSession, supplier_id: uuid.UUID
+        session: AsyncSession,
+        supplier_id: uuid.UUID,
+        include: Collection[str] | None = None,
     ) -> Supplier | None:
+        """Load a supplier with the requested relations (default: supplier_products.product)."""
+        if include is None:
+            include = ("supplier_products.product",)
         result = await session.execute(
             select(Supplier)
             .where(Supplier.id == supplier_id)
-            .options(
-                selectinload(Supplier.supplier_products).selectinload(SupplierProduct.product)
-            )
+            .options(*selectin_paths(Supplier, include))
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_version(session: AsyncSession, supplier_id: uuid.UUID) -> Row[Any] | None:
+        """Everything :meth:`get_with_products` renders changes with, in one aggregate row.
+
+        Removing an offer lowers the count; adding or editing one (or its product) moves a
+        max ``updated_at``.
+        """
+        result = await session.execute(
+            select(
+                Supplier.updated_at,
+                func.count(SupplierProduct.product_id),
+                func.max(SupplierProduct.updated_at),
+                func.max(Product.updated_at),
+            )
+            .outerjoin(SupplierProduct, SupplierProduct.supplier_id == Supplier.id)
+            .outerjoin(Product, Product.id == SupplierProduct.product_id)
+            .where(Supplier.id == supplier_id)
+            .group_by(Supplier.id, Supplier.updated_at)
+        )
+        return result.one_or_none()
+
     @staticmethod
     async def create(session: AsyncSession, data: SupplierCreate) -> Supplier:
         supplier = Supplier(**data.model_dump())
@@ -57,5 +183,15 @@ class SupplierRepository:
 
     @staticmethod
     async def delete(session: AsyncSession, supplier: Supplier) -> None:
+        # Offer links go with it (ORM cascade); mirrors need to hear about those too.
+        links = await session.execute(
+            select(SupplierProduct.supplier_id, SupplierProduct.product_id).where(
+                SupplierProduct.supplier_id == supplier.id
+            )
+        )
+        await TombstoneRepository.record(
+            session, SyncResource.SUPPLIER_PRODUCTS, (f"{s}/{p}" for s, p in links.all())
+        )
+        await TombstoneRepository.record(session, SyncResource.SUPPLIERS, [str(supplier.id)])
         await session.delete(supplier)
         await session.flush()
@@ -1,11 +1,31 @@
 import uuid
+from collections.abc import Sequence
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.models.product import Product
+from app.models.supplier import Supplier
 from app.models.supplier_product import SupplierProduct
-from app.schemas.supplier_product import SupplierProductCreate, SupplierProductUpdate
+from app.models.tombstone import SyncResource
+from app.repositories.cache import CacheKind, catalog_cache
+from app.repositories.price_matrix import price_matrix
+from app.repositories.projection import Projection
+from app.repositories.sync import apply_change_window
+from app.repositories.tombstone import TombstoneRepository
+from app.schemas.supplier_product import (
+    SupplierProductCreate,
+    SupplierProductResponse,
+    SupplierProductTerms,
+    SupplierProductUpdate,
+)
+from app.schemas.sync import ChangeWindow
+
+_LIST_PROJECTION = Projection(
+    SupplierProductResponse, SupplierProduct, related={"product": Product}
+)
 
 
 class SupplierProductRepository:
@@ -21,6 +41,29 @@ class SupplierProductRepository:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_terms(
+        session: AsyncSession, supplier_id: uuid.UUID, product_id: uuid.UUID
+    ) -> SupplierProductTerms | None:
+        """Cached minimum quantity / price of an offer, for the order item path.
+
+        Served from the host-wide price matrix when it has a current entry, otherwise
+        from the catalog cache. A change committed by another worker may not be seen for up
+        to ``CATALOG_CACHE_TTL`` when no cache listener is running, so draft subtotals can
+        lag by that much; confirmation re-reads prices from the database.
+        """
+        key = (supplier_id, product_id)
+        if price_matrix.enabled and not catalog_cache.is_dirty(session, CacheKind.OFFERS, key):
+            terms = price_matrix.lookup(supplier_id, product_id)
+            if terms is not None:
+                return terms
+
+        async def load() -> SupplierProductTerms | None:
+            sp = await SupplierProductRepository.get(session, supplier_id, product_id)
+            return None if sp is None else SupplierProductTerms.model_validate(sp)
+
+        return await catalog_cache.get(session, CacheKind.OFFERS, key, load)
+
     @staticmethod
     async def get_all_for_supplier(
         session: AsyncSession, supplier_id: uuid.UUID
@@ -32,6 +75,95 @@ class SupplierProductRepository:
         )
         return list(result.scalars().all())
 
+    @staticmethod
+    async def list_rows(
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 20,
+        changes: ChangeWindow | None = None,
+    ) -> list[dict[str, Any]]:
+        """All supplier offers (any supplier), shaped as ``SupplierProductResponse`` dicts."""
+        stmt = (
+            select(*_LIST_PROJECTION.columns)
+            .join(Product, Product.id == SupplierProduct.product_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        stmt = apply_change_window(
+            stmt,
+            changes,
+            SupplierProduct.updated_at,
+            (SupplierProduct.supplier_id, SupplierProduct.product_id),
+        )
+        result = await session.execute(stmt)
+        return _LIST_PROJECTION.shape_all(result.all())
+
+    @staticmethod
+    async def list_ranked_offers(
+        session: AsyncSession, product_ids: Sequence[uuid.UUID], per_product: int | None = None
+    ) -> dict[uuid.UUID, list[dict[str, Any]]]:
+        """Offers for each existing product, cheapest first, in a single query.
+
+        Products with no offers map to an empty list; unknown ids are absent. On Postgres
+        each product probes ``ix_supplier_products_offer_rank`` through a ``LATERAL``
+        subquery whose ``ORDER BY`` is exactly the index order, so ``per_product`` is a
+        ``LIMIT`` on that probe and bounds the rows read. SQLite (the test suite) has no
+        ``LATERAL``; there the offers are ranked with ``row_number()`` and filtered.
+        """
+        order = (
+            SupplierProduct.unit_price.asc().nulls_last(),
+            SupplierProduct.minimum_quantity,
+            SupplierProduct.supplier_id,
+        )
+        columns = (
+            SupplierProduct.supplier_id,
+            Supplier.name.label("supplier_name"),
+            SupplierProduct.unit_price,
+            SupplierProduct.minimum_quantity,
+            SupplierProduct.optimal_quantity,
+            SupplierProduct.updated_at,
+        )
+        if session.get_bind().dialect.name != "sqlite":
+            offer = (
+                select(*columns)
+                .join(Supplier, Supplier.id == SupplierProduct.supplier_id)
+                .where(SupplierProduct.product_id == Product.id)
+                .order_by(*order)
+                .limit(per_product)
+                .lateral("offer")
+            )
+            stmt = (
+                select(Product.id.label("product_id"), *offer.c)
+                .outerjoin(offer, true())
+                .where(Product.id.in_(product_ids))
+                .order_by(
+                    Product.id,
+                    offer.c.unit_price.asc().nulls_last(),
+                    offer.c.minimum_quantity,
+                    offer.c.supplier_id,
+                )
+            )
+        else:
+            rank = func.row_number().over(partition_by=Product.id, order_by=order).label("rank")
+            ranked = (
+                select(Product.id.label("product_id"), *columns, rank)
+                .outerjoin(SupplierProduct, SupplierProduct.product_id == Product.id)
+                .outerjoin(Supplier, Supplier.id == SupplierProduct.supplier_id)
+                .where(Product.id.in_(product_ids))
+                .subquery()
+            )
+            stmt = select(ranked).order_by(ranked.c.product_id, ranked.c.rank)
+            if per_product is not None:
+                stmt = stmt.where(ranked.c.rank <= per_product)
+        offers: dict[uuid.UUID, list[dict[str, Any]]] = {}
+        for row in (await session.execute(stmt)).mappings():
+            bucket = offers.setdefault(row["product_id"], [])
+            if row["supplier_id"] is not None:  # outer-join filler for a product with none
+                bucket.append(
+                    {k: v for k, v in row.items() if k not in ("product_id", "rank")}
+                )
+        return offers
+
     @staticmethod
     async def create(
         session: AsyncSession, supplier_id: uuid.UUID, data: SupplierProductCreate
@@ -70,5 +202,8 @@ class SupplierProductRepository:
 
     @staticmethod
     async def delete(session: AsyncSession, sp: SupplierProduct) -> None:
+        await TombstoneRepository.record(
+            session, SyncResource.SUPPLIER_PRODUCTS, [f"{sp.supplier_id}/{sp.product_id}"]
+        )
         await session.delete(sp)
         await session.flush()
@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, tuple_
+
+from app.core.config import settings
+from app.schemas.sync import ChangeWindow
+
+
+def apply_change_window(
+    stmt: Select[Any],
+    window: ChangeWindow | None,
+    timestamp: ColumnElement[Any],
+    keys: tuple[ColumnElement[Any], ...],
+) -> Select[Any]:
+    """Restrict ``stmt`` to rows changed inside ``window``, in keyset order.
+
+    Served by the ``(updated_at, <primary key>)`` index on each synced table. Timestamps
+    are taken at flush (or transaction start), not at commit, so a row can become visible
+    after rows stamped later than it. Only rows older than ``SYNC_SETTLE_SECONDS`` are
+    returned: once a cursor moves past an instant, every transaction that stamped rows at
+    that instant has committed (unless it ran longer than the settle time).
+    """
+    if window is None:
+        return stmt
+    settled = datetime.now(timezone.utc) - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+    stmt = stmt.where(timestamp < settled)
+    if window.after is not None:
+        stmt = stmt.where(
+            tuple_(timestamp, *keys) > tuple_(window.after.timestamp, *window.after.keys)
+        )
+    elif window.updated_since is not None:
+        stmt = stmt.where(timestamp >= window.updated_since)
+    return stmt.order_by(timestamp, *keys)
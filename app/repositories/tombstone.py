@@ -0,0 +1,30 @@
+from collections.abc import Iterable
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.tombstone import SyncResource, Tombstone
+from app.repositories.sync import apply_change_window
+from app.schemas.sync import ChangeWindow
+
+
+class TombstoneRepository:
+    @staticmethod
+    async def record(
+        session: AsyncSession, resource: SyncResource, record_ids: Iterable[str]
+    ) -> None:
+        rows = [{"resource": resource.value, "record_id": rid} for rid in record_ids]
+        if rows:
+            await session.execute(insert(Tombstone), rows)
+
+    @staticmethod
+    async def get_all(
+        session: AsyncSession,
+        resource: SyncResource,
+        window: ChangeWindow,
+        limit: int = 100,
+    ) -> list[Tombstone]:
+        stmt = select(Tombstone).where(Tombstone.resource == resource.value).limit(limit)
+        stmt = apply_change_window(stmt, window, Tombstone.deleted_at, (Tombstone.id,))
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
@@ -0,0 +1,30 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class SpendDimension(str, Enum):
+    PRODUCTS = "products"
+    SUPPLIERS = "suppliers"
+
+
+class ABCItem(BaseModel):
+    id: uuid.UUID
+    name: str
+    spend: Decimal
+    share: float
+    # Share of spend of this item and every item ranked above it.
+    cumulative_share: float
+    abc_class: Literal["A", "B", "C"]
+
+
+class ABCResponse(BaseModel):
+    dimension: SpendDimension
+    date_from: date | None
+    date_to: date | None
+    total_spend: Decimal
+    items: list[ABCItem]  # by spend, highest first
@@ -0,0 +1,35 @@
+from typing import Any
+
+from pydantic import BaseModel, Field, model_validator
+
+# Upper bound on operations per /batch call; everything runs in one transaction.
+MAX_BATCH_OPERATIONS = 500
+
+
+class BatchOperation(BaseModel):
+    op: str = Field(..., examples=["order.add_item"])
+    # Optional name later operations use to reference this result ("$<id>.<field>");
+    # results can always be referenced by position as well ("$0.id").
+    id: str | None = Field(default=None, pattern=r"^[A-Za-z_][A-Za-z0-9_-]*$")
+    params: dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    operations: list[BatchOperation] = Field(..., min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+    @model_validator(mode="after")
+    def _unique_ids(self) -> "BatchRequest":
+        ids = [op.id for op in self.operations if op.id is not None]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Operation ids must be unique.")
+        return self
+
+
+class BatchResult(BaseModel):
+    id: str | None
+    op: str
+    result: Any
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchResult]
@@ -0,0 +1,59 @@
+import uuid
+from decimal import Decimal
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from app.models.buy_order import OrderStatus
+
+# Upper bound on lines per cart; all candidate offers are loaded in one query.
+MAX_CART_LINES = 5000
+
+
+class CartLine(BaseModel):
+    product_id: uuid.UUID
+    quantity: float = Field(..., gt=0)
+
+
+class CartOptimizeRequest(BaseModel):
+    lines: list[CartLine] = Field(..., min_length=1, max_length=MAX_CART_LINES)
+    # Fixed cost of placing one order with a supplier (shipping, handling, …).
+    order_cost: Decimal = Field(default=Decimal("0"), ge=0)
+
+
+class ProposedOrderItem(BaseModel):
+    product_id: uuid.UUID
+    requested_quantity: float
+    # Raised to the offer's minimum_quantity when the cart asks for less.
+    quantity: float
+    unit_price: Decimal
+    subtotal: Decimal
+
+
+class ProposedOrder(BaseModel):
+    supplier_id: uuid.UUID
+    supplier_name: str
+    status: OrderStatus = OrderStatus.DRAFT
+    items: list[ProposedOrderItem]
+    items_total: Decimal
+    order_cost: Decimal
+    total: Decimal
+
+
+class UnassignedReason(str, Enum):
+    UNKNOWN_PRODUCT = "unknown_product"
+    NO_PRICED_OFFER = "no_priced_offer"
+
+
+class UnassignedLine(BaseModel):
+    product_id: uuid.UUID
+    quantity: float
+    reason: UnassignedReason
+
+
+class CartPlan(BaseModel):
+    """Cheapest split found for a cart: one proposed DRAFT order per supplier used."""
+
+    orders: list[ProposedOrder]
+    unassigned: list[UnassignedLine]
+    total: Decimal
@@ -1,6 +1,12 @@
-from typing import Literal
+import uuid
+from typing import Generic, Literal, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+# Upper bound on ids per lookup request (query string or body).
+MAX_LOOKUP_IDS = 1000
+
+ItemT = TypeVar("ItemT")
 
 
 class HealthResponse(BaseModel):
@@ -10,6 +16,19 @@ class HealthResponse(BaseModel):
     database: Literal["ok", "unavailable"]
 
 
+class PoolStatusResponse(BaseModel):
+    pid: int
+    size: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    acquisitions: int
+    timeouts: int
+    wait_total_ms: float
+    wait_max_ms: float
+    wait_peak_ms: float
+
+
 class ErrorDetail(BaseModel):
     code: str
     message: str
@@ -17,3 +36,14 @@ class ErrorDetail(BaseModel):
 
 class ErrorResponse(BaseModel):
     error: ErrorDetail
+
+
+class LookupRequest(BaseModel):
+    ids: list[uuid.UUID] = Field(..., min_length=1, max_length=MAX_LOOKUP_IDS)
+
+
+class LookupResponse(BaseModel, Generic[ItemT]):
+    """Rows found for a batch of ids (in request order) plus the ids that were not found."""
+
+    items: list[ItemT]
+    missing: list[uuid.UUID]
@@ -0,0 +1,24 @@
+import uuid
+from datetime import date, datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ForecastRunResult(BaseModel):
+    as_of: date
+    products: int
+
+
+class ProductForecastResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    product_id: uuid.UUID
+    as_of: date
+    period_days: int
+    history_periods: int
+    moving_average: float
+    smoothed: float
+    seasonal_index: float | None
+    # Expected demand in the period starting at as_of.
+    forecast: float
+    computed_at: datetime
@@ -0,0 +1,109 @@
+import base64
+import binascii
+import json
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from typing import Any
+
+from app.core.exceptions import ValidationError
+from app.models.buy_order import OrderStatus
+from app.schemas.sync import NEXT_CURSOR_HEADER
+
+MAX_SEARCH_PAGE_SIZE = 500
+
+
+class OrderSort(str, Enum):
+    CREATED_AT = "created_at"
+    CREATED_AT_DESC = "-created_at"
+    TOTAL = "total"
+    TOTAL_DESC = "-total"
+
+    @property
+    def field(self) -> str:
+        return self.value.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
+
+
+@dataclass(frozen=True)
+class OrderSearch:
+    """Filters for ``GET /orders/search``; every one that is set must match.
+
+    ``created_from`` is inclusive and ``created_to`` exclusive; the total bounds are both
+    inclusive. ``notes`` matches case-insensitively anywhere in the order notes. Naive
+    datetimes are taken as UTC.
+    """
+
+    supplier_id: uuid.UUID | None = None
+    statuses: tuple[OrderStatus, ...] = ()
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    total_min: Decimal | None = None
+    total_max: Decimal | None = None
+    product_id: uuid.UUID | None = None
+    notes: str | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("created_from", "created_to"):
+            value = getattr(self, name)
+            if value is not None:
+                utc = value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+                object.__setattr__(self, name, utc.astimezone(timezone.utc))
+        if (
+            self.created_from is not None
+            and self.created_to is not None
+            and self.created_from >= self.created_to
+        ):
+            raise ValidationError("created_from must be before created_to.")
+        if (
+            self.total_min is not None
+            and self.total_max is not None
+            and self.total_min > self.total_max
+        ):
+            raise ValidationError("total_min must not exceed total_max.")
+
+
+@dataclass(frozen=True)
+class OrderSearchCursor:
+    """Position after the last row of a search page: its sort value plus its id.
+
+    Only valid for the sort it was issued under.
+    """
+
+    sort: OrderSort
+    value: datetime | Decimal
+    id: uuid.UUID
+
+    def encode(self) -> str:
+        value = self.value.isoformat() if isinstance(self.value, datetime) else str(self.value)
+        raw = json.dumps([self.sort.value, value, str(self.id)])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str, sort: OrderSort) -> "OrderSearchCursor":
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            issued_for, value, key = raw
+            parse = datetime.fromisoformat if sort.field == "created_at" else Decimal
+            cursor = cls(OrderSort(issued_for), parse(value), uuid.UUID(key))
+        except (binascii.Error, InvalidOperation, ValueError, TypeError) as exc:
+            raise ValidationError("Invalid search cursor.") from exc
+        if cursor.sort is not sort:
+            raise ValidationError("Search cursor was issued for a different sort.")
+        return cursor
+
+    @classmethod
+    def page_headers(
+        cls, rows: Sequence[dict[str, Any]], sort: OrderSort, limit: int
+    ) -> dict[str, str]:
+        """``X-Next-Cursor`` after a full page; no header means there is nothing more."""
+        if not rows or len(rows) < limit:
+            return {}
+        last = rows[-1]
+        return {NEXT_CURSOR_HEADER: cls(sort, last[sort.field], last["id"]).encode()}
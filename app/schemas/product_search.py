@@ -0,0 +1,55 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.exceptions import ValidationError
+from app.schemas.product import ProductResponse
+from app.schemas.sync import NEXT_CURSOR_HEADER
+
+MAX_PRODUCT_SEARCH_PAGE_SIZE = 100
+# Shorter queries only match SKU and name prefixes; trigrams need three characters.
+TRIGRAM_MIN_LENGTH = 3
+
+
+class ProductSearchHit(ProductResponse):
+    """A search result; higher ``score`` ranks first (SKU matches, then name, then description)."""
+
+    score: int
+
+
+@dataclass(frozen=True)
+class ProductSearchCursor:
+    """Position after the last hit of a page: its score and SKU (unique), for query ``q``."""
+
+    q: str
+    score: int
+    sku: str
+
+    def encode(self) -> str:
+        raw = json.dumps([self.q, self.score, self.sku])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str, q: str) -> "ProductSearchCursor":
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            issued_for, score, sku = raw
+            cursor = cls(str(issued_for), int(score), str(sku))
+        except (binascii.Error, ValueError, TypeError) as exc:
+            raise ValidationError("Invalid search cursor.") from exc
+        if cursor.q != q:
+            raise ValidationError("Search cursor was issued for a different query.")
+        return cursor
+
+    @classmethod
+    def page_headers(
+        cls, rows: Sequence[dict[str, Any]], q: str, limit: int
+    ) -> dict[str, str]:
+        """``X-Next-Cursor`` after a full page; no header means there is nothing more."""
+        if not rows or len(rows) < limit:
+            return {}
+        last = rows[-1]
+        return {NEXT_CURSOR_HEADER: cls(q, last["score"], last["sku"]).encode()}
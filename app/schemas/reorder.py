@@ -0,0 +1,37 @@
+import uuid
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+
+class ReorderSuggestion(BaseModel):
+    """What to order for one product from its preferred (cheapest) supplier."""
+
+    product_id: uuid.UUID
+    sku: str
+    stock: float
+    # Quantity on DRAFT, CONFIRMED and SENT orders, not received yet.
+    on_order: float
+    supplier_id: uuid.UUID
+    unit_price: Decimal | None
+    minimum_quantity: float
+    optimal_quantity: float
+    quantity: float
+
+
+class ReorderRequest(BaseModel):
+    # Only order from this supplier (products it is preferred for); all suppliers if unset.
+    supplier_id: uuid.UUID | None = None
+    notes: str | None = Field(default=None, max_length=1000)
+
+
+class ReorderedOrder(BaseModel):
+    id: uuid.UUID
+    supplier_id: uuid.UUID
+    items: int
+    total: Decimal
+
+
+class ReorderResult(BaseModel):
+    orders: list[ReorderedOrder]
+    items: int
@@ -0,0 +1,17 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from app.models.buy_order import OrderStatus
+
+
+class SpendRollupResponse(BaseModel):
+    supplier_id: uuid.UUID
+    supplier_name: str
+    month: date  # first day of the month orders were created in (UTC)
+    status: OrderStatus
+    order_count: int
+    line_count: int
+    total: Decimal
@@ -0,0 +1,131 @@
+import types
+from dataclasses import dataclass
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from app.core.exceptions import ValidationError
+
+# Always returned, even when ?fields= omits it, so clients can key the payload.
+ALWAYS_INCLUDED = frozenset({"id"})
+
+
+def nested_model(annotation: Any) -> type[BaseModel] | None:
+    """The BaseModel behind ``Model``, ``list[Model]`` or ``Model | None``, if any."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    if get_origin(annotation) in (list, Union, types.UnionType):
+        for arg in get_args(annotation):
+            nested = nested_model(arg)
+            if nested is not None:
+                return nested
+    return None
+
+
+def relation_paths(schema: type[BaseModel], prefix: str = "") -> frozenset[str]:
+    """Dotted paths of every nested schema, e.g. ``items`` and ``items.product``."""
+    paths: set[str] = set()
+    for name, info in schema.model_fields.items():
+        nested = nested_model(info.annotation)
+        if nested is not None:
+            path = f"{prefix}{name}"
+            paths.add(path)
+            paths |= relation_paths(nested, prefix=f"{path}.")
+    return frozenset(paths)
+
+
+def _split(raw: str | None) -> list[str] | None:
+    if raw is None:
+        return None
+    return [part.strip() for part in raw.split(",") if part.strip()]
+
+
+@dataclass(frozen=True)
+class Fieldset:
+    """Parsed ``?fields=`` / ``?include=`` selection for one response schema.
+
+    ``fields`` restricts the top-level attributes (``None`` = all). ``include`` is the set
+    of relation paths to load and render; it defaults to every relation, or to the
+    relations named in ``fields`` when only ``fields`` is given.
+    """
+
+    schema: type[BaseModel]
+    fields: frozenset[str] | None
+    include: frozenset[str]
+
+    @classmethod
+    def parse(
+        cls, schema: type[BaseModel], fields: str | None = None, include: str | None = None
+    ) -> "Fieldset":
+        all_paths = relation_paths(schema)
+
+        requested_fields = _split(fields)
+        field_set: frozenset[str] | None = None
+        if requested_fields is not None:
+            unknown = set(requested_fields) - set(schema.model_fields)
+            if unknown:
+                raise ValidationError(f"Unknown field(s): {', '.join(sorted(unknown))}.")
+            field_set = frozenset(requested_fields) | ALWAYS_INCLUDED
+
+        requested_include = _split(include)
+        if requested_include is None:
+            include_set = all_paths
+            if field_set is not None:
+                include_set = frozenset(p for p in all_paths if p.split(".")[0] in field_set)
+        else:
+            unknown = set(requested_include) - all_paths
+            if unknown:
+                raise ValidationError(
+                    f"Unknown include path(s): {', '.join(sorted(unknown))}. "
+                    f"Allowed: {', '.join(sorted(all_paths))}."
+                )
+            # "items.product" implies "items"
+            parents = {
+                ".".join(p.split(".")[:i])
+                for p in requested_include
+                for i in range(1, p.count(".") + 1)
+            }
+            include_set = frozenset(requested_include) | parents
+
+        return cls(schema=schema, fields=field_set, include=include_set)
+
+    @property
+    def key(self) -> tuple[tuple[str, ...] | None, tuple[str, ...]]:
+        """Hashable, order-independent identity of the selection (for ETags and cache keys)."""
+        fields = None if self.fields is None else tuple(sorted(self.fields))
+        return fields, tuple(sorted(self.include))
+
+    @property
+    def is_full(self) -> bool:
+        return self.fields is None and self.include == relation_paths(self.schema)
+
+    def dump(self, obj: Any) -> dict[str, Any]:
+        return _dump(self.schema, obj, self.include, self.fields)
+
+
+def _dump(
+    schema: type[BaseModel], obj: Any, include: frozenset[str], fields: frozenset[str] | None
+) -> dict[str, Any]:
+    # Only touches requested attributes, so relations that were not eager-loaded are
+    # never accessed (and never lazy-load).
+    out: dict[str, Any] = {}
+    for name, info in schema.model_fields.items():
+        if fields is not None and name not in fields:
+            continue
+        nested = nested_model(info.annotation)
+        if nested is None:
+            out[name] = getattr(obj, name)
+            continue
+        if name not in include:
+            continue
+        child_include = frozenset(
+            p[len(name) + 1 :] for p in include if p.startswith(f"{name}.")
+        )
+        value = getattr(obj, name)
+        if value is None:
+            out[name] = None
+        elif isinstance(value, list):
+            out[name] = [_dump(nested, v, child_include, None) for v in value]
+        else:
+            out[name] = _dump(nested, value, child_include, None)
+    return out
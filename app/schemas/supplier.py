@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from decimal import Decimal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -32,5 +33,17 @@ class SupplierResponse(SupplierBase):
     updated_at: datetime
 
 
+class SupplierStats(BaseModel):
+    product_count: int
+    open_order_count: int
+    open_order_value: Decimal
+
+
+class SupplierWithStats(SupplierResponse):
+    """List row for ``GET /suppliers?with_stats=true``; open orders are DRAFT/CONFIRMED/SENT."""
+
+    stats: SupplierStats
+
+
 class SupplierWithProducts(SupplierResponse):
     supplier_products: list[SupplierProductResponse] = []
@@ -4,8 +4,12 @@ from decimal import Decimal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.common import LookupRequest
 from app.schemas.product import ProductResponse
 
+# Upper bound on offers returned per product by the bulk offers endpoints.
+MAX_OFFERS_PER_PRODUCT = 100
+
 
 class SupplierProductCreate(BaseModel):
     product_id: uuid.UUID
@@ -31,3 +35,34 @@ class SupplierProductResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     product: ProductResponse
+
+
+class SupplierProductTerms(BaseModel):
+    """Ordering terms of one offer; an immutable snapshot safe to share across sessions."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    minimum_quantity: float
+    optimal_quantity: float
+    unit_price: Decimal | None
+
+
+class ProductOffer(BaseModel):
+    """One supplier's offer for a product, as ranked by price."""
+
+    supplier_id: uuid.UUID
+    supplier_name: str
+    unit_price: Decimal | None
+    minimum_quantity: float
+    optimal_quantity: float
+    updated_at: datetime
+
+
+class ProductOffers(BaseModel):
+    product_id: uuid.UUID
+    # Cheapest first (ties: lower minimum quantity); offers without a price come last.
+    offers: list[ProductOffer]
+
+
+class ProductOffersRequest(LookupRequest):
+    per_product: int = Field(default=1, ge=1, le=MAX_OFFERS_PER_PRODUCT)
@@ -0,0 +1,81 @@
+import base64
+import binascii
+import json
+import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+from app.core.exceptions import ValidationError
+from app.models.tombstone import SyncResource
+
+# Response header carrying the cursor for the next page of an incremental sync.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _value(row: Any, name: str) -> Any:
+    return row[name] if isinstance(row, Mapping) else getattr(row, name)
+
+
+@dataclass(frozen=True)
+class SyncCursor:
+    """Position after the last row returned: its timestamp plus its primary key."""
+
+    timestamp: datetime
+    keys: tuple[uuid.UUID, ...]
+
+    def encode(self) -> str:
+        raw = json.dumps([self.timestamp.isoformat(), *map(str, self.keys)])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SyncCursor":
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            return cls(datetime.fromisoformat(raw[0]), tuple(uuid.UUID(k) for k in raw[1:]))
+        except (binascii.Error, ValueError, TypeError, IndexError) as exc:
+            raise ValidationError("Invalid sync cursor.") from exc
+
+
+@dataclass(frozen=True)
+class ChangeWindow:
+    """``?updated_since=`` / ``?cursor=`` selection for incremental sync.
+
+    Rows come back ordered by ``(timestamp, primary key)``; a cursor resumes strictly
+    after the last row of the previous page, so pages never overlap or skip ties. Rows
+    newer than ``SYNC_SETTLE_SECONDS`` are held back until they settle.
+    """
+
+    updated_since: datetime | None = None
+    after: SyncCursor | None = None
+
+    def page_headers(
+        self,
+        rows: Sequence[Any],
+        timestamp: str = "updated_at",
+        keys: Sequence[str] = ("id",),
+    ) -> dict[str, str]:
+        """``X-Next-Cursor`` for the page just read (dicts or ORM rows).
+
+        Echoes the incoming cursor on an empty page, so clients always have a resume point.
+        """
+        if rows:
+            last = rows[-1]
+            cursor = SyncCursor(_value(last, timestamp), tuple(_value(last, k) for k in keys))
+        elif self.after is not None:
+            cursor = self.after
+        else:
+            return {}
+        return {NEXT_CURSOR_HEADER: cursor.encode()}
+
+
+class TombstoneResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    resource: SyncResource
+    record_id: str
+    deleted_at: datetime
@@ -0,0 +1,125 @@
+"""Spend analytics over committed order lines, cached per window.
+
+Results are cached per process for ``ANALYTICS_CACHE_TTL`` seconds. Spend only changes
+when an order enters or leaves the committed statuses, so committing a status transition
+clears this worker's cache, and on Postgres sends :data:`SPEND_CHANGED_PAYLOAD` on the
+catalog cache channel so every listening worker clears theirs. Workers without a listener
+catch up within the TTL.
+"""
+
+from collections.abc import Hashable, Sequence
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from itertools import accumulate
+from typing import Any
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.exceptions import ValidationError
+from app.repositories.analytics import AnalyticsRepository
+from app.repositories.cache import NOTIFY_CHANNEL
+from app.schemas.analytics import SpendDimension
+
+_SPEND_CHANGED = "analytics_spend_changed"
+# Notification payload asking every worker to drop its cached analytics.
+SPEND_CHANGED_PAYLOAD = "spend"
+
+abc_cache: TTLCache[Hashable, dict[str, Any]] = TTLCache(
+    settings.ANALYTICS_CACHE_SIZE, settings.ANALYTICS_CACHE_TTL
+)
+
+
+async def mark_spend_changed(db: AsyncSession) -> None:
+    """Drop cached analytics in every worker once ``db`` commits (an order's status moved)."""
+    db.sync_session.info[_SPEND_CHANGED] = True
+    if db.get_bind().dialect.name == "postgresql":
+        # Transactional: only delivered if and when ``db`` commits, and once per transaction.
+        await db.execute(select(func.pg_notify(NOTIFY_CHANNEL, SPEND_CHANGED_PAYLOAD)))
+
+
+def _after_commit(session: Session) -> None:
+    if session.info.pop(_SPEND_CHANGED, False):
+        abc_cache.clear()
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_SPEND_CHANGED, None)
+
+
+event.listen(Session, "after_commit", _after_commit)
+event.listen(Session, "after_rollback", _after_rollback)
+
+
+def _day_start(day: date | None) -> datetime | None:
+    return None if day is None else datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def classify_abc(
+    rows: Sequence[Sequence[Any]], a_share: float, b_share: float
+) -> tuple[Decimal, list[dict[str, Any]]]:
+    """Rank ``(id, name, spend)`` rows by spend and label them A, B or C.
+
+    An item is A while the spend ranked above it is below ``a_share`` of the total, so the
+    item that crosses the line is still A; likewise for B. Returns the total and the items.
+    """
+    ranked = sorted(rows, key=lambda row: row[2], reverse=True)
+    spends = [row[2] for row in ranked]
+    total = sum(spends, Decimal("0"))
+    if not total:
+        return total, []
+    cumulative = list(accumulate(spends))
+    items = []
+    for (id_, name, spend), running in zip(ranked, cumulative, strict=True):
+        share_before = float((running - spend) / total)
+        if share_before < a_share:
+            abc_class = "A"
+        elif share_before < b_share:
+            abc_class = "B"
+        else:
+            abc_class = "C"
+        items.append(
+            {
+                "id": id_,
+                "name": name,
+                "spend": spend,
+                "share": float(spend / total),
+                "cumulative_share": float(running / total),
+                "abc_class": abc_class,
+            }
+        )
+    return total, items
+
+
+class AnalyticsService:
+    @staticmethod
+    async def abc(
+        db: AsyncSession,
+        dimension: SpendDimension,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        a_share: float = 0.8,
+        b_share: float = 0.95,
+    ) -> dict[str, Any]:
+        """ABC classification of products or suppliers by committed spend in a window."""
+        if not 0 < a_share <= b_share <= 1:
+            raise ValidationError("Expected 0 < a_share <= b_share <= 1.")
+
+        async def load() -> dict[str, Any]:
+            rows = await AnalyticsRepository.spend_by(
+                db, dimension, _day_start(date_from), _day_start(date_to)
+            )
+            total, items = classify_abc(rows, a_share, b_share)
+            return {
+                "dimension": dimension,
+                "date_from": date_from,
+                "date_to": date_to,
+                "total_spend": total,
+                "items": items,
+            }
+
+        key = ("abc", dimension, date_from, date_to, a_share, b_share)
+        return await abc_cache.get_or_load(key, load)  # type: ignore[return-value]
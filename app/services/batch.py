@@ -0,0 +1,179 @@
+"""Ordered, all-or-nothing execution of service calls for ``POST /batch``.
+
+Each operation maps onto an existing service method; results are rendered with the same
+response schemas as the single-resource endpoints. Parameters may reference earlier
+results with ``"$<id or index>.<field>"`` (e.g. ``"$supplier.id"`` or ``"$0.id"``).
+"""
+
+import re
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import AppException, ConflictError, ValidationError
+from app.core.responses import dump_model
+from app.schemas.batch import BatchOperation
+from app.schemas.buy_order import (
+    BuyOrderCreate,
+    BuyOrderItemCreate,
+    BuyOrderItemResponse,
+    BuyOrderItemUpdate,
+    BuyOrderResponse,
+    BuyOrderStatusUpdate,
+    BuyOrderUpdate,
+    BuyOrderWithItems,
+)
+from app.schemas.product import ProductCreate, ProductResponse, ProductUpdate
+from app.schemas.supplier import SupplierCreate, SupplierResponse, SupplierUpdate
+from app.schemas.supplier_product import (
+    SupplierProductCreate,
+    SupplierProductResponse,
+    SupplierProductUpdate,
+)
+from app.services.buy_order import BuyOrderService
+from app.services.product import ProductService
+from app.services.supplier import SupplierService
+
+_REFERENCE = re.compile(r"^\$([A-Za-z0-9_-]+)((?:\.[A-Za-z0-9_]+)*)$")
+
+
+@dataclass(frozen=True)
+class _Operation:
+    # Called as handler(db, *keys, body) — the same shape as the service methods.
+    handler: Callable[..., Awaitable[Any]]
+    body: type[BaseModel] | None = None
+    response: Any = None
+    keys: tuple[str, ...] = ()
+
+
+async def _transition(db: AsyncSession, order_id: uuid.UUID, body: BuyOrderStatusUpdate) -> Any:
+    return await BuyOrderService.transition_status(db, order_id, body.status)
+
+
+OPERATIONS: dict[str, _Operation] = {
+    "supplier.create": _Operation(SupplierService.create_supplier, SupplierCreate, SupplierResponse),
+    "supplier.update": _Operation(
+        SupplierService.update_supplier, SupplierUpdate, SupplierResponse, ("supplier_id",)
+    ),
+    "supplier.delete": _Operation(SupplierService.delete_supplier, keys=("supplier_id",)),
+    "supplier.add_product": _Operation(
+        SupplierService.add_product_to_supplier,
+        SupplierProductCreate,
+        SupplierProductResponse,
+        ("supplier_id",),
+    ),
+    "supplier.update_product": _Operation(
+        SupplierService.update_supplier_product,
+        SupplierProductUpdate,
+        SupplierProductResponse,
+        ("supplier_id", "product_id"),
+    ),
+    "supplier.remove_product": _Operation(
+        SupplierService.remove_product_from_supplier, keys=("supplier_id", "product_id")
+    ),
+    "product.create": _Operation(ProductService.create_product, ProductCreate, ProductResponse),
+    "product.update": _Operation(
+        ProductService.update_product, ProductUpdate, ProductResponse, ("product_id",)
+    ),
+    "product.delete": _Operation(ProductService.delete_product, keys=("product_id",)),
+    "order.create": _Operation(BuyOrderService.create_order, BuyOrderCreate, BuyOrderResponse),
+    "order.update": _Operation(
+        BuyOrderService.update_order, BuyOrderUpdate, BuyOrderResponse, ("order_id",)
+    ),
+    "order.delete": _Operation(BuyOrderService.delete_order, keys=("order_id",)),
+    "order.transition": _Operation(
+        _transition, BuyOrderStatusUpdate, BuyOrderWithItems, ("order_id",)
+    ),
+    "order.add_item": _Operation(
+        BuyOrderService.add_item, BuyOrderItemCreate, BuyOrderItemResponse, ("order_id",)
+    ),
+    "order.update_item": _Operation(
+        BuyOrderService.update_item,
+        BuyOrderItemUpdate,
+        BuyOrderItemResponse,
+        ("order_id", "product_id"),
+    ),
+    "order.remove_item": _Operation(
+        BuyOrderService.remove_item, keys=("order_id", "product_id")
+    ),
+}
+
+
+def _lookup(value: Any, path: list[str], raw: str) -> Any:
+    for part in path:
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            raise ValidationError(f"Reference '{raw}' does not resolve.")
+    return value
+
+
+def _resolve(value: Any, results: dict[str, Any]) -> Any:
+    if isinstance(value, str) and (match := _REFERENCE.match(value)):
+        name, path = match.group(1), match.group(2)
+        if name not in results:
+            raise ValidationError(f"Reference '{value}' points at an unknown or later operation.")
+        return _lookup(results[name], path.split(".")[1:], value)
+    if isinstance(value, dict):
+        return {k: _resolve(v, results) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve(v, results) for v in value]
+    return value
+
+
+async def _run_one(db: AsyncSession, operation: BatchOperation, params: dict[str, Any]) -> Any:
+    spec = OPERATIONS.get(operation.op)
+    if spec is None:
+        raise ValidationError(
+            f"Unknown operation '{operation.op}'. Allowed: {', '.join(sorted(OPERATIONS))}."
+        )
+    try:
+        keys = [uuid.UUID(str(params.pop(key))) for key in spec.keys]
+        args: list[Any] = [*keys]
+        if spec.body is not None:
+            args.append(spec.body.model_validate(params))
+    except KeyError as exc:
+        raise ValidationError(f"Missing parameter {exc}.") from exc
+    except (ValueError, PydanticValidationError) as exc:
+        raise ValidationError(f"Invalid parameters: {exc}") from exc
+    result = await spec.handler(db, *args)
+    return None if spec.response is None else dump_model(spec.response, result)
+
+
+class BatchService:
+    @staticmethod
+    async def run(db: AsyncSession, operations: list[BatchOperation]) -> list[dict[str, Any]]:
+        """Run ``operations`` in order on one session.
+
+        The first failure aborts the batch; the caller's transaction is rolled back, so no
+        partial effects are committed. Error messages are prefixed with the operation index.
+        A constraint violation the service checks did not catch (e.g. a concurrent insert of
+        the same SKU) is reported as a conflict of the operation that hit it.
+        """
+        results: dict[str, Any] = {}
+        out: list[dict[str, Any]] = []
+        for index, operation in enumerate(operations):
+            try:
+                params = _resolve(operation.params, results)
+                result = await _run_one(db, operation, params)
+            except AppException as exc:
+                exc.message = f"operations[{index}] ({operation.op}): {exc.message}"
+                raise
+            except IntegrityError as exc:
+                await db.rollback()
+                raise ConflictError(
+                    f"operations[{index}] ({operation.op}): conflicts with existing data."
+                ) from exc
+            results[str(index)] = result
+            if operation.id is not None:
+                results[operation.id] = result
+            out.append({"id": operation.id, "op": operation.op, "result": result})
+        return out
@@ -1,13 +1,19 @@
 import uuid
+from collections.abc import AsyncIterator, Collection, Sequence
 from decimal import Decimal
+from typing import Any
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ConflictError, NotFoundError, ValidationError
+from app.core.responses import make_etag
 from app.models.buy_order import ALLOWED_TRANSITIONS, BuyOrder, OrderStatus
 from app.models.buy_order_item import BuyOrderItem
 from app.repositories.buy_order import BuyOrderRepository
 from app.repositories.buy_order_item import BuyOrderItemRepository
+from app.repositories.cache import CacheKind, catalog_cache
+from app.repositories.spend import SpendRollupRepository, order_delta
 from app.repositories.supplier import SupplierRepository
 from app.repositories.supplier_product import SupplierProductRepository
 from app.schemas.buy_order import (
@@ -16,6 +22,11 @@ from app.schemas.buy_order import (
     BuyOrderItemUpdate,
     BuyOrderUpdate,
 )
+from app.schemas.order_search import OrderSearch, OrderSearchCursor, OrderSort
+from app.schemas.sparse import Fieldset
+from app.schemas.sync import ChangeWindow
+from app.services.analytics import mark_spend_changed
+from app.services.lookup import lookup_result
 
 
 class BuyOrderService:
@@ -28,11 +39,42 @@ class BuyOrderService:
         limit: int = 20,
         supplier_id: uuid.UUID | None = None,
         status: OrderStatus | None = None,
-    ) -> list[BuyOrder]:
-        return await BuyOrderRepository.get_all(
-            db, skip=skip, limit=limit, supplier_id=supplier_id, status=status
+        changes: ChangeWindow | None = None,
+    ) -> list[dict[str, Any]]:
+        return await BuyOrderRepository.list_rows(
+            db, skip=skip, limit=limit, supplier_id=supplier_id, status=status, changes=changes
         )
 
+    @staticmethod
+    def stream_orders(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int | None = None,
+        supplier_id: uuid.UUID | None = None,
+        status: OrderStatus | None = None,
+        changes: ChangeWindow | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        return BuyOrderRepository.stream_rows(
+            db, skip=skip, limit=limit, supplier_id=supplier_id, status=status, changes=changes
+        )
+
+    @staticmethod
+    async def search_orders(
+        db: AsyncSession,
+        search: OrderSearch,
+        sort: OrderSort = OrderSort.CREATED_AT_DESC,
+        cursor: str | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        after = OrderSearchCursor.decode(cursor, sort) if cursor is not None else None
+        return await BuyOrderRepository.search_rows(
+            db, search, sort=sort, after=after, limit=limit
+        )
+
+    @staticmethod
+    async def lookup_orders(db: AsyncSession, ids: Sequence[uuid.UUID]) -> dict[str, Any]:
+        return lookup_result(await BuyOrderRepository.list_rows_by_ids(db, ids), ids)
+
     @staticmethod
     async def get_order(db: AsyncSession, order_id: uuid.UUID) -> BuyOrder:
         order = await BuyOrderRepository.get_by_id(db, order_id)
@@ -41,18 +83,38 @@ class BuyOrderService:
         return order
 
     @staticmethod
-    async def get_order_with_items(db: AsyncSession, order_id: uuid.UUID) -> BuyOrder:
-        order = await BuyOrderRepository.get_with_items(db, order_id)
+    async def get_order_with_items(
+        db: AsyncSession, order_id: uuid.UUID, include: Collection[str] | None = None
+    ) -> BuyOrder:
+        order = await BuyOrderRepository.get_with_items(db, order_id, include=include)
         if order is None:
             raise NotFoundError("BuyOrder", str(order_id))
         return order
 
+    @staticmethod
+    async def get_order_etag(db: AsyncSession, order_id: uuid.UUID, fieldset: Fieldset) -> str:
+        """ETag of the ``GET /orders/{id}`` representation, without loading it."""
+        version = await BuyOrderRepository.get_version(db, order_id)
+        if version is None:
+            raise NotFoundError("BuyOrder", str(order_id))
+        return make_etag(*version, fieldset.key)
+
     @staticmethod
     async def create_order(db: AsyncSession, data: BuyOrderCreate) -> BuyOrder:
-        supplier = await SupplierRepository.get_by_id(db, data.supplier_id)
+        supplier = await SupplierRepository.get_snapshot(db, data.supplier_id)
         if supplier is None:
             raise NotFoundError("Supplier", str(data.supplier_id))
-        return await BuyOrderRepository.create(db, data)
+        try:
+            order = await BuyOrderRepository.create(db, data)
+        except IntegrityError as exc:
+            # The cached snapshot outlived a supplier deleted elsewhere: the foreign key
+            # has the final say. Evict the entry so the next lookup sees it is gone.
+            await db.rollback()
+            catalog_cache.invalidate(db, CacheKind.SUPPLIERS, data.supplier_id)
+            await catalog_cache.invalidate_shared(db)
+            raise NotFoundError("Supplier", str(data.supplier_id)) from exc
+        await SpendRollupRepository.apply(db, [order_delta(order, orders=1)])
+        return order
 
     @staticmethod
     async def update_order(
@@ -72,6 +134,10 @@ class BuyOrderService:
             raise ValidationError(
                 f"Only DRAFT orders can be deleted. Current status: '{order.status}'."
             )
+        lines = len(await BuyOrderItemRepository.get_all_for_order(db, order_id))
+        await SpendRollupRepository.apply(
+            db, [order_delta(order, orders=-1, lines=-lines, total=-order.total)]
+        )
         await BuyOrderRepository.delete(db, order)
 
     @staticmethod
@@ -88,9 +154,12 @@ class BuyOrderService:
                 f"Cannot transition from '{order.status}' to '{new_status}'."
             )
 
+        old_status, old_total = order.status, order.total
+
         # On DRAFT → CONFIRMED: snapshot prices and freeze subtotals
         if order.status == OrderStatus.DRAFT and new_status == OrderStatus.CONFIRMED:
             for item in order.items:
+                # Straight from the database, not the catalog cache: this price is frozen.
                 sp = await SupplierProductRepository.get(db, order.supplier_id, item.product_id)
                 snapshot_price = sp.unit_price if sp is not None else None
                 item.unit_price = snapshot_price
@@ -102,6 +171,15 @@ class BuyOrderService:
         order.status = new_status
         db.add(order)
         await db.flush()
+        await mark_spend_changed(db)
+        lines = len(order.items)
+        await SpendRollupRepository.apply(
+            db,
+            [
+                order_delta(order, status=old_status, orders=-1, lines=-lines, total=-old_total),
+                order_delta(order, orders=1, lines=lines, total=order.total),
+            ],
+        )
 
         return await BuyOrderRepository.get_with_items(db, order_id)  # type: ignore[return-value]
 
@@ -114,6 +192,15 @@ class BuyOrderService:
                 f"Items can only be modified on DRAFT orders. Current status: '{order.status}'."
             )
 
+    @staticmethod
+    async def _recalculate_total(db: AsyncSession, order: BuyOrder, lines: int = 0) -> None:
+        """Refresh the order total and move its spend rollup by the change."""
+        old_total = order.total
+        await BuyOrderRepository.recalculate_total(db, order)
+        await SpendRollupRepository.apply(
+            db, [order_delta(order, lines=lines, total=order.total - old_total)]
+        )
+
     @staticmethod
     async def add_item(
         db: AsyncSession, order_id: uuid.UUID, data: BuyOrderItemCreate
@@ -121,7 +208,7 @@ class BuyOrderService:
         order = await BuyOrderService.get_order(db, order_id)
         await BuyOrderService._assert_draft(order)
 
-        sp = await SupplierProductRepository.get(db, order.supplier_id, data.product_id)
+        sp = await SupplierProductRepository.get_terms(db, order.supplier_id, data.product_id)
         if sp is None:
             raise NotFoundError(
                 "SupplierProduct",
@@ -144,7 +231,7 @@ class BuyOrderService:
         item = await BuyOrderItemRepository.create(
             db, order_id, data.product_id, data.quantity, subtotal
         )
-        await BuyOrderRepository.recalculate_total(db, order)
+        await BuyOrderService._recalculate_total(db, order, lines=1)
         return item
 
     @staticmethod
@@ -161,7 +248,7 @@ class BuyOrderService:
         if item is None:
             raise NotFoundError("BuyOrderItem", f"{order_id}/{product_id}")
 
-        sp = await SupplierProductRepository.get(db, order.supplier_id, product_id)
+        sp = await SupplierProductRepository.get_terms(db, order.supplier_id, product_id)
         if sp is None:
             raise NotFoundError(
                 "SupplierProduct",
@@ -178,7 +265,7 @@ class BuyOrderService:
         updated = await BuyOrderItemRepository.update(
             db, item, data.quantity, None, subtotal
         )
-        await BuyOrderRepository.recalculate_total(db, order)
+        await BuyOrderService._recalculate_total(db, order)
         return updated
 
     @staticmethod
@@ -193,4 +280,4 @@ class BuyOrderService:
             raise NotFoundError("BuyOrderItem", f"{order_id}/{product_id}")
 
         await BuyOrderItemRepository.delete(db, item)
-        await BuyOrderRepository.recalculate_total(db, order)
+        await BuyOrderService._recalculate_total(db, order, lines=-1)
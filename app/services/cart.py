@@ -0,0 +1,336 @@
+"""Splits a cart across suppliers at the lowest total cost.
+
+Every line goes to a single supplier; a line below an offer's ``minimum_quantity`` is
+raised to it and costed that way. Offers without a price are never chosen.
+
+With a fixed cost per order this is uncapacitated facility location (NP-hard), so
+:func:`plan_cart` runs the greedy DROP heuristic: open every supplier, give each line its
+cheapest open offer, then keep closing the supplier whose closure saves the most (its
+order cost, minus what its lines pay extra at their runner-up open offer, minus the order
+cost of runner-ups that had no lines yet) until no closure saves anything. Each line keeps
+pointers to its cheapest and runner-up open offers, and each supplier knows the lines it
+gets and the lines it is runner-up for, so a closure only re-points those lines and only
+re-prices the suppliers whose saving it can have moved. A lazy max-heap of exact savings
+then picks the next closure, which keeps carts of thousands of lines over thousands of
+suppliers well under a second.
+
+When DROP stalls, a consolidation step moves whole orders onto an idle supplier if that
+saves more order costs than it adds (one new order for several closed ones), then DROP
+resumes. Only suppliers with an offer for every line of an order can take it, so the
+candidates come from intersecting the suppliers of those lines. Both steps strictly lower
+the total, so the search always ends.
+"""
+
+import heapq
+import uuid
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.supplier_product import SupplierProductRepository
+from app.schemas.cart import (
+    CartOptimizeRequest,
+    CartPlan,
+    ProposedOrder,
+    ProposedOrderItem,
+    UnassignedLine,
+    UnassignedReason,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Option:
+    supplier_id: uuid.UUID
+    quantity: float
+    unit_price: Decimal
+    cost: Decimal
+
+
+class _Line:
+    __slots__ = (
+        "product_id",
+        "requested",
+        "offers",
+        "costs",
+        "suppliers",
+        "positions",
+        "first",
+        "second",
+    )
+
+    def __init__(
+        self,
+        product_id: uuid.UUID,
+        requested: float,
+        ranked: list[tuple[Decimal, int, Mapping[str, Any]]],
+        suppliers: list[int],
+    ) -> None:
+        self.product_id = product_id
+        self.requested = requested
+        # Cheapest first; an Option is only built for the offer finally chosen.
+        self.costs, _, self.offers = zip(*ranked, strict=True)
+        self.suppliers = suppliers  # supplier index of each offer
+        self.positions = dict(zip(suppliers, range(len(suppliers)), strict=True))
+        self.first = 0
+        self.second: int | None = 1 if len(ranked) > 1 else None
+
+
+def _option(offer: Mapping[str, Any], requested: float) -> Option:
+    quantity = max(requested, offer["minimum_quantity"])
+    price = offer["unit_price"]
+    return Option(offer["supplier_id"], quantity, price, Decimal(str(quantity)) * price)
+
+
+def plan_cart(
+    demand: Mapping[uuid.UUID, float],
+    offers: Mapping[uuid.UUID, Sequence[Mapping[str, Any]]],
+    order_cost: Decimal = Decimal("0"),
+) -> dict[uuid.UUID, Option]:
+    """The chosen offer for every product in ``demand`` that has a priced offer.
+
+    ``offers`` maps product ids to offer rows (``supplier_id``, ``unit_price``,
+    ``minimum_quantity``), as returned by ``SupplierProductRepository.list_ranked_offers``.
+    """
+    # Suppliers are numbered in order of first appearance; the bookkeeping below is
+    # indexed by that number rather than hashed by UUID (whose hash is pure Python).
+    index: dict[int, int] = {}
+    lines: list[_Line] = []
+    for product_id, requested in demand.items():
+        # Inlined _option: this loop runs once per candidate offer.
+        exact = Decimal(str(requested))
+        ranked = []
+        for offer in offers.get(product_id, ()):
+            price = offer["unit_price"]
+            if price is None:
+                continue
+            minimum = offer["minimum_quantity"]
+            quantity = exact if minimum <= requested else Decimal(str(minimum))
+            ranked.append((quantity * price, offer["supplier_id"].int, offer))
+        if not ranked:
+            continue
+        ranked.sort()
+        suppliers = [index.setdefault(key, len(index)) for _, key, _ in ranked]
+        lines.append(_Line(product_id, requested, ranked, suppliers))
+    count = len(index)
+
+    # Per open supplier: the lines it currently gets, the lines it is runner-up for, what
+    # its lines would pay extra elsewhere, and how many of them have nowhere else to go
+    # (which makes it impossible to close).
+    assigned: list[set[_Line]] = [set() for _ in range(count)]
+    backing: list[set[_Line]] = [set() for _ in range(count)]
+    penalty = [Decimal("0")] * count
+    blocked = [0] * count
+    closed = [False] * count
+    # Max-heap of closure savings. An entry is current while its version matches; only
+    # suppliers whose saving may have moved get a fresh entry after each closure.
+    heap: list[tuple[Decimal, int, int]] = []
+    version = [0] * count
+    changed: set[int] = set()
+    # Suppliers that gained their first line or lost their last one.
+    flipped: set[int] = set()
+
+    def account(line: _Line, sign: int) -> None:
+        first = line.suppliers[line.first]
+        changed.add(first)
+        if sign > 0:
+            assigned[first].add(line)
+            if len(assigned[first]) == 1:
+                flipped.add(first)
+        else:
+            assigned[first].discard(line)
+            if not assigned[first]:
+                flipped.add(first)
+        if line.second is None:
+            blocked[first] += sign
+        else:
+            penalty[first] += sign * (line.costs[line.second] - line.costs[line.first])
+            runner_up = backing[line.suppliers[line.second]]
+            if sign > 0:
+                runner_up.add(line)
+            else:
+                runner_up.discard(line)
+
+    def next_open(line: _Line, start: int) -> int | None:
+        for position in range(start, len(line.suppliers)):
+            if not closed[line.suppliers[position]]:
+                return position
+        return None
+
+    def repoint(line: _Line) -> None:
+        # Options only ever close during DROP, so both pointers can only move forward.
+        first = next_open(line, line.first)
+        assert first is not None  # never blocked
+        second = line.second
+        line.first = first
+        line.second = None if second is None else next_open(line, max(first + 1, second))
+
+    def opened(supplier: int) -> int:
+        """How many suppliers without lines closing ``supplier`` would start ordering from."""
+        out = set()
+        for line in assigned[supplier]:
+            runner_up = line.suppliers[line.second]  # type: ignore[index]
+            if not assigned[runner_up]:
+                out.add(runner_up)
+        return len(out)
+
+    def push_changed() -> None:
+        # A supplier gaining or losing all its lines changes the saving of every supplier
+        # it is runner-up for: their closure would no longer (or now) open a new order.
+        for supplier in flipped:
+            changed.update(line.suppliers[line.first] for line in backing[supplier])
+        flipped.clear()
+        for supplier in changed:
+            version[supplier] += 1
+            # A supplier with no lines costs nothing and stays open as an alternative.
+            if closed[supplier] or blocked[supplier] or not assigned[supplier]:
+                continue
+            saving = order_cost * (1 - opened(supplier)) - penalty[supplier]
+            if saving > 0:
+                heapq.heappush(heap, (-saving, supplier, version[supplier]))
+        changed.clear()
+
+    def drop() -> None:
+        while heap:
+            _, best, seen = heapq.heappop(heap)
+            if seen != version[best]:
+                continue
+            closed[best] = True
+            changed.add(best)
+            # Only lines that get or back up ``best`` have a pointer to move.
+            for line in [*assigned[best], *backing[best]]:
+                account(line, -1)
+                repoint(line)
+                account(line, 1)
+            push_changed()
+
+    def consolidation() -> tuple[int, set[int]] | None:
+        """The best idle supplier to move whole orders onto, and the suppliers it empties.
+
+        DROP never pays a new order cost to save two, so it misses a supplier that is never
+        cheapest but can take several orders at once. The gain counted here (order costs
+        saved minus extra line cost, less the idle supplier's own order cost) is a lower
+        bound: re-pointing may move lines somewhere cheaper still.
+        """
+        # Per idle supplier: the orders it could take whole, and what each of them saves.
+        takes: defaultdict[int, dict[int, Decimal]] = defaultdict(dict)
+        for supplier in range(count):
+            orders = assigned[supplier]
+            if not orders:
+                continue
+            shared: set[int] | None = None
+            for line in orders:
+                shared = set(line.positions) if shared is None else shared & line.positions.keys()
+                if not shared:
+                    break
+            for candidate in shared or ():
+                if assigned[candidate]:
+                    continue
+                extra = sum(
+                    line.costs[line.positions[candidate]] - line.costs[line.first]
+                    for line in orders
+                )
+                if extra < order_cost:
+                    takes[candidate][supplier] = order_cost - extra
+        best, best_gain = None, Decimal("0")
+        for candidate in sorted(takes):
+            gain = sum(takes[candidate].values(), -order_cost)
+            if gain > best_gain:
+                best, best_gain = (candidate, set(takes[candidate])), gain
+        return best
+
+    def reset() -> None:
+        heap.clear()
+        for supplier in range(count):
+            assigned[supplier].clear()
+            backing[supplier].clear()
+            penalty[supplier] = Decimal("0")
+            blocked[supplier] = 0
+        for line in lines:
+            line.first = next_open(line, 0)  # type: ignore[assignment]  # never blocked
+            line.second = next_open(line, line.first + 1)
+            account(line, 1)
+        changed.update(range(count))
+        push_changed()
+
+    for line in lines:
+        account(line, 1)
+    changed.update(range(count))
+    push_changed()
+    while order_cost > 0:
+        drop()
+        move = consolidation()
+        if move is None:
+            break
+        candidate, emptied = move
+        # Idle open suppliers are closed too, so emptied lines can only land on the
+        # candidate or on a supplier that is already paying its order cost.
+        for supplier in range(count):
+            if supplier in emptied or not assigned[supplier]:
+                closed[supplier] = True
+        closed[candidate] = False
+        reset()
+
+    return {line.product_id: _option(line.offers[line.first], line.requested) for line in lines}
+
+
+class CartService:
+    @staticmethod
+    async def optimize(db: AsyncSession, data: CartOptimizeRequest) -> CartPlan:
+        demand: dict[uuid.UUID, float] = {}
+        for line in data.lines:  # repeated products are merged
+            demand[line.product_id] = demand.get(line.product_id, 0.0) + line.quantity
+
+        offers = await SupplierProductRepository.list_ranked_offers(db, list(demand))
+        chosen = plan_cart(demand, offers, data.order_cost)
+
+        supplier_names = {
+            offer["supplier_id"]: offer["supplier_name"]
+            for rows in offers.values()
+            for offer in rows
+        }
+        items: dict[uuid.UUID, list[ProposedOrderItem]] = {}
+        unassigned: list[UnassignedLine] = []
+        for product_id, requested in demand.items():
+            option = chosen.get(product_id)
+            if option is None:
+                reason = (
+                    UnassignedReason.NO_PRICED_OFFER
+                    if product_id in offers
+                    else UnassignedReason.UNKNOWN_PRODUCT
+                )
+                unassigned.append(
+                    UnassignedLine(product_id=product_id, quantity=requested, reason=reason)
+                )
+                continue
+            items.setdefault(option.supplier_id, []).append(
+                ProposedOrderItem(
+                    product_id=product_id,
+                    requested_quantity=requested,
+                    quantity=option.quantity,
+                    unit_price=option.unit_price,
+                    subtotal=option.cost,
+                )
+            )
+
+        orders = []
+        for supplier_id, order_items in items.items():
+            items_total = sum((item.subtotal for item in order_items), Decimal("0"))
+            orders.append(
+                ProposedOrder(
+                    supplier_id=supplier_id,
+                    supplier_name=supplier_names[supplier_id],
+                    items=order_items,
+                    items_total=items_total,
+                    order_cost=data.order_cost,
+                    total=items_total + data.order_cost,
+                )
+            )
+        return CartPlan(
+            orders=orders,
+            unassigned=unassigned,
+            total=sum((order.total for order in orders), Decimal("0")),
+        )
@@ -0,0 +1,167 @@
+"""Bulk export of order lines as CSV, Parquet or Arrow IPC.
+
+Rows are pulled off a server-side cursor and encoded batch by batch, so exports of
+any size run in constant memory and start producing bytes immediately. Parquet and
+Arrow need ``pyarrow`` (``pip install .[export]``).
+"""
+
+import csv
+import enum
+import io
+import uuid
+from collections.abc import AsyncIterator, Collection, Sequence
+from datetime import date, datetime, time, timezone
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ValidationError
+from app.models.buy_order import OrderStatus
+from app.repositories.buy_order_item import EXPORT_COLUMN_NAMES, BuyOrderItemRepository
+from app.schemas.export import ExportFormat
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency (pip install .[export])
+    pa = None
+    pq = None
+
+# Orders finance reports on by default: everything past DRAFT that was not cancelled.
+EXPORTABLE_STATUSES = (OrderStatus.CONFIRMED, OrderStatus.SENT, OrderStatus.RECEIVED)
+
+
+def _day_start(day: date | None) -> datetime | None:
+    return None if day is None else datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return _plain(value)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back whatever was written since the last drain."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema() -> Any:
+    decimal = pa.decimal128(12, 4)
+    return pa.schema([
+        ("order_id", pa.string()),
+        ("order_status", pa.string()),
+        ("order_created_at", pa.timestamp("us", tz="UTC")),
+        ("supplier_id", pa.string()),
+        ("supplier_name", pa.string()),
+        ("product_id", pa.string()),
+        ("product_sku", pa.string()),
+        ("product_name", pa.string()),
+        ("unit", pa.string()),
+        ("quantity", pa.float64()),
+        ("unit_price", decimal),
+        ("subtotal", decimal),
+    ])
+
+
+def _record_batch(schema: Any, rows: Sequence[Sequence[Any]]) -> Any:
+    columns = list(zip(*rows, strict=True))
+    return pa.record_batch(
+        [
+            pa.array([_plain(v) for v in column], type=field.type)
+            for column, field in zip(columns, schema, strict=True)
+        ],
+        schema=schema,
+    )
+
+
+class OrderExportService:
+    @staticmethod
+    def check_format(fmt: ExportFormat) -> None:
+        """Fail before streaming starts if the format's optional dependency is missing."""
+        if fmt is not ExportFormat.CSV and pa is None:
+            raise ValidationError(
+                f"{fmt.value} export requires pyarrow; install supplier-order-core[export]."
+            )
+
+    @staticmethod
+    async def stream(
+        db: AsyncSession,
+        fmt: ExportFormat = ExportFormat.CSV,
+        statuses: Collection[OrderStatus] | None = None,
+        created_from: date | None = None,
+        created_to: date | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Encoded export chunks; ``created_to`` is exclusive (first day not included)."""
+        OrderExportService.check_format(fmt)
+        batches = BuyOrderItemRepository.stream_export_rows(
+            db,
+            statuses=statuses or EXPORTABLE_STATUSES,
+            created_from=_day_start(created_from),
+            created_to=_day_start(created_to),
+        )
+        encode = _encode_csv if fmt is ExportFormat.CSV else _encode_arrow
+        async for chunk in encode(batches, fmt):
+            if chunk:
+                yield chunk
+
+
+async def _encode_csv(
+    batches: AsyncIterator[Sequence[Sequence[Any]]], fmt: ExportFormat
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_COLUMN_NAMES)
+    async for rows in batches:
+        writer.writerows([_csv_value(v) for v in row] for row in rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+async def _encode_arrow(
+    batches: AsyncIterator[Sequence[Sequence[Any]]], fmt: ExportFormat
+) -> AsyncIterator[bytes]:
+    schema = _arrow_schema()
+    sink = _ChunkSink()
+    if fmt is ExportFormat.PARQUET:
+        # One row group per cursor batch; the footer is written on close.
+        writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+    else:
+        writer = pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema)
+    try:
+        async for rows in batches:
+            writer.write_batch(_record_batch(schema, rows))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
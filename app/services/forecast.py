@@ -0,0 +1,78 @@
+import uuid
+from collections.abc import Sequence
+from datetime import date
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import NotFoundError
+from app.core.forecasting import fit_demand, period_series
+from app.core.logging import get_logger
+from app.models.forecast import ProductForecast
+from app.repositories.forecast import ForecastRepository
+from app.schemas.forecast import ForecastRunResult
+
+logger = get_logger(__name__)
+
+
+class ForecastService:
+    @staticmethod
+    async def run(db: AsyncSession, as_of: date) -> ForecastRunResult:
+        """Refit every product with RECEIVED history before ``as_of`` and replace the table.
+
+        History arrives grouped by product, so each product is fitted as soon as its last
+        row is read; only the fits are kept in memory.
+        """
+        period_days = settings.FORECAST_PERIOD_DAYS
+        fits: list[dict[str, Any]] = []
+
+        def fit(product_id: uuid.UUID, daily: list[tuple[date, float]]) -> None:
+            series = period_series(daily, as_of, period_days)
+            result = fit_demand(
+                series,
+                settings.FORECAST_WINDOW,
+                settings.FORECAST_ALPHA,
+                settings.FORECAST_SEASON_LENGTH,
+            )
+            fits.append(
+                {
+                    "product_id": product_id,
+                    "as_of": as_of,
+                    "period_days": period_days,
+                    "history_periods": result.history_periods,
+                    "moving_average": result.moving_average,
+                    "smoothed": result.smoothed,
+                    "seasonal_index": result.seasonal_index,
+                    "forecast": result.forecast,
+                }
+            )
+
+        current: uuid.UUID | None = None
+        daily: list[tuple[date, float]] = []
+        async for rows in ForecastRepository.stream_received_demand(db, as_of):
+            for product_id, day, quantity in rows:
+                if product_id != current:
+                    if daily:
+                        fit(current, daily)  # type: ignore[arg-type]
+                    current, daily = product_id, []
+                daily.append((day, quantity))
+        if daily:
+            fit(current, daily)  # type: ignore[arg-type]
+
+        await ForecastRepository.replace_all(db, fits)
+        logger.info("Demand forecasts refreshed", as_of=as_of.isoformat(), products=len(fits))
+        return ForecastRunResult(as_of=as_of, products=len(fits))
+
+    @staticmethod
+    async def list_forecasts(
+        db: AsyncSession, skip: int = 0, limit: int = 20
+    ) -> Sequence[ProductForecast]:
+        return await ForecastRepository.list(db, skip=skip, limit=limit)
+
+    @staticmethod
+    async def get_forecast(db: AsyncSession, product_id: uuid.UUID) -> ProductForecast:
+        forecast = await ForecastRepository.get(db, product_id)
+        if forecast is None:
+            raise NotFoundError("ProductForecast", str(product_id))
+        return forecast
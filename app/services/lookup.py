@@ -0,0 +1,15 @@
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+
+def lookup_result(
+    rows: Sequence[dict[str, Any]], ids: Sequence[uuid.UUID], key: str = "id"
+) -> dict[str, Any]:
+    """Shape fetched rows as a ``LookupResponse``: request order, duplicates collapsed."""
+    by_id = {row[key]: row for row in rows}
+    requested = list(dict.fromkeys(ids))
+    return {
+        "items": [by_id[i] for i in requested if i in by_id],
+        "missing": [i for i in requested if i not in by_id],
+    }
@@ -1,6 +1,8 @@
 import csv
 import io
 import uuid
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
 
 from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,7 +10,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.exceptions import ConflictError, NotFoundError, ValidationError
 from app.core.logging import get_logger
 from app.models.product import Product
+from app.repositories.cache import CacheKind, catalog_cache
 from app.repositories.product import ProductRepository
+from app.repositories.supplier_product import SupplierProductRepository
 from app.schemas.product import (
     ImportRowStatus,
     ProductCreate,
@@ -16,6 +20,9 @@ from app.schemas.product import (
     ProductImportRowResult,
     ProductUpdate,
 )
+from app.schemas.product_search import ProductSearchCursor
+from app.schemas.sync import ChangeWindow
+from app.services.lookup import lookup_result
 
 logger = get_logger(__name__)
 
@@ -23,9 +30,46 @@ logger = get_logger(__name__)
 class ProductService:
     @staticmethod
     async def list_products(
-        db: AsyncSession, skip: int = 0, limit: int = 20
-    ) -> list[Product]:
-        return await ProductRepository.get_all(db, skip=skip, limit=limit)
+        db: AsyncSession, skip: int = 0, limit: int = 20, changes: ChangeWindow | None = None
+    ) -> list[dict[str, Any]]:
+        return await ProductRepository.list_rows(db, skip=skip, limit=limit, changes=changes)
+
+    @staticmethod
+    def stream_products(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int | None = None,
+        changes: ChangeWindow | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        return ProductRepository.stream_rows(db, skip=skip, limit=limit, changes=changes)
+
+    @staticmethod
+    async def search_products(
+        db: AsyncSession, q: str, cursor: str | None = None, limit: int = 20
+    ) -> list[dict[str, Any]]:
+        after = ProductSearchCursor.decode(cursor, q) if cursor is not None else None
+        return await ProductRepository.search_rows(db, q, after=after, limit=limit)
+
+    @staticmethod
+    async def lookup_products(db: AsyncSession, ids: Sequence[uuid.UUID]) -> dict[str, Any]:
+        return lookup_result(await ProductRepository.list_rows_by_ids(db, ids), ids)
+
+    @staticmethod
+    async def list_offers(db: AsyncSession, product_id: uuid.UUID) -> list[dict[str, Any]]:
+        """Every supplier's offer for the product, cheapest first."""
+        offers = await SupplierProductRepository.list_ranked_offers(db, [product_id])
+        if product_id not in offers:
+            raise NotFoundError("Product", str(product_id))
+        return offers[product_id]
+
+    @staticmethod
+    async def lookup_offers(
+        db: AsyncSession, ids: Sequence[uuid.UUID], per_product: int
+    ) -> dict[str, Any]:
+        """The ``per_product`` cheapest offers for each product in ``ids``."""
+        offers = await SupplierProductRepository.list_ranked_offers(db, ids, per_product)
+        rows = [{"product_id": pid, "offers": items} for pid, items in offers.items()]
+        return lookup_result(rows, ids, key="product_id")
 
     @staticmethod
     async def get_product(db: AsyncSession, product_id: uuid.UUID) -> Product:
@@ -39,7 +83,9 @@ class ProductService:
         existing = await ProductRepository.get_by_sku(db, data.sku)
         if existing is not None:
             raise ConflictError(f"A product with SKU '{data.sku}' already exists.")
-        return await ProductRepository.create(db, data)
+        product = await ProductRepository.create(db, data)
+        catalog_cache.invalidate(db, CacheKind.PRODUCTS, product.id)
+        return product
 
     @staticmethod
     async def update_product(
@@ -50,11 +96,14 @@ class ProductService:
             existing = await ProductRepository.get_by_sku(db, data.sku)
             if existing is not None:
                 raise ConflictError(f"A product with SKU '{data.sku}' already exists.")
+        catalog_cache.invalidate(db, CacheKind.PRODUCTS, product_id)
         return await ProductRepository.update(db, product, data)
 
     @staticmethod
     async def delete_product(db: AsyncSession, product_id: uuid.UUID) -> None:
         product = await ProductService.get_product(db, product_id)
+        catalog_cache.invalidate(db, CacheKind.PRODUCTS, product_id)
+        catalog_cache.invalidate(db, CacheKind.OFFERS)  # its offers are cascaded away
         await ProductRepository.delete(db, product)
 
     # ── CSV import ────────────────────────────────────────────────────────────
@@ -82,6 +131,7 @@ class ProductService:
 
         rows: list[ProductImportRowResult] = []
         imported = updated = errors = 0
+        catalog_cache.invalidate(db, CacheKind.PRODUCTS)
 
         for row_num, raw_row in enumerate(reader, start=1):
             # Normalize keys and strip values
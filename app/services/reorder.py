@@ -0,0 +1,41 @@
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.response_cache import response_cache
+from app.models.buy_order import BuyOrder
+from app.models.buy_order_item import BuyOrderItem
+from app.repositories.reorder import ReorderRepository
+from app.schemas.reorder import ReorderRequest
+
+
+class ReorderService:
+    @staticmethod
+    async def list_suggestions(
+        db: AsyncSession, skip: int = 0, limit: int = 20, supplier_id: uuid.UUID | None = None
+    ) -> list[dict[str, Any]]:
+        return await ReorderRepository.list_rows(
+            db, skip=skip, limit=limit, supplier_id=supplier_id
+        )
+
+    @staticmethod
+    def stream_suggestions(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int | None = None,
+        supplier_id: uuid.UUID | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        return ReorderRepository.stream_rows(db, skip=skip, limit=limit, supplier_id=supplier_id)
+
+    @staticmethod
+    async def create_orders(db: AsyncSession, data: ReorderRequest) -> dict[str, Any]:
+        orders = await ReorderRepository.create_draft_orders(
+            db, supplier_id=data.supplier_id, notes=data.notes
+        )
+        # Bulk INSERTs never reach the flush hooks the list response cache listens to.
+        response_cache.touch(
+            db.sync_session, (BuyOrder.__tablename__, BuyOrderItem.__tablename__)
+        )
+        return {"orders": orders, "items": sum(order["items"] for order in orders)}
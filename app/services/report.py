@@ -0,0 +1,31 @@
+import uuid
+from collections.abc import Collection
+from datetime import date
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.buy_order import OrderStatus
+from app.repositories.spend import SpendRollupRepository
+
+
+class ReportService:
+    @staticmethod
+    async def spend(
+        db: AsyncSession,
+        supplier_id: uuid.UUID | None = None,
+        statuses: Collection[OrderStatus] | None = None,
+        month_from: date | None = None,
+        month_to: date | None = None,
+    ) -> list[dict[str, Any]]:
+        return await SpendRollupRepository.list_rows(
+            db,
+            supplier_id=supplier_id,
+            statuses=statuses,
+            month_from=month_from,
+            month_to=month_to,
+        )
+
+    @staticmethod
+    async def rebuild_spend(db: AsyncSession) -> int:
+        return await SpendRollupRepository.rebuild(db)
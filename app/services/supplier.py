@@ -1,23 +1,52 @@
 import uuid
+from collections.abc import AsyncIterator, Collection, Sequence
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ConflictError, NotFoundError
+from app.core.responses import make_etag
 from app.models.supplier import Supplier
 from app.models.supplier_product import SupplierProduct
+from app.repositories.cache import CacheKind, catalog_cache
 from app.repositories.product import ProductRepository
 from app.repositories.supplier import SupplierRepository
 from app.repositories.supplier_product import SupplierProductRepository
+from app.schemas.sparse import Fieldset
 from app.schemas.supplier import SupplierCreate, SupplierUpdate
 from app.schemas.supplier_product import SupplierProductCreate, SupplierProductUpdate
+from app.schemas.sync import ChangeWindow
+from app.services.lookup import lookup_result
 
 
 class SupplierService:
     @staticmethod
     async def list_suppliers(
-        db: AsyncSession, skip: int = 0, limit: int = 20
-    ) -> list[Supplier]:
-        return await SupplierRepository.get_all(db, skip=skip, limit=limit)
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 20,
+        changes: ChangeWindow | None = None,
+        with_stats: bool = False,
+    ) -> list[dict[str, Any]]:
+        return await SupplierRepository.list_rows(
+            db, skip=skip, limit=limit, changes=changes, with_stats=with_stats
+        )
+
+    @staticmethod
+    def stream_suppliers(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int | None = None,
+        changes: ChangeWindow | None = None,
+        with_stats: bool = False,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        return SupplierRepository.stream_rows(
+            db, skip=skip, limit=limit, changes=changes, with_stats=with_stats
+        )
+
+    @staticmethod
+    async def lookup_suppliers(db: AsyncSession, ids: Sequence[uuid.UUID]) -> dict[str, Any]:
+        return lookup_result(await SupplierRepository.list_rows_by_ids(db, ids), ids)
 
     @staticmethod
     async def get_supplier(db: AsyncSession, supplier_id: uuid.UUID) -> Supplier:
@@ -27,18 +56,32 @@ class SupplierService:
         return supplier
 
     @staticmethod
-    async def get_supplier_with_products(db: AsyncSession, supplier_id: uuid.UUID) -> Supplier:
-        supplier = await SupplierRepository.get_with_products(db, supplier_id)
+    async def get_supplier_with_products(
+        db: AsyncSession, supplier_id: uuid.UUID, include: Collection[str] | None = None
+    ) -> Supplier:
+        supplier = await SupplierRepository.get_with_products(db, supplier_id, include=include)
         if supplier is None:
             raise NotFoundError("Supplier", str(supplier_id))
         return supplier
 
+    @staticmethod
+    async def get_supplier_etag(
+        db: AsyncSession, supplier_id: uuid.UUID, fieldset: Fieldset
+    ) -> str:
+        """ETag of the ``GET /suppliers/{id}`` representation, without loading it."""
+        version = await SupplierRepository.get_version(db, supplier_id)
+        if version is None:
+            raise NotFoundError("Supplier", str(supplier_id))
+        return make_etag(*version, fieldset.key)
+
     @staticmethod
     async def create_supplier(db: AsyncSession, data: SupplierCreate) -> Supplier:
         existing = await SupplierRepository.get_by_name(db, data.name)
         if existing is not None:
             raise ConflictError(f"A supplier named '{data.name}' already exists.")
-        return await SupplierRepository.create(db, data)
+        supplier = await SupplierRepository.create(db, data)
+        catalog_cache.invalidate(db, CacheKind.SUPPLIERS, supplier.id)
+        return supplier
 
     @staticmethod
     async def update_supplier(
@@ -49,15 +92,26 @@ class SupplierService:
             existing = await SupplierRepository.get_by_name(db, data.name)
             if existing is not None:
                 raise ConflictError(f"A supplier named '{data.name}' already exists.")
+        catalog_cache.invalidate(db, CacheKind.SUPPLIERS, supplier_id)
         return await SupplierRepository.update(db, supplier, data)
 
     @staticmethod
     async def delete_supplier(db: AsyncSession, supplier_id: uuid.UUID) -> None:
         supplier = await SupplierService.get_supplier(db, supplier_id)
+        catalog_cache.invalidate(db, CacheKind.SUPPLIERS, supplier_id)
+        catalog_cache.invalidate(db, CacheKind.OFFERS)  # its offers are cascaded away
         await SupplierRepository.delete(db, supplier)
 
     # ── Supplier-Product management ───────────────────────────────────────────
 
+    @staticmethod
+    async def list_all_supplier_products(
+        db: AsyncSession, skip: int = 0, limit: int = 20, changes: ChangeWindow | None = None
+    ) -> list[dict[str, Any]]:
+        return await SupplierProductRepository.list_rows(
+            db, skip=skip, limit=limit, changes=changes
+        )
+
     @staticmethod
     async def list_supplier_products(
         db: AsyncSession, supplier_id: uuid.UUID
@@ -69,9 +123,10 @@ class SupplierService:
     async def add_product_to_supplier(
         db: AsyncSession, supplier_id: uuid.UUID, data: SupplierProductCreate
     ) -> SupplierProduct:
-        await SupplierService.get_supplier(db, supplier_id)
+        if await SupplierRepository.get_snapshot(db, supplier_id) is None:
+            raise NotFoundError("Supplier", str(supplier_id))
 
-        product = await ProductRepository.get_by_id(db, data.product_id)
+        product = await ProductRepository.get_snapshot(db, data.product_id)
         if product is None:
             raise NotFoundError("Product", str(data.product_id))
 
@@ -81,6 +136,7 @@ class SupplierService:
                 f"Product '{data.product_id}' is already linked to this supplier."
             )
 
+        catalog_cache.invalidate(db, CacheKind.OFFERS, (supplier_id, data.product_id))
         return await SupplierProductRepository.create(db, supplier_id, data)
 
     @staticmethod
@@ -96,6 +152,7 @@ class SupplierService:
             raise NotFoundError(
                 "SupplierProduct", f"{supplier_id}/{product_id}"
             )
+        catalog_cache.invalidate(db, CacheKind.OFFERS, (supplier_id, product_id))
         return await SupplierProductRepository.update(db, sp, data)
 
     @staticmethod
@@ -108,4 +165,5 @@ class SupplierService:
             raise NotFoundError(
                 "SupplierProduct", f"{supplier_id}/{product_id}"
             )
+        catalog_cache.invalidate(db, CacheKind.OFFERS, (supplier_id, product_id))
         await SupplierProductRepository.delete(db, sp)
@@ -0,0 +1,18 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.tombstone import SyncResource, Tombstone
+from app.repositories.tombstone import TombstoneRepository
+from app.schemas.sync import ChangeWindow
+
+
+class SyncService:
+    @staticmethod
+    async def list_tombstones(
+        db: AsyncSession,
+        resource: SyncResource,
+        changes: ChangeWindow | None = None,
+        limit: int = 100,
+    ) -> list[Tombstone]:
+        return await TombstoneRepository.get_all(
+            db, resource, changes or ChangeWindow(), limit=limit
+        )
@@ -0,0 +1,260 @@
+"""Synthetic data generator for the benchmark suite.
+
+Produces a deterministic catalog (suppliers, products, supplier offers) and order
+history (orders + order lines) at configurable volumes. Rows are written with
+PostgreSQL ``COPY`` when running against asyncpg and with batched executemany
+otherwise, so the 1M-product / 5M-line scale seeds in minutes.
+"""
+
+import random
+import uuid
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Table, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.db.base import Base
+from app.models.buy_order import BuyOrder, OrderStatus
+from app.models.buy_order_item import BuyOrderItem
+from app.models.product import Product
+from app.models.supplier import Supplier
+from app.models.supplier_product import SupplierProduct
+
+CHUNK_SIZE = 10_000
+
+# Share of seeded orders per status; the remainder are RECEIVED.
+STATUS_MIX: dict[OrderStatus, float] = {
+    OrderStatus.DRAFT: 0.10,
+    OrderStatus.CONFIRMED: 0.05,
+    OrderStatus.SENT: 0.05,
+    OrderStatus.CANCELLED: 0.05,
+}
+
+
+@dataclass(frozen=True)
+class Volumes:
+    suppliers: int
+    products: int
+    order_lines: int
+    offers_per_product: int = 3
+    lines_per_order: int = 10
+
+    @property
+    def orders(self) -> int:
+        return max(1, self.order_lines // self.lines_per_order)
+
+
+PRESETS: dict[str, Volumes] = {
+    "tiny": Volumes(suppliers=50, products=2_000, order_lines=10_000),
+    "small": Volumes(suppliers=500, products=50_000, order_lines=200_000),
+    "large": Volumes(suppliers=10_000, products=1_000_000, order_lines=5_000_000),
+}
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _chunks(rows: Iterator[dict[str, Any]], size: int = CHUNK_SIZE) -> Iterator[list[dict[str, Any]]]:
+    chunk: list[dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _insert(conn: AsyncConnection, table: Table, rows: Iterator[dict[str, Any]]) -> int:
+    count = 0
+    columns = [c.name for c in table.columns]
+    for chunk in _chunks(rows):
+        if conn.dialect.name == "postgresql":
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+                table.name,
+                records=[tuple(row[c] for c in columns) for row in chunk],
+                columns=columns,
+            )
+        else:
+            await conn.execute(insert(table), chunk)
+        count += len(chunk)
+    return count
+
+
+class CatalogLayout:
+    """Deterministic mapping of products to the suppliers that offer them.
+
+    Product ``p`` is offered by suppliers ``(p + j * stride) % S`` for ``j`` in
+    ``range(offers_per_product)``, so each supplier's catalog can be enumerated
+    arithmetically without keeping the offer table in memory.
+    """
+
+    def __init__(self, volumes: Volumes) -> None:
+        self.volumes = volumes
+        self.stride = max(1, volumes.suppliers // max(1, volumes.offers_per_product))
+
+    def suppliers_for(self, product: int) -> list[int]:
+        s = self.volumes.suppliers
+        return sorted({(product + j * self.stride) % s for j in range(self.volumes.offers_per_product)})
+
+    def products_for(self, supplier: int) -> Iterator[int]:
+        s, p = self.volumes.suppliers, self.volumes.products
+        seen: set[int] = set()
+        for j in range(self.volumes.offers_per_product):
+            for product in range((supplier - j * self.stride) % s, p, s):
+                if product not in seen:
+                    seen.add(product)
+                    yield product
+
+
+async def seed(engine: AsyncEngine, volumes: Volumes, *, seed_value: int = 42) -> dict[str, int]:
+    """Create the schema (if needed) and populate it. Returns row counts per table."""
+    rng = random.Random(seed_value)
+    layout = CatalogLayout(volumes)
+    now = datetime.now(timezone.utc)
+
+    supplier_ids = [_uuid(rng) for _ in range(volumes.suppliers)]
+    product_ids = [_uuid(rng) for _ in range(volumes.products)]
+
+    def supplier_rows() -> Iterator[dict[str, Any]]:
+        for i, sid in enumerate(supplier_ids):
+            yield {
+                "id": sid,
+                "name": f"Supplier {i:07d}",
+                "email": f"orders{i}@supplier.example",
+                "phone": f"555-{i % 10_000:04d}",
+                "address": f"{i} Industrial Way",
+                "created_at": now,
+                "updated_at": now,
+            }
+
+    def product_rows() -> Iterator[dict[str, Any]]:
+        for i, pid in enumerate(product_ids):
+            yield {
+                "id": pid,
+                "name": f"Product {i:08d}",
+                "sku": f"SKU-{i:08d}",
+                "description": f"Synthetic product number {i}",
+                "unit": "pcs",
+                "stock": float(rng.randint(0, 500)),
+                "created_at": now,
+                "updated_at": now,
+            }
+
+    def offer_rows() -> Iterator[dict[str, Any]]:
+        for p, pid in enumerate(product_ids):
+            for s in layout.suppliers_for(p):
+                yield {
+                    "supplier_id": supplier_ids[s],
+                    "product_id": pid,
+                    "minimum_quantity": float(rng.choice((0, 1, 5, 10))),
+                    "optimal_quantity": float(rng.choice((20, 50, 100))),
+                    "unit_price": Decimal(rng.randint(50, 50_000)) / 100,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+
+    statuses: list[OrderStatus] = []
+    for status, share in STATUS_MIX.items():
+        statuses += [status] * int(share * 100)
+    statuses += [OrderStatus.RECEIVED] * (100 - len(statuses))
+
+    order_rows: list[dict[str, Any]] = []
+    line_rows: list[dict[str, Any]] = []
+
+    catalogs: dict[int, list[int]] = {}
+
+    def order_and_line_rows() -> Iterator[tuple[dict[str, Any], list[dict[str, Any]]]]:
+        for _ in range(volumes.orders):
+            s = rng.randrange(volumes.suppliers)
+            status = rng.choice(statuses)
+            created = now - timedelta(days=rng.randint(0, 3 * 365), seconds=rng.randint(0, 86_400))
+            if s not in catalogs:
+                catalogs[s] = list(layout.products_for(s))
+            catalog = catalogs[s]
+            picked: Sequence[int] = rng.sample(catalog, min(volumes.lines_per_order, len(catalog)))
+            order_id = _uuid(rng)
+            lines = []
+            total = Decimal("0")
+            for p in picked:
+                quantity = float(rng.randint(1, 200))
+                price = Decimal(rng.randint(50, 50_000)) / 100
+                frozen = status != OrderStatus.DRAFT
+                subtotal = Decimal(str(quantity)) * price
+                total += subtotal
+                lines.append({
+                    "id": _uuid(rng),
+                    "order_id": order_id,
+                    "product_id": product_ids[p],
+                    "quantity": quantity,
+                    "unit_price": price if frozen else None,
+                    "subtotal": subtotal,
+                    "created_at": created,
+                    "updated_at": created,
+                })
+            yield {
+                "id": order_id,
+                "supplier_id": supplier_ids[s],
+                "status": status.value,
+                "notes": None,
+                "total": total,
+                "created_at": created,
+                "updated_at": created,
+            }, lines
+
+    counts: dict[str, int] = {}
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        counts["suppliers"] = await _insert(conn, Supplier.__table__, supplier_rows())  # type: ignore[arg-type]
+        counts["products"] = await _insert(conn, Product.__table__, product_rows())  # type: ignore[arg-type]
+        counts["supplier_products"] = await _insert(
+            conn, SupplierProduct.__table__, offer_rows()  # type: ignore[arg-type]
+        )
+
+        counts["buy_orders"] = counts["buy_order_items"] = 0
+        for order, lines in order_and_line_rows():
+            order_rows.append(order)
+            line_rows.extend(lines)
+            if len(line_rows) >= CHUNK_SIZE:
+                counts["buy_orders"] += await _insert(conn, BuyOrder.__table__, iter(order_rows))  # type: ignore[arg-type]
+                counts["buy_order_items"] += await _insert(
+                    conn, BuyOrderItem.__table__, iter(line_rows)  # type: ignore[arg-type]
+                )
+                order_rows.clear()
+                line_rows.clear()
+        counts["buy_orders"] += await _insert(conn, BuyOrder.__table__, iter(order_rows))  # type: ignore[arg-type]
+        counts["buy_order_items"] += await _insert(conn, BuyOrderItem.__table__, iter(line_rows))  # type: ignore[arg-type]
+    return counts
+
+
+async def _main(argv: list[str] | None = None) -> None:
+    import argparse
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    parser = argparse.ArgumentParser(description="Seed a database with synthetic benchmark data.")
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    parser.add_argument("--reset", action="store_true", help="drop all tables before seeding")
+    args = parser.parse_args(argv)
+
+    engine = create_async_engine(args.database_url)
+    try:
+        if args.reset:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+        print(await seed(engine, PRESETS[args.preset]))
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    asyncio.run(_main())
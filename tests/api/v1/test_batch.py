@@ -0,0 +1,107 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.main import app
+from app.repositories.product import ProductRepository
+from app.services import batch
+
+
+async def _run(client: AsyncClient, operations: list[dict]):
+    return await client.post("/api/v1/batch", json={"operations": operations})
+
+
+@pytest.mark.asyncio
+async def test_batch_workflow_with_references(client: AsyncClient) -> None:
+    response = await _run(client, [
+        {"id": "supplier", "op": "supplier.create", "params": {"name": "Batch Supplier"}},
+        {"id": "bolt", "op": "product.create", "params": {"name": "Batch Bolt", "sku": "BATCH-1"}},
+        {
+            "op": "supplier.add_product",
+            "params": {
+                "supplier_id": "$supplier.id",
+                "product_id": "$bolt.id",
+                "minimum_quantity": 1,
+                "optimal_quantity": 10,
+                "unit_price": "2.50",
+            },
+        },
+        {"id": "order", "op": "order.create", "params": {"supplier_id": "$supplier.id"}},
+        {
+            "op": "order.add_item",
+            "params": {"order_id": "$order.id", "product_id": "$1.id", "quantity": 4},
+        },
+        {"op": "order.transition", "params": {"order_id": "$order.id", "status": "CONFIRMED"}},
+    ])
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["op"] for r in results][-1] == "order.transition"
+    confirmed = results[-1]["result"]
+    assert confirmed["status"] == "CONFIRMED"
+    assert confirmed["total"] == "10.0000"
+    assert confirmed["items"][0]["product"]["sku"] == "BATCH-1"
+
+    order = (await client.get(f"/api/v1/orders/{results[3]['result']['id']}")).json()
+    assert order["status"] == "CONFIRMED"
+    assert [i["id"] for i in order["items"]] == [i["id"] for i in confirmed["items"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_rolls_back_everything(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    # Like get_db: roll the request's transaction back when the endpoint raises.
+    async def rollback_on_error():
+        try:
+            yield db_session
+        except Exception:
+            await db_session.rollback()
+            raise
+
+    app.dependency_overrides[get_db] = rollback_on_error
+    response = await _run(client, [
+        {"id": "s", "op": "supplier.create", "params": {"name": "Batch Rollback"}},
+        {
+            "op": "order.add_item",
+            "params": {"order_id": "$s.id", "product_id": "$s.id", "quantity": 1},
+        },
+    ])
+    assert response.status_code == 404
+    assert response.json()["error"]["message"].startswith("operations[1] (order.add_item)")
+
+    suppliers = await client.get("/api/v1/suppliers")
+    assert all(s["name"] != "Batch Rollback" for s in suppliers.json())
+
+
+@pytest.mark.asyncio
+async def test_batch_constraint_violation_names_the_operation(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # As if a concurrent request inserted the SKU between the service check and the flush.
+    spec = batch.OPERATIONS["product.create"]
+    monkeypatch.setitem(
+        batch.OPERATIONS,
+        "product.create",
+        batch._Operation(ProductRepository.create, spec.body, spec.response),
+    )
+    response = await _run(client, [
+        {"op": "product.create", "params": {"name": "Twin", "sku": "BATCH-TWIN"}},
+        {"op": "product.create", "params": {"name": "Twin", "sku": "BATCH-TWIN"}},
+    ])
+    assert response.status_code == 409
+    assert response.json()["error"]["message"].startswith("operations[1] (product.create)")
+
+    products = await client.get("/api/v1/products")
+    assert all(p["sku"] != "BATCH-TWIN" for p in products.json())
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_bad_operations(client: AsyncClient) -> None:
+    response = await _run(client, [{"op": "supplier.explode"}])
+    assert response.status_code == 422
+    response = await _run(client, [{"op": "order.create", "params": {"supplier_id": "$later.id"}}])
+    assert response.status_code == 422
+    response = await _run(client, [{"op": "supplier.update", "params": {"name": "x"}}])
+    assert response.status_code == 422
+    assert "supplier_id" in response.json()["error"]["message"]
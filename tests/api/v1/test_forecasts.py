@@ -0,0 +1,68 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.buy_order import BuyOrder, OrderStatus
+from app.models.buy_order_item import BuyOrderItem
+from app.models.product import Product
+from app.models.supplier import Supplier
+from app.services.forecast import ForecastService
+
+AS_OF = date(2026, 10, 19)
+
+
+async def _received(
+    db: AsyncSession,
+    supplier: Supplier,
+    product: Product,
+    days_ago: int,
+    quantity: float,
+    status: OrderStatus = OrderStatus.RECEIVED,
+) -> None:
+    at = datetime.combine(AS_OF, datetime.min.time(), tzinfo=timezone.utc) - timedelta(
+        days=days_ago, hours=-12
+    )
+    order = BuyOrder(supplier_id=supplier.id, status=status, updated_at=at)
+    db.add(order)
+    await db.flush()
+    db.add(BuyOrderItem(order_id=order.id, product_id=product.id, quantity=quantity))
+    await db.flush()
+
+
+@pytest.mark.asyncio
+async def test_forecast_run_and_api(client: AsyncClient, db_session: AsyncSession) -> None:
+    supplier = Supplier(name="Forecast Supplier")
+    steady = Product(name="Steady", sku="FC-1")
+    idle = Product(name="Idle", sku="FC-2")
+    db_session.add_all([supplier, steady, idle])
+    await db_session.flush()
+    for week in range(1, 5):
+        await _received(db_session, supplier, steady, days_ago=7 * week - 1, quantity=10)
+    await _received(db_session, supplier, steady, days_ago=3, quantity=99, status=OrderStatus.SENT)
+    await _received(db_session, supplier, steady, days_ago=-1, quantity=99)  # after as_of
+
+    result = await ForecastService.run(db_session, AS_OF)
+    assert result.products == 1
+
+    response = await client.get(f"/api/v1/forecasts/{steady.id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["as_of"] == AS_OF.isoformat()
+    assert data["history_periods"] == 4
+    assert data["moving_average"] == 10.0
+    assert data["forecast"] == 10.0
+    assert data["seasonal_index"] is None
+
+    response = await client.get(f"/api/v1/forecasts/{idle.id}")
+    assert response.status_code == 404
+
+    response = await client.get("/api/v1/forecasts")
+    assert [f["product_id"] for f in response.json()] == [str(steady.id)]
+
+    # A rerun a week later replaces the results and takes in the newer receipt.
+    await ForecastService.run(db_session, AS_OF + timedelta(days=7))
+    data = (await client.get(f"/api/v1/forecasts/{steady.id}")).json()
+    assert data["history_periods"] == 5
+    assert data["moving_average"] == pytest.approx((4 * 10 + 99) / 5)
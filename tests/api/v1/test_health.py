@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from app.core.security import create_access_token
+
 
 @pytest.mark.asyncio
 async def test_health_check(client: AsyncClient) -> None:
@@ -11,3 +13,22 @@ async def test_health_check(client: AsyncClient) -> None:
     assert "version" in body
     assert "environment" in body
     assert "database" in body
+
+
+@pytest.mark.asyncio
+async def test_pool_status(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/health/pool")
+    assert response.status_code == 401
+
+    headers = {"Authorization": f"Bearer {create_access_token('ops')}"}
+    response = await client.get("/api/v1/health/pool", headers=headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["size"] >= 1
+    assert body["checked_out"] >= 0
+    assert body["acquisitions"] >= 0
+    assert body["wait_total_ms"] >= 0
+    assert body["wait_peak_ms"] <= body["wait_max_ms"]
+
+    response = await client.get("/api/v1/health/pool", params={"reset_peak": True}, headers=headers)
+    assert response.status_code == 200
@@ -1,5 +1,15 @@
+import csv
+import io
+import json
+import uuid
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.supplier import Supplier
+from app.repositories.supplier import SupplierRepository
 
 
 # ── Fixtures / helpers ────────────────────────────────────────────────────────
@@ -69,6 +79,27 @@ async def test_create_order_invalid_supplier(client: AsyncClient) -> None:
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_create_order_for_supplier_deleted_behind_the_cache(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    supplier = await _create_supplier(client, "Gone Elsewhere")
+    supplier_id = uuid.UUID(supplier["id"])
+    await db_session.commit()  # publish the row; the cached snapshot below outlives it
+    assert await SupplierRepository.get_snapshot(db_session, supplier_id) is not None
+    # Another worker deletes it; this worker's cache never hears about it.
+    await db_session.execute(delete(Supplier).where(Supplier.id == supplier_id))
+    await db_session.commit()
+
+    await db_session.execute(text("PRAGMA foreign_keys = ON"))
+    try:
+        response = await client.post("/api/v1/orders", json={"supplier_id": supplier["id"]})
+    finally:
+        await db_session.execute(text("PRAGMA foreign_keys = OFF"))
+    assert response.status_code == 404
+    assert await SupplierRepository.get_snapshot(db_session, supplier_id) is None
+
+
 @pytest.mark.asyncio
 async def test_list_orders(client: AsyncClient) -> None:
     supplier = await _create_supplier(client, "List Orders Supplier")
@@ -91,6 +122,50 @@ async def test_list_orders_filter_by_supplier(client: AsyncClient) -> None:
     assert all(o["supplier_id"] == s1["id"] for o in orders)
 
 
+@pytest.mark.asyncio
+async def test_list_orders_matches_detail_shape(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Projection Supplier")
+    order = await _create_order(client, supplier["id"], notes="projected")
+    response = await client.get(f"/api/v1/orders?supplier_id={supplier['id']}")
+    assert response.status_code == 200
+    [listed] = response.json()
+    detail = (await client.get(f"/api/v1/orders/{order['id']}")).json()
+    detail.pop("items")
+    assert list(listed) == list(detail)
+    assert listed == detail
+    assert listed["supplier"]["name"] == "Projection Supplier"
+
+
+@pytest.mark.asyncio
+async def test_list_orders_ndjson_respects_filters(client: AsyncClient) -> None:
+    s1 = await _create_supplier(client, "Stream Supplier A")
+    s2 = await _create_supplier(client, "Stream Supplier B")
+    for _ in range(3):
+        await _create_order(client, s1["id"])
+    await _create_order(client, s2["id"])
+    response = await client.get(
+        f"/api/v1/orders?supplier_id={s1['id']}&limit=2",
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 2
+    assert all(r["supplier"]["name"] == "Stream Supplier A" for r in rows)
+
+
+@pytest.mark.asyncio
+async def test_lookup_orders(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Lookup Orders Supplier")
+    order = await _create_order(client, supplier["id"])
+    unknown = "00000000-0000-0000-0000-000000000000"
+    response = await client.post("/api/v1/orders/lookup", json={"ids": [order["id"], unknown]})
+    assert response.status_code == 200
+    data = response.json()
+    assert [o["id"] for o in data["items"]] == [order["id"]]
+    assert data["items"][0]["supplier"]["name"] == "Lookup Orders Supplier"
+    assert data["missing"] == [unknown]
+
+
 @pytest.mark.asyncio
 async def test_get_order_with_items(client: AsyncClient) -> None:
     supplier = await _create_supplier(client, "Get Order Supplier")
@@ -108,6 +183,33 @@ async def test_get_order_not_found(client: AsyncClient) -> None:
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_get_order_etag(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "ETag Order Supplier")
+    product = await _create_product(client, "ETag Washer", "ETAG-WSH")
+    await _link_product(client, supplier["id"], product["id"], min_qty=1.0)
+    order = await _create_order(client, supplier["id"])
+    url = f"/api/v1/orders/{order['id']}"
+    etag = (await client.get(url)).headers["ETag"]
+
+    not_modified = await client.get(url, headers={"If-None-Match": f'W/{etag}, "other"'})
+    assert not_modified.status_code == 304
+
+    await client.post(f"{url}/items", json={"product_id": product["id"], "quantity": 2.0})
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()["items"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_order_etag_not_found(client: AsyncClient) -> None:
+    response = await client.get(
+        "/api/v1/orders/00000000-0000-0000-0000-000000000000", headers={"If-None-Match": "*"}
+    )
+    assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_update_order_notes(client: AsyncClient) -> None:
     supplier = await _create_supplier(client, "Update Notes Supplier")
@@ -129,6 +231,108 @@ async def test_delete_draft_order(client: AsyncClient) -> None:
     assert get_response.status_code == 404
 
 
+# ── Search ────────────────────────────────────────────────────────────────────
+
+async def _order_with_line(
+    client: AsyncClient, supplier_id: str, product_id: str, quantity: float, notes: str
+) -> dict:
+    order = await _create_order(client, supplier_id, notes=notes)
+    resp = await client.post(
+        f"/api/v1/orders/{order['id']}/items",
+        json={"product_id": product_id, "quantity": quantity},
+    )
+    assert resp.status_code == 201
+    return order
+
+
+@pytest.mark.asyncio
+async def test_search_orders_filters(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Search Supplier")
+    bolt = await _create_product(client, "Search Bolt", "SRCH-BOLT")
+    nut = await _create_product(client, "Search Nut", "SRCH-NUT")
+    await _link_product(client, supplier["id"], bolt["id"], min_qty=1.0)
+    await _link_product(client, supplier["id"], nut["id"], min_qty=1.0)
+    small = await _order_with_line(client, supplier["id"], bolt["id"], 2.0, "Rush 100% delivery")
+    large = await _order_with_line(client, supplier["id"], nut["id"], 30.0, "Quarterly restock")
+    await client.patch(f"/api/v1/orders/{large['id']}/status", json={"status": "CONFIRMED"})
+    url = f"/api/v1/orders/search?supplier_id={supplier['id']}"
+
+    async def ids(query: str) -> list[str]:
+        response = await client.get(url + query)
+        assert response.status_code == 200
+        return [row["id"] for row in response.json()]
+
+    assert set(await ids("")) == {small["id"], large["id"]}
+    assert await ids(f"&product_id={bolt['id']}") == [small["id"]]
+    assert await ids("&notes=RESTOCK") == [large["id"]]
+    assert await ids("&notes=100%25") == [small["id"]]  # wildcards match literally
+    assert await ids("&notes=10_") == []
+    assert await ids("&total_min=100") == [large["id"]]
+    assert await ids("&total_max=20") == [small["id"]]
+    assert await ids("&status=CONFIRMED&status=SENT") == [large["id"]]
+    assert await ids("&created_from=2000-01-01T00:00:00&created_to=2001-01-01T00:00:00") == []
+
+
+@pytest.mark.asyncio
+async def test_search_orders_cursor_pages(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Search Pages Supplier")
+    product = await _create_product(client, "Search Pages Item", "SRCH-PAGE")
+    await _link_product(client, supplier["id"], product["id"], min_qty=1.0)
+    quantities = [3.0, 1.0, 5.0, 2.0, 4.0]
+    for quantity in quantities:
+        await _order_with_line(client, supplier["id"], product["id"], quantity, "paged")
+
+    url = f"/api/v1/orders/search?supplier_id={supplier['id']}&sort=-total&limit=2"
+    totals: list[float] = []
+    pages = 0
+    cursor = None
+    while True:
+        response = await client.get(url + (f"&cursor={cursor}" if cursor else ""))
+        assert response.status_code == 200
+        totals += [float(row["total"]) for row in response.json()]
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert pages == 3
+    assert totals == [50.0, 40.0, 30.0, 20.0, 10.0]
+
+
+@pytest.mark.asyncio
+async def test_search_orders_rejects_bad_input(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Search Errors Supplier")
+    for _ in range(2):
+        await _create_order(client, supplier["id"])
+    first = await client.get(f"/api/v1/orders/search?supplier_id={supplier['id']}&limit=1")
+    cursor = first.headers["X-Next-Cursor"]
+
+    other_sort = await client.get(f"/api/v1/orders/search?sort=total&cursor={cursor}")
+    assert other_sort.status_code == 422
+    garbage = await client.get("/api/v1/orders/search?cursor=not-a-cursor")
+    assert garbage.status_code == 422
+    inverted = await client.get("/api/v1/orders/search?total_min=10&total_max=5")
+    assert inverted.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_orders_mixes_naive_and_aware_dates(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Search Dates Supplier")
+    order = await _create_order(client, supplier["id"])
+    created = order["created_at"][:10]
+    url = f"/api/v1/orders/search?supplier_id={supplier['id']}"
+
+    mixed = await client.get(
+        f"{url}&created_from={created}T00:00:00&created_to=2999-01-01T00:00:00Z"
+    )
+    assert mixed.status_code == 200
+    assert [row["id"] for row in mixed.json()] == [order["id"]]
+    # Naive bounds are UTC, so this is the same instant as the aware lower bound.
+    empty = await client.get(
+        f"{url}&created_from=2999-01-01T00:00:00&created_to=2999-01-01T00:00:00%2B00:00"
+    )
+    assert empty.status_code == 422
+
+
 # ── Status transitions ────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
@@ -210,6 +414,25 @@ async def test_add_item_below_minimum_quantity(client: AsyncClient) -> None:
     assert response.status_code == 422
 
 
+@pytest.mark.asyncio
+async def test_add_item_sees_updated_offer_terms(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Cached Terms Supplier")
+    product = await _create_product(client, "Spring G", "SPR-G")
+    await _link_product(client, supplier["id"], product["id"], min_qty=1.0)
+    first = await _create_order(client, supplier["id"])
+    payload = {"product_id": product["id"], "quantity": 3.0}
+    assert (await client.post(f"/api/v1/orders/{first['id']}/items", json=payload)).status_code == 201
+
+    response = await client.patch(
+        f"/api/v1/suppliers/{supplier['id']}/products/{product['id']}",
+        json={"minimum_quantity": 10.0},
+    )
+    assert response.status_code == 200
+    second = await _create_order(client, supplier["id"])
+    response = await client.post(f"/api/v1/orders/{second['id']}/items", json=payload)
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_add_item_not_sold_by_supplier(client: AsyncClient) -> None:
     supplier = await _create_supplier(client, "Wrong Supplier")
@@ -322,3 +545,224 @@ async def test_cancel_order(client: AsyncClient) -> None:
     )
     assert response.status_code == 200
     assert response.json()["status"] == "CANCELLED"
+
+
+# ── Sparse fieldsets ──────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_get_order_fields_only_header(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Sparse Header Supplier")
+    order = await _create_order(client, supplier["id"], notes="n")
+    response = await client.get(f"/api/v1/orders/{order['id']}?fields=status,notes")
+    assert response.status_code == 200
+    assert response.json() == {"id": order["id"], "status": "DRAFT", "notes": "n"}
+
+
+@pytest.mark.asyncio
+async def test_get_order_include_items_without_product(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Sparse Items Supplier")
+    product = await _create_product(client, "Sparse Nut", "SPARSE-NUT")
+    await _link_product(client, supplier["id"], product["id"], min_qty=1.0)
+    order = await _create_order(client, supplier["id"])
+    await client.post(
+        f"/api/v1/orders/{order['id']}/items",
+        json={"product_id": product["id"], "quantity": 2.0},
+    )
+
+    response = await client.get(f"/api/v1/orders/{order['id']}?include=items")
+    assert response.status_code == 200
+    data = response.json()
+    assert "supplier" not in data
+    assert data["items"][0]["product_id"] == product["id"]
+    assert "product" not in data["items"][0]
+
+    response = await client.get(f"/api/v1/orders/{order['id']}?include=items.product")
+    assert response.json()["items"][0]["product"]["sku"] == "SPARSE-NUT"
+
+
+@pytest.mark.asyncio
+async def test_get_order_full_response_matches_explicit_include(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Sparse Full Supplier")
+    order = await _create_order(client, supplier["id"])
+    default = await client.get(f"/api/v1/orders/{order['id']}")
+    explicit = await client.get(
+        f"/api/v1/orders/{order['id']}?include=supplier,items,items.product"
+    )
+    assert default.json() == explicit.json()
+
+
+@pytest.mark.asyncio
+async def test_get_order_unknown_include(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Sparse Bad Include Supplier")
+    order = await _create_order(client, supplier["id"])
+    response = await client.get(f"/api/v1/orders/{order['id']}?include=warehouse")
+    assert response.status_code == 422
+    response = await client.get(f"/api/v1/orders/{order['id']}?fields=colour")
+    assert response.status_code == 422
+
+
+# ── Export ────────────────────────────────────────────────────────────────────
+
+async def _confirmed_order_with_line(client: AsyncClient, name: str, sku: str) -> dict:
+    supplier = await _create_supplier(client, name)
+    product = await _create_product(client, f"{name} Part", sku)
+    await _link_product(client, supplier["id"], product["id"], min_qty=1.0, unit_price="2.50")
+    order = await _create_order(client, supplier["id"])
+    await client.post(
+        f"/api/v1/orders/{order['id']}/items",
+        json={"product_id": product["id"], "quantity": 4.0},
+    )
+    await client.patch(f"/api/v1/orders/{order['id']}/status", json={"status": "CONFIRMED"})
+    return order
+
+
+@pytest.mark.asyncio
+async def test_export_csv(client: AsyncClient) -> None:
+    order = await _confirmed_order_with_line(client, "Export Supplier", "EXP-001")
+    draft_supplier = await _create_supplier(client, "Export Draft Supplier")
+    await _create_order(client, draft_supplier["id"])
+
+    response = await client.get("/api/v1/orders/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "order-lines.csv" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["order_id"] == order["id"]
+    assert rows[0]["order_status"] == "CONFIRMED"
+    assert rows[0]["supplier_name"] == "Export Supplier"
+    assert rows[0]["product_sku"] == "EXP-001"
+    assert rows[0]["subtotal"] == "10.0000"
+
+
+@pytest.mark.asyncio
+async def test_export_filters(client: AsyncClient) -> None:
+    await _confirmed_order_with_line(client, "Export Filter Supplier", "EXP-002")
+    response = await client.get("/api/v1/orders/export?status=RECEIVED")
+    assert response.text.splitlines()[1:] == []
+    response = await client.get("/api/v1/orders/export?created_from=2999-01-01")
+    assert response.text.splitlines()[1:] == []
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(client: AsyncClient) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    order = await _confirmed_order_with_line(client, "Export Parquet Supplier", "EXP-003")
+    response = await client.get("/api/v1/orders/export?format=parquet")
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.column("order_id").to_pylist() == [order["id"]]
+    assert str(table.column("subtotal")[0].as_py()) == "10.0000"
+
+    response = await client.get("/api/v1/orders/export?format=arrow")
+    stream = pytest.importorskip("pyarrow.ipc").open_stream(response.content)
+    assert stream.read_all().column("product_sku").to_pylist() == ["EXP-003"]
+
+
+# ── Cart optimizer ────────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_optimize_cart(client: AsyncClient) -> None:
+    north = await _create_supplier(client, "North Cart")
+    south = await _create_supplier(client, "South Cart")
+    bolt = await _create_product(client, "Cart Bolt", "CART-1")
+    nut = await _create_product(client, "Cart Nut", "CART-2")
+    unpriced = await _create_product(client, "Cart Washer", "CART-3")
+    await _link_product(client, north["id"], bolt["id"], min_qty=5, unit_price="1.00")
+    await _link_product(client, south["id"], bolt["id"], min_qty=0, unit_price="1.50")
+    await _link_product(client, north["id"], nut["id"], min_qty=0, unit_price="3.00")
+    await _link_product(client, south["id"], nut["id"], min_qty=0, unit_price="2.00")
+    await _link_product(client, north["id"], unpriced["id"], unit_price=None)
+    unknown = "00000000-0000-0000-0000-000000000000"
+    cart = [
+        {"product_id": bolt["id"], "quantity": 2},
+        {"product_id": nut["id"], "quantity": 10},
+        {"product_id": unpriced["id"], "quantity": 1},
+        {"product_id": unknown, "quantity": 1},
+    ]
+
+    response = await client.post("/api/v1/orders/optimize", json={"lines": cart})
+    assert response.status_code == 200
+    plan = response.json()
+    # 2 bolts from North means buying its minimum of 5 (5.00) — South's 3.00 wins.
+    assert [o["supplier_id"] for o in plan["orders"]] == [south["id"]]
+    order = plan["orders"][0]
+    assert order["status"] == "DRAFT"
+    assert [(i["product_id"], i["quantity"]) for i in order["items"]] == [
+        (bolt["id"], 2),
+        (nut["id"], 10),
+    ]
+    assert float(plan["total"]) == 23.0
+    assert {(u["product_id"], u["reason"]) for u in plan["unassigned"]} == {
+        (unpriced["id"], "no_priced_offer"),
+        (unknown, "unknown_product"),
+    }
+
+    # Nothing was created.
+    orders = (await client.get("/api/v1/orders")).json()
+    assert orders == []
+
+
+@pytest.mark.asyncio
+async def test_optimize_cart_validation(client: AsyncClient) -> None:
+    response = await client.post("/api/v1/orders/optimize", json={"lines": []})
+    assert response.status_code == 422
+    response = await client.post(
+        "/api/v1/orders/optimize",
+        json={"lines": [{"product_id": "00000000-0000-0000-0000-000000000000", "quantity": 0}]},
+    )
+    assert response.status_code == 422
+
+
+# ── Reorder suggestions ───────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_reorder_suggestions_and_drafts(client: AsyncClient) -> None:
+    cheap = await _create_supplier(client, "Reorder Cheap")
+    dear = await _create_supplier(client, "Reorder Dear")
+    low = (
+        await client.post("/api/v1/products", json={"name": "Low", "sku": "RO-1", "stock": 3})
+    ).json()
+    topped = (
+        await client.post("/api/v1/products", json={"name": "Full", "sku": "RO-2", "stock": 50})
+    ).json()
+    small = (
+        await client.post("/api/v1/products", json={"name": "Small", "sku": "RO-3", "stock": 9})
+    ).json()
+    await _link_product(client, cheap["id"], low["id"], min_qty=5, optimal_qty=20, unit_price="2")
+    await _link_product(client, dear["id"], low["id"], min_qty=1, optimal_qty=30, unit_price="3")
+    await _link_product(client, cheap["id"], topped["id"], min_qty=5, optimal_qty=20)
+    await _link_product(client, dear["id"], small["id"], min_qty=4, optimal_qty=10, unit_price="1")
+
+    response = await client.get("/api/v1/orders/reorder-suggestions")
+    assert response.status_code == 200
+    suggestions = {s["product_id"]: s for s in response.json()}
+    assert set(suggestions) == {low["id"], small["id"]}
+    assert suggestions[low["id"]]["supplier_id"] == cheap["id"]
+    assert suggestions[low["id"]]["quantity"] == 17  # 20 - 3
+    assert suggestions[small["id"]]["quantity"] == 4  # shortfall of 1, raised to the minimum
+
+    response = await client.get(
+        f"/api/v1/orders/reorder-suggestions?supplier_id={dear['id']}",
+        headers={"Accept": "application/x-ndjson"},
+    )
+    rows = [json.loads(line) for line in response.text.splitlines() if line]
+    assert [r["product_id"] for r in rows] == [small["id"]]
+
+    response = await client.post("/api/v1/orders/reorder", json={"notes": "weekly"})
+    assert response.status_code == 201
+    result = response.json()
+    assert result["items"] == 2
+    by_supplier = {o["supplier_id"]: o for o in result["orders"]}
+    assert float(by_supplier[cheap["id"]]["total"]) == 34.0
+
+    order = (await client.get(f"/api/v1/orders/{by_supplier[cheap['id']]['id']}")).json()
+    assert order["status"] == "DRAFT"
+    assert order["notes"] == "weekly"
+    assert [(i["product_id"], i["quantity"]) for i in order["items"]] == [(low["id"], 17)]
+
+    # Open drafts count as on order, so nothing is suggested twice.
+    response = await client.get("/api/v1/orders/reorder-suggestions")
+    assert response.json() == []
+    response = await client.post("/api/v1/orders/reorder", json={})
+    assert response.json() == {"orders": [], "items": 0}
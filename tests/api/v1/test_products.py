@@ -1,4 +1,5 @@
 import io
+import json
 
 import pytest
 from httpx import AsyncClient
@@ -34,6 +35,21 @@ async def test_list_products(client: AsyncClient) -> None:
     assert isinstance(response.json(), list)
 
 
+@pytest.mark.asyncio
+async def test_list_products_ndjson_stream(client: AsyncClient) -> None:
+    for i in range(25):
+        await client.post("/api/v1/products", json={"name": f"Stream {i}", "sku": f"STR-{i:03d}"})
+    response = await client.get("/api/v1/products", headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    # no default page size when streaming
+    assert len(lines) >= 25
+    rows = [json.loads(line) for line in lines]
+    page = (await client.get(f"/api/v1/products?limit={len(rows)}")).json()
+    assert rows == page
+
+
 @pytest.mark.asyncio
 async def test_get_product(client: AsyncClient) -> None:
     created = await client.post(
@@ -183,3 +199,166 @@ async def test_import_csv_empty_rows_ignored(client: AsyncClient) -> None:
     )
     assert response.status_code == 200
     assert response.json()["total_rows"] == 1  # empty rows not counted
+
+
+# ── Search ────────────────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_search_products_ranks_sku_then_text(client: AsyncClient) -> None:
+    for name, sku, description in (
+        ("Hex Bolt M6", "ZQX-100", None),
+        ("Bolt Cutter", "ZQX-1001", None),
+        ("Wing Nut", "NUT-ZQX", "Pairs with zqx-100 bolts"),
+        ("ZQX Washer", "WSH-9", None),
+    ):
+        payload = {"name": name, "sku": sku, "description": description}
+        assert (await client.post("/api/v1/products", json=payload)).status_code == 201
+
+    response = await client.get("/api/v1/products/search?q=zqx-100")
+    assert response.status_code == 200
+    hits = response.json()
+    assert [hit["sku"] for hit in hits] == ["ZQX-100", "ZQX-1001", "NUT-ZQX"]
+    assert hits[0]["score"] > hits[1]["score"] > hits[2]["score"]
+
+    short = await client.get("/api/v1/products/search?q=zq")  # prefixes only
+    assert [hit["sku"] for hit in short.json()] == ["ZQX-100", "ZQX-1001", "WSH-9"]
+
+
+@pytest.mark.asyncio
+async def test_search_products_cursor_pages(client: AsyncClient) -> None:
+    for i in range(5):
+        payload = {"name": f"Paged Gizmo {i}", "sku": f"PGZ-{i}"}
+        assert (await client.post("/api/v1/products", json=payload)).status_code == 201
+
+    skus: list[str] = []
+    cursor = None
+    while True:
+        url = "/api/v1/products/search?q=pgz&limit=2" + (f"&cursor={cursor}" if cursor else "")
+        response = await client.get(url)
+        assert response.status_code == 200
+        skus += [hit["sku"] for hit in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert skus == [f"PGZ-{i}" for i in range(5)]
+
+    first = await client.get("/api/v1/products/search?q=pgz&limit=1")
+    other = await client.get(
+        f"/api/v1/products/search?q=gizmo&cursor={first.headers['X-Next-Cursor']}"
+    )
+    assert other.status_code == 422
+    assert (await client.get("/api/v1/products/search?q=%20%20")).status_code == 422
+
+
+# ── Batch lookup ──────────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_lookup_products(client: AsyncClient) -> None:
+    a = (await client.post("/api/v1/products", json={"name": "Lookup A", "sku": "LKP-A"})).json()
+    b = (await client.post("/api/v1/products", json={"name": "Lookup B", "sku": "LKP-B"})).json()
+    unknown = "00000000-0000-0000-0000-000000000000"
+
+    response = await client.get(f"/api/v1/products/lookup?ids={b['id']},{unknown},{a['id']}")
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["id"] for p in data["items"]] == [b["id"], a["id"]]
+    assert data["items"][0] == (await client.get(f"/api/v1/products/{b['id']}")).json()
+    assert data["missing"] == [unknown]
+
+    response = await client.post("/api/v1/products/lookup", json={"ids": [a["id"], a["id"]]})
+    assert response.status_code == 200
+    assert [p["id"] for p in response.json()["items"]] == [a["id"]]
+
+
+@pytest.mark.asyncio
+async def test_lookup_products_tolerates_spaces(client: AsyncClient) -> None:
+    a = (await client.post("/api/v1/products", json={"name": "Spaced A", "sku": "SPC-A"})).json()
+    b = (await client.post("/api/v1/products", json={"name": "Spaced B", "sku": "SPC-B"})).json()
+    response = await client.get(f"/api/v1/products/lookup?ids={a['id']}, {b['id']} ,")
+    assert response.status_code == 200
+    assert {item["id"] for item in response.json()["items"]} == {a["id"], b["id"]}
+
+
+@pytest.mark.asyncio
+async def test_lookup_products_invalid_ids(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/products/lookup?ids=nope")
+    assert response.status_code == 422
+    response = await client.post("/api/v1/products/lookup", json={"ids": []})
+    assert response.status_code == 422
+
+
+# ── Offers by price ───────────────────────────────────────────────────────────
+
+async def _offer(client: AsyncClient, name: str, product_id: str, unit_price: str | None) -> str:
+    supplier = (
+        await client.post(
+            "/api/v1/suppliers", json={"name": name, "email": f"{name.lower()}@example.com"}
+        )
+    ).json()
+    response = await client.post(
+        f"/api/v1/suppliers/{supplier['id']}/products",
+        json={
+            "product_id": product_id,
+            "minimum_quantity": 1,
+            "optimal_quantity": 10,
+            "unit_price": unit_price,
+        },
+    )
+    assert response.status_code == 201
+    return supplier["id"]
+
+
+@pytest.mark.asyncio
+async def test_list_product_offers_cheapest_first(client: AsyncClient) -> None:
+    product = (await client.post("/api/v1/products", json={"name": "Bolt", "sku": "OFR-1"})).json()
+    unpriced = await _offer(client, "Unpriced", product["id"], None)
+    pricey = await _offer(client, "Pricey", product["id"], "9.50")
+    cheap = await _offer(client, "Cheap", product["id"], "2.25")
+
+    response = await client.get(f"/api/v1/products/{product['id']}/offers")
+    assert response.status_code == 200
+    offers = response.json()
+    assert [o["supplier_id"] for o in offers] == [cheap, pricey, unpriced]
+    assert offers[0]["supplier_name"] == "Cheap"
+    assert float(offers[0]["unit_price"]) == 2.25
+    assert offers[2]["unit_price"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_product_offers(client: AsyncClient) -> None:
+    product = (await client.post("/api/v1/products", json={"name": "Nut", "sku": "OFR-2"})).json()
+    response = await client.get(f"/api/v1/products/{product['id']}/offers")
+    assert response.status_code == 200
+    assert response.json() == []
+
+    unknown = "00000000-0000-0000-0000-000000000000"
+    response = await client.get(f"/api/v1/products/{unknown}/offers")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_lookup_offers(client: AsyncClient) -> None:
+    a = (await client.post("/api/v1/products", json={"name": "A", "sku": "OFR-A"})).json()
+    b = (await client.post("/api/v1/products", json={"name": "B", "sku": "OFR-B"})).json()
+    await _offer(client, "North", a["id"], "5")
+    south = await _offer(client, "South", a["id"], "4")
+    unknown = "00000000-0000-0000-0000-000000000000"
+
+    response = await client.get(f"/api/v1/products/offers?ids={b['id']},{unknown},{a['id']}")
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["product_id"] for p in data["items"]] == [b["id"], a["id"]]
+    assert data["items"][0]["offers"] == []
+    assert [o["supplier_id"] for o in data["items"][1]["offers"]] == [south]
+    assert data["missing"] == [unknown]
+
+    response = await client.post(
+        "/api/v1/products/offers", json={"ids": [a["id"]], "per_product": 2}
+    )
+    assert response.status_code == 200
+    assert [o["supplier_name"] for o in response.json()["items"][0]["offers"]] == [
+        "South",
+        "North",
+    ]
+    response = await client.get(f"/api/v1/products/offers?ids={a['id']}&per_product=0")
+    assert response.status_code == 422
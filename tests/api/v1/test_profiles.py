@@ -0,0 +1,74 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+
+SECRET = "profiling-test-secret"
+
+
+@pytest.fixture
+def profiling(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setattr(settings, "PROFILING_SECRET", SECRET)
+    monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "PROFILING_INTERVAL_MS", 0.5)
+
+
+@pytest.mark.asyncio
+async def test_profile_request_via_header(client: AsyncClient, profiling: None) -> None:
+    response = await client.get("/api/v1/products", headers={"X-Profile-Token": SECRET})
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+
+    listing = await client.get("/api/v1/profiles", headers={"X-Profile-Token": SECRET})
+    assert listing.status_code == 200
+    assert [p["name"] for p in listing.json()] == [profile_id]
+
+    fetched = await client.get(
+        f"/api/v1/profiles/{profile_id}", headers={"X-Profile-Token": SECRET}
+    )
+    assert fetched.status_code == 200
+    assert fetched.headers["content-type"].startswith("text/plain")
+
+
+@pytest.mark.asyncio
+async def test_secret_in_query_string_is_ignored(client: AsyncClient, profiling: None) -> None:
+    # Query strings end up in access logs; only the header is accepted.
+    response = await client.get(f"/api/v1/products?profile={SECRET}")
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_wrong_token_is_not_profiled(client: AsyncClient, profiling: None) -> None:
+    response = await client.get("/api/v1/products", headers={"X-Profile-Token": "nope"})
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_sample_rate_profiles_without_token(
+    client: AsyncClient, profiling: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "PROFILING_SAMPLE_RATE", 1.0)
+    response = await client.get("/api/v1/products")
+    assert "X-Profile-Id" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_profile_store_requires_token(client: AsyncClient, profiling: None) -> None:
+    response = await client.get("/api/v1/profiles", headers={"X-Profile-Token": "nope"})
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_profile_store_disabled_without_secret(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/profiles", headers={"X-Profile-Token": ""})
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_get_unknown_profile(client: AsyncClient, profiling: None) -> None:
+    response = await client.get(
+        "/api/v1/profiles/missing.collapsed", headers={"X-Profile-Token": SECRET}
+    )
+    assert response.status_code == 404
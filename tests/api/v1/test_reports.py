@@ -0,0 +1,75 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.report import ReportService
+
+
+async def _setup(client: AsyncClient) -> tuple[dict, dict]:
+    supplier = (await client.post("/api/v1/suppliers", json={"name": "Spend Co"})).json()
+    product = (
+        await client.post("/api/v1/products", json={"name": "Spend Item", "sku": "SPD-1"})
+    ).json()
+    response = await client.post(
+        f"/api/v1/suppliers/{supplier['id']}/products",
+        json={
+            "product_id": product["id"],
+            "minimum_quantity": 1,
+            "optimal_quantity": 10,
+            "unit_price": "2.50",
+        },
+    )
+    assert response.status_code == 201
+    return supplier, product
+
+
+def _buckets(rows: list[dict]) -> dict[str, tuple[int, int, float]]:
+    return {
+        r["status"]: (r["order_count"], r["line_count"], float(r["total"])) for r in rows
+    }
+
+
+@pytest.mark.asyncio
+async def test_spend_rollup_follows_order_writes(client: AsyncClient) -> None:
+    supplier, product = await _setup(client)
+    orders = "/api/v1/orders"
+
+    kept = (await client.post(orders, json={"supplier_id": supplier["id"]})).json()
+    dropped = (await client.post(orders, json={"supplier_id": supplier["id"]})).json()
+    item = {"product_id": product["id"], "quantity": 4}
+    await client.post(f"{orders}/{kept['id']}/items", json=item)
+    await client.post(f"{orders}/{dropped['id']}/items", json=item)
+    await client.patch(f"{orders}/{kept['id']}/items/{product['id']}", json={"quantity": 6})
+
+    response = await client.get("/api/v1/reports/spend")
+    assert response.status_code == 200
+    assert _buckets(response.json()) == {"DRAFT": (2, 2, 25.0)}
+
+    await client.delete(f"{orders}/{dropped['id']}")
+    await client.patch(f"{orders}/{kept['id']}/status", json={"status": "CONFIRMED"})
+    rows = (await client.get("/api/v1/reports/spend")).json()
+    assert _buckets(rows) == {"CONFIRMED": (1, 1, 15.0)}
+    assert rows[0]["supplier_name"] == "Spend Co"
+
+    rows = (await client.get("/api/v1/reports/spend?status=DRAFT")).json()
+    assert rows == []
+    response = await client.get("/api/v1/reports/spend?month_from=2000-01-01&month_to=2000-12-31")
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_incremental_rollup(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    supplier, product = await _setup(client)
+    order = (await client.post("/api/v1/orders", json={"supplier_id": supplier["id"]})).json()
+    await client.post(
+        f"/api/v1/orders/{order['id']}/items", json={"product_id": product["id"], "quantity": 2}
+    )
+    await client.post("/api/v1/orders", json={"supplier_id": supplier["id"]})
+    incremental = (await client.get("/api/v1/reports/spend")).json()
+
+    assert await ReportService.rebuild_spend(db_session) == 1
+    rebuilt = (await client.get("/api/v1/reports/spend")).json()
+    assert rebuilt == incremental
+    assert _buckets(rebuilt) == {"DRAFT": (2, 1, 5.0)}
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from httpx import AsyncClient
 
@@ -50,6 +52,58 @@ async def test_list_suppliers(client: AsyncClient) -> None:
     assert isinstance(response.json(), list)
 
 
+@pytest.mark.asyncio
+async def test_list_suppliers_with_stats(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Stats Supplier", "stats")
+    idle = await _create_supplier(client, "Idle Stats Supplier", "idlestats")
+    url = f"/api/v1/suppliers/{supplier['id']}"
+    for sku in ("STAT-1", "STAT-2"):
+        product = await _create_product(client, f"Stat {sku}", sku)
+        await client.post(
+            f"{url}/products",
+            json={
+                "product_id": product["id"],
+                "minimum_quantity": 1.0,
+                "optimal_quantity": 5.0,
+                "unit_price": "2.50",
+            },
+        )
+    orders = []
+    for _ in range(3):
+        resp = await client.post("/api/v1/orders", json={"supplier_id": supplier["id"]})
+        order = resp.json()
+        await client.post(
+            f"/api/v1/orders/{order['id']}/items",
+            json={"product_id": product["id"], "quantity": 4.0},
+        )
+        orders.append(order)
+    await client.patch(f"/api/v1/orders/{orders[1]['id']}/status", json={"status": "CONFIRMED"})
+    await client.patch(f"/api/v1/orders/{orders[2]['id']}/status", json={"status": "CANCELLED"})
+
+    response = await client.get("/api/v1/suppliers?with_stats=true&limit=200")
+    assert response.status_code == 200
+    rows = {row["id"]: row for row in response.json()}
+    stats = rows[supplier["id"]]["stats"]
+    assert stats["product_count"] == 2
+    assert stats["open_order_count"] == 2
+    assert float(stats["open_order_value"]) == 20.0
+    assert rows[supplier["id"]]["name"] == "Stats Supplier"
+    idle_stats = rows[idle["id"]]["stats"]
+    assert idle_stats["product_count"] == 0
+    assert idle_stats["open_order_count"] == 0
+    assert float(idle_stats["open_order_value"]) == 0.0
+
+    plain = await client.get("/api/v1/suppliers?limit=200")
+    assert all("stats" not in row for row in plain.json())
+
+    stream = await client.get(
+        "/api/v1/suppliers?with_stats=true&limit=200",
+        headers={"Accept": "application/x-ndjson"},
+    )
+    streamed = [json.loads(line) for line in stream.text.splitlines() if line]
+    assert {row["id"]: row["stats"]["open_order_count"] for row in streamed}[supplier["id"]] == 2
+
+
 @pytest.mark.asyncio
 async def test_get_supplier_with_empty_products(client: AsyncClient) -> None:
     supplier = await _create_supplier(client, "Empty Supplier", "empty")
@@ -205,3 +259,75 @@ async def test_get_supplier_shows_linked_products(client: AsyncClient) -> None:
     data = response.json()
     assert len(data["supplier_products"]) == 1
     assert data["supplier_products"][0]["product"]["sku"] == "SPR-S1"
+
+
+# ── Sparse fieldsets ──────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_get_supplier_without_products(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Supplier Sparse", "sparse")
+    response = await client.get(f"/api/v1/suppliers/{supplier['id']}?fields=name")
+    assert response.status_code == 200
+    assert response.json() == {"id": supplier["id"], "name": "Supplier Sparse"}
+
+
+@pytest.mark.asyncio
+async def test_get_supplier_include_links_without_product(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Supplier Sparse Links", "sparselinks")
+    product = await _create_product(client, "Sparse Bolt", "SPARSE-BOLT")
+    await client.post(
+        f"/api/v1/suppliers/{supplier['id']}/products",
+        json={"product_id": product["id"], "minimum_quantity": 1.0, "optimal_quantity": 5.0},
+    )
+    response = await client.get(
+        f"/api/v1/suppliers/{supplier['id']}?include=supplier_products"
+    )
+    assert response.status_code == 200
+    links = response.json()["supplier_products"]
+    assert links[0]["product_id"] == product["id"]
+    assert "product" not in links[0]
+
+
+# ── Conditional GET ───────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_get_supplier_etag_not_modified(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Supplier ETag", "etag")
+    first = await client.get(f"/api/v1/suppliers/{supplier['id']}")
+    etag = first.headers["ETag"]
+
+    response = await client.get(
+        f"/api/v1/suppliers/{supplier['id']}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    sparse = await client.get(
+        f"/api/v1/suppliers/{supplier['id']}?fields=name", headers={"If-None-Match": etag}
+    )
+    assert sparse.status_code == 200
+    assert sparse.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_get_supplier_etag_tracks_offers(client: AsyncClient) -> None:
+    supplier = await _create_supplier(client, "Supplier ETag Offers", "etagoffers")
+    product = await _create_product(client, "ETag Nut", "ETAG-NUT")
+    url = f"/api/v1/suppliers/{supplier['id']}"
+    etags = [(await client.get(url)).headers["ETag"]]
+
+    await client.post(
+        f"{url}/products",
+        json={"product_id": product["id"], "minimum_quantity": 1.0, "optimal_quantity": 5.0},
+    )
+    etags.append((await client.get(url)).headers["ETag"])
+    await client.patch(f"{url}/products/{product['id']}", json={"unit_price": "2.50"})
+    etags.append((await client.get(url)).headers["ETag"])
+    await client.delete(f"{url}/products/{product['id']}")
+    etags.append((await client.get(url)).headers["ETag"])
+
+    assert len(set(etags[:3])) == 3
+    assert etags[3] == etags[0]  # same representation as before the offer existed
+    response = await client.get(url, headers={"If-None-Match": etags[1]})
+    assert response.status_code == 200
@@ -0,0 +1,155 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.product import Product
+
+T0 = datetime(2026, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def settled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Sync rows written by the test itself, without waiting for them to settle."""
+    monkeypatch.setattr(settings, "SYNC_SETTLE_SECONDS", 0)
+
+
+async def _create_product(client: AsyncClient, sku: str) -> dict:
+    resp = await client.post("/api/v1/products", json={"name": f"Sync {sku}", "sku": sku})
+    assert resp.status_code == 201
+    return resp.json()
+
+
+async def _stamp(db_session: AsyncSession, product_id: str, updated_at: datetime) -> None:
+    await db_session.execute(
+        update(Product).where(Product.id == uuid.UUID(product_id)).values(updated_at=updated_at)
+    )
+
+
+# ── updated_since / cursor ────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_products_sync_pages_in_keyset_order(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    products = [await _create_product(client, f"SYNC-{i}") for i in range(3)]
+    # Two rows share a timestamp: the id breaks the tie, so paging must not skip either.
+    await _stamp(db_session, products[0]["id"], T0)
+    await _stamp(db_session, products[1]["id"], T0)
+    await _stamp(db_session, products[2]["id"], T0 + timedelta(seconds=1))
+    tied = sorted(p["id"] for p in products[:2])
+
+    first = await client.get(
+        "/api/v1/products", params={"updated_since": T0.isoformat(), "limit": 2}
+    )
+    assert first.status_code == 200
+    assert [p["id"] for p in first.json()] == tied
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = await client.get("/api/v1/products", params={"cursor": cursor, "limit": 2})
+    assert [p["id"] for p in second.json()] == [products[2]["id"]]
+    cursor = second.headers["X-Next-Cursor"]
+
+    drained = await client.get("/api/v1/products", params={"cursor": cursor})
+    assert drained.json() == []
+    assert drained.headers["X-Next-Cursor"] == cursor
+
+    later = await client.get(
+        "/api/v1/products", params={"updated_since": (T0 + timedelta(seconds=1)).isoformat()}
+    )
+    assert [p["id"] for p in later.json()] == [products[2]["id"]]
+
+
+@pytest.mark.asyncio
+async def test_cursor_does_not_pass_rows_that_may_still_commit(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "SYNC_SETTLE_SECONDS", 60)
+    now = datetime.now(timezone.utc)
+    old, fresh = [await _create_product(client, f"SYNC-SETTLE-{i}") for i in range(2)]
+    await _stamp(db_session, old["id"], now - timedelta(minutes=5))
+    await _stamp(db_session, fresh["id"], now - timedelta(seconds=5))
+
+    first = await client.get(
+        "/api/v1/products", params={"updated_since": (now - timedelta(hours=1)).isoformat()}
+    )
+    assert [p["id"] for p in first.json()] == [old["id"]]  # ``fresh`` has not settled
+    cursor = first.headers["X-Next-Cursor"]
+
+    # A slow transaction commits a row stamped before ``fresh``: the cursor has not passed it.
+    late = await _create_product(client, "SYNC-SETTLE-LATE")
+    await _stamp(db_session, late["id"], now - timedelta(minutes=2))
+    second = await client.get("/api/v1/products", params={"cursor": cursor})
+    assert [p["id"] for p in second.json()] == [late["id"]]
+
+    monkeypatch.setattr(settings, "SYNC_SETTLE_SECONDS", 0)
+    third = await client.get(
+        "/api/v1/products", params={"cursor": second.headers["X-Next-Cursor"]}
+    )
+    assert [p["id"] for p in third.json()] == [fresh["id"]]
+
+
+@pytest.mark.asyncio
+async def test_plain_list_has_no_cursor(client: AsyncClient) -> None:
+    await _create_product(client, "SYNC-PLAIN")
+    response = await client.get("/api/v1/products")
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/orders", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_supplier_products_sync(client: AsyncClient, settled: None) -> None:
+    supplier = (await client.post("/api/v1/suppliers", json={"name": "Sync Supplier"})).json()
+    product = await _create_product(client, "SYNC-LINK")
+    await client.post(
+        f"/api/v1/suppliers/{supplier['id']}/products",
+        json={"product_id": product["id"], "minimum_quantity": 1, "optimal_quantity": 5},
+    )
+    response = await client.get(
+        "/api/v1/supplier-products", params={"updated_since": "2000-01-01T00:00:00Z"}
+    )
+    assert response.status_code == 200
+    [link] = response.json()
+    assert link["supplier_id"] == supplier["id"]
+    assert link["product"]["sku"] == "SYNC-LINK"
+    assert "X-Next-Cursor" in response.headers
+
+
+# ── Tombstones ────────────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_delete_records_tombstone(client: AsyncClient, settled: None) -> None:
+    product = await _create_product(client, "SYNC-GONE")
+    await client.delete(f"/api/v1/products/{product['id']}")
+    response = await client.get("/api/v1/tombstones", params={"resource": "products"})
+    assert response.status_code == 200
+    [tombstone] = response.json()
+    assert tombstone["record_id"] == product["id"]
+    assert tombstone["resource"] == "products"
+
+
+@pytest.mark.asyncio
+async def test_supplier_delete_tombstones_its_offers(
+    client: AsyncClient, settled: None
+) -> None:
+    supplier = (await client.post("/api/v1/suppliers", json={"name": "Sync Gone"})).json()
+    product = await _create_product(client, "SYNC-OFFER")
+    await client.post(
+        f"/api/v1/suppliers/{supplier['id']}/products",
+        json={"product_id": product["id"], "minimum_quantity": 1, "optimal_quantity": 5},
+    )
+    await client.delete(f"/api/v1/suppliers/{supplier['id']}")
+
+    suppliers = await client.get("/api/v1/tombstones", params={"resource": "suppliers"})
+    assert [t["record_id"] for t in suppliers.json()] == [supplier["id"]]
+    offers = await client.get("/api/v1/tombstones", params={"resource": "supplier_products"})
+    assert [t["record_id"] for t in offers.json()] == [f"{supplier['id']}/{product['id']}"]
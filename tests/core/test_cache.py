@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _loader(calls: list[str], value: str | None, delay: float = 0.0):
+    async def load() -> str | None:
+        calls.append("load")
+        await asyncio.sleep(delay)
+        return value
+
+    return load
+
+
+async def test_entries_expire_after_ttl():
+    clock = _Clock()
+    cache: TTLCache[str, str] = TTLCache(maxsize=10, ttl=5, clock=clock)
+    calls: list[str] = []
+
+    assert await cache.get_or_load("a", _loader(calls, "A")) == "A"
+    clock.now = 4.9
+    assert await cache.get_or_load("a", _loader(calls, "A")) == "A"
+    assert len(calls) == 1
+    clock.now = 5.0
+    assert await cache.get_or_load("a", _loader(calls, "A")) == "A"
+    assert len(calls) == 2
+    assert cache.stats.hits == 1 and cache.stats.misses == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+async def test_concurrent_misses_share_one_load():
+    cache: TTLCache[str, str] = TTLCache(maxsize=10, ttl=60)
+    calls: list[str] = []
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("a", _loader(calls, "A", delay=0.01)) for _ in range(20))
+    )
+
+    assert results == ["A"] * 20
+    assert len(calls) == 1
+    assert cache.stats.coalesced == 19
+
+
+async def test_loader_errors_reach_every_waiter_and_are_not_cached():
+    cache: TTLCache[str, str] = TTLCache(maxsize=10, ttl=60)
+
+    async def failing() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(
+        cache.get_or_load("a", failing), cache.get_or_load("a", failing), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(cache) == 0
+
+
+async def test_cancelled_owner_hands_the_load_to_a_waiter():
+    cache: TTLCache[str, str] = TTLCache(maxsize=10, ttl=60)
+    calls: list[str] = []
+
+    owner = asyncio.create_task(cache.get_or_load("a", _loader(calls, "A", delay=10)))
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(cache.get_or_load("a", _loader(calls, "A", delay=0.01)))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    owner.cancel()  # e.g. its client disconnected
+
+    assert await asyncio.gather(*waiters) == ["A"] * 3
+    assert owner.cancelled()
+    assert len(calls) == 2  # the abandoned load and one retry
+    assert cache.get("a") == "A"
+
+
+async def test_none_is_not_cached():
+    cache: TTLCache[str, str] = TTLCache(maxsize=10, ttl=60)
+    calls: list[str] = []
+
+    assert await cache.get_or_load("a", _loader(calls, None)) is None
+    assert await cache.get_or_load("a", _loader(calls, "A")) == "A"
+    assert len(calls) == 2
+
+
+async def test_load_racing_an_invalidation_is_not_stored():
+    cache: TTLCache[str, str] = TTLCache(maxsize=10, ttl=60)
+    calls: list[str] = []
+
+    task = asyncio.create_task(cache.get_or_load("a", _loader(calls, "stale", delay=0.01)))
+    await asyncio.sleep(0)
+    cache.invalidate("a")
+    assert await task == "stale"
+
+    assert cache.get("a") is None
+
+
+@pytest.mark.parametrize("ttl", [0, -1])
+async def test_non_positive_ttl_disables_caching(ttl: float):
+    cache: TTLCache[str, str] = TTLCache(maxsize=10, ttl=ttl)
+    calls: list[str] = []
+
+    await cache.get_or_load("a", _loader(calls, "A"))
+    await cache.get_or_load("a", _loader(calls, "A"))
+    assert len(calls) == 2
@@ -0,0 +1,114 @@
+import uuid
+
+import pytest
+
+from app.core.cache_backends import MemoryBackend, RedisBackend, SharedCache
+from app.repositories.cache import CacheKind, CatalogCache
+from app.schemas.supplier_product import SupplierProductTerms
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        return MemoryBackend()
+    fakeredis = pytest.importorskip("fakeredis")
+    return RedisBackend(fakeredis.FakeAsyncRedis())
+
+
+def _terms(price: str) -> SupplierProductTerms:
+    return SupplierProductTerms(minimum_quantity=1.0, optimal_quantity=5.0, unit_price=price)
+
+
+async def test_backend_batched_get_set_delete(backend):
+    await backend.set_many({"a": b"1", "b": b"2"}, ttl=60)
+    assert await backend.get_many(["a", "missing", "b"]) == [b"1", None, b"2"]
+    await backend.delete_many(["a"])
+    assert await backend.get_many(["a", "b"]) == [None, b"2"]
+    assert await backend.incr("n") == 1
+    assert await backend.incr("n") == 2
+
+
+async def test_memory_backend_ttl():
+    now = [0.0]
+    backend = MemoryBackend(clock=lambda: now[0])
+    await backend.set_many({"a": b"1"}, ttl=5)
+    now[0] = 5.0
+    assert await backend.get_many(["a"]) == [None]
+
+
+async def test_shared_cache_round_trip_and_namespace_invalidation(backend):
+    cache = SharedCache(backend, ttl=60)
+    lookup = await cache.get_many("offers", ["x", "y"], SupplierProductTerms)
+    assert lookup.values == {}
+    await cache.set_many("offers", {"x": _terms("1.50")}, lookup)
+
+    lookup = await cache.get_many("offers", ["x", "y"], SupplierProductTerms)
+    assert lookup.values == {"x": _terms("1.50")}
+
+    await cache.invalidate_all("offers")
+    assert (await cache.get_many("offers", ["x"], SupplierProductTerms)).values == {}
+
+
+async def test_write_tagged_with_a_stale_generation_is_never_read(backend):
+    cache = SharedCache(backend, ttl=60)
+    before = await cache.get_many("offers", ["x"], SupplierProductTerms)
+    await cache.invalidate_all("offers")  # lands while the loader runs
+    await cache.set_many("offers", {"x": _terms("9.99")}, before)
+
+    assert (await cache.get_many("offers", ["x"], SupplierProductTerms)).values == {}
+
+
+async def test_write_back_after_a_key_invalidation_is_never_read(backend):
+    cache = SharedCache(backend, ttl=60)
+    before = await cache.get_many("offers", ["x", "y"], SupplierProductTerms)
+    await cache.invalidate("offers", ["x"])  # the writer commits while the loader runs
+    await cache.set_many("offers", {"x": _terms("9.99"), "y": _terms("2.00")}, before)
+
+    lookup = await cache.get_many("offers", ["x", "y"], SupplierProductTerms)
+    assert lookup.values == {"y": _terms("2.00")}
+    await cache.set_many("offers", {"x": _terms("3.00")}, lookup)
+    assert (await cache.get_many("offers", ["x"], SupplierProductTerms)).values == {
+        "x": _terms("3.00")
+    }
+
+
+async def test_shared_keys_are_invalidated_before_commit(backend):
+    shared = SharedCache(backend, ttl=60)
+    writer = CatalogCache(maxsize=10, ttl=60, shared=shared)
+    reader = CatalogCache(maxsize=10, ttl=60, shared=shared)
+    reading = type("FakeSession", (), {"info": {}})()
+    writing = type("FakeSession", (), {"info": {}})()
+    key = (uuid.uuid4(), uuid.uuid4())
+    prices = ["4.00"]
+
+    async def load() -> SupplierProductTerms:
+        return _terms(prices[0])
+
+    await reader.get(reading, CacheKind.OFFERS, key, load)
+    writer.invalidate(writing, CacheKind.OFFERS, key)
+    await writer.invalidate_shared(writing)
+    prices[0] = "5.00"  # committed; the reader hears the NOTIFY before the post-commit drop
+    reader.handle_notification(f"offers:{key[0]}:{key[1]}")
+    assert await reader.get(reading, CacheKind.OFFERS, key, load) == _terms("5.00")
+
+
+async def test_catalog_caches_share_entries_across_processes(backend):
+    shared = SharedCache(backend, ttl=60)
+    pod_a = CatalogCache(maxsize=10, ttl=60, shared=shared)
+    pod_b = CatalogCache(maxsize=10, ttl=60, shared=shared)
+    session = type("FakeSession", (), {"info": {}})()
+    key = (uuid.uuid4(), uuid.uuid4())
+    loads: list[str] = []
+
+    async def load() -> SupplierProductTerms:
+        loads.append("db")
+        return _terms("4.00")
+
+    assert await pod_a.get(session, CacheKind.OFFERS, key, load) == _terms("4.00")
+    assert await pod_b.get(session, CacheKind.OFFERS, key, load) == _terms("4.00")
+    assert loads == ["db"]
+
+    await pod_a._drop_shared([(CacheKind.OFFERS, key)])
+    pod_b.handle_notification(f"offers:{key[0]}:{key[1]}")
+    await pod_b.get(session, CacheKind.OFFERS, key, load)
+    assert loads == ["db", "db"]
@@ -0,0 +1,42 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.forecasting import fit_demand, period_series
+
+AS_OF = date(2026, 10, 19)
+
+
+def test_period_series_buckets_back_from_as_of():
+    daily = [
+        (AS_OF - timedelta(days=1), 2.0),  # last period
+        (AS_OF - timedelta(days=7), 3.0),  # still the last period
+        (AS_OF - timedelta(days=8), 5.0),  # the one before
+        (AS_OF - timedelta(days=22), 1.0),  # three periods back; a gap in between
+        (AS_OF, 100.0),  # not history yet
+    ]
+    assert period_series(daily, AS_OF, 7) == [1.0, 0.0, 5.0, 5.0]
+    assert period_series([], AS_OF, 7) == []
+
+
+def test_moving_average_and_smoothing():
+    fit = fit_demand([10.0, 10.0, 10.0, 20.0], window=2, alpha=0.5, season_length=0)
+    assert fit.history_periods == 4
+    assert fit.moving_average == 15.0
+    assert fit.smoothed == 15.0
+    assert fit.seasonal_index is None
+    assert fit.forecast == 15.0
+
+
+def test_seasonality_scales_the_next_period():
+    # Two seasons of four periods: demand peaks in the first period of each season.
+    season = [40.0, 10.0, 10.0, 20.0]
+    fit = fit_demand(season * 2, window=4, alpha=0.5, season_length=4)
+    assert fit.seasonal_index == pytest.approx(40.0 / 20.0)
+    assert fit.smoothed == pytest.approx(20.0)  # deseasonalized demand is flat
+    assert fit.forecast == pytest.approx(40.0)
+
+
+def test_seasonality_needs_two_seasons():
+    fit = fit_demand([40.0, 10.0, 10.0, 20.0, 40.0], window=4, alpha=0.5, season_length=4)
+    assert fit.seasonal_index is None
@@ -0,0 +1,60 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from app.core.price_matrix import OfferRecord, PriceMatrix, merge_records, offer_key, write_matrix
+
+
+def _record(price: str | None, minimum: float = 1.0) -> OfferRecord:
+    return OfferRecord.build(
+        uuid.uuid4(), uuid.uuid4(), None if price is None else Decimal(price), minimum, 10.0
+    )
+
+
+def _sorted(records: list[OfferRecord]) -> list[OfferRecord]:
+    return sorted(records, key=lambda r: r.key)
+
+
+def test_lookup_round_trip(tmp_path):
+    records = _sorted([_record("1.2500"), _record(None), _record("99999999.9999", 3.5)])
+    path = tmp_path / "offers.matrix"
+    assert write_matrix(path, records, 10, 20, 1.0, 0.5) == 3
+
+    matrix = PriceMatrix(path)
+    assert len(matrix) == 3
+    assert (matrix.header.offers_watermark, matrix.header.tombstones_watermark) == (10, 20)
+    for record in records:
+        assert matrix.get(record.key) == record
+    assert matrix.get(offer_key(uuid.uuid4(), uuid.uuid4())) is None
+    assert list(matrix.records()) == records
+    matrix.close()
+
+
+def test_prices_keep_column_scale(tmp_path):
+    record = _record("3.5")
+    write_matrix(tmp_path / "m", [record], 0, 0, 0.0, 0.0)
+    assert str(PriceMatrix(tmp_path / "m").get(record.key).unit_price) == "3.5000"
+
+
+def test_merge_applies_upserts_and_deletes_in_order():
+    base = _sorted([_record(str(i)) for i in range(6)])
+    updated = OfferRecord(base[2].key, Decimal("7"), 2.0, 4.0)
+    added = [_record("8"), _record("9")]
+
+    merged = list(merge_records(base, [updated, *added], deletes=[base[0].key, base[5].key]))
+
+    assert merged == _sorted([base[1], updated, base[3], base[4], *added])
+
+
+def test_writer_rejects_unsorted_records(tmp_path):
+    records = _sorted([_record("1"), _record("2")])
+    with pytest.raises(ValueError):
+        write_matrix(tmp_path / "m", reversed(records), 0, 0, 0.0, 0.0)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rejects_foreign_files(tmp_path):
+    (tmp_path / "m").write_bytes(b"not a matrix" * 10)
+    with pytest.raises(ValueError):
+        PriceMatrix(tmp_path / "m")
@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+from starlette.requests import Request
+
+from app.core.response_cache import ResponseCache, request_key
+
+
+def _request(query: str) -> Request:
+    return Request(
+        {"type": "http", "path": "/api/v1/orders", "query_string": query.encode(), "headers": []}
+    )
+
+
+def _session(*objects: object) -> SimpleNamespace:
+    return SimpleNamespace(info={}, new=list(objects), dirty=[], deleted=[])
+
+
+def _row(table: str) -> SimpleNamespace:
+    return SimpleNamespace(__table__=SimpleNamespace(name=table))
+
+
+def test_request_key_ignores_parameter_order():
+    assert request_key(_request("skip=0&limit=5")) == request_key(_request("limit=5&skip=0"))
+    assert request_key(_request("limit=5")) != request_key(_request("limit=6"))
+
+
+async def test_committed_writes_invalidate_dependent_entries():
+    cache = ResponseCache(maxsize=10, ttl=60)
+    loads: list[int] = []
+
+    async def load() -> list[int]:
+        loads.append(1)
+        return [len(loads)]
+
+    async def get(tables: tuple[str, ...]) -> bytes:
+        return (await cache.json(_request("limit=5"), tables, load)).body
+
+    assert await get(("buy_orders", "suppliers")) == b"[1]"
+    assert await get(("buy_orders", "suppliers")) == b"[1]"
+
+    rolled_back = _session(_row("suppliers"))
+    cache._after_flush(rolled_back, None)
+    cache._after_rollback(rolled_back)
+    assert await get(("buy_orders", "suppliers")) == b"[1]"
+
+    committed = _session(_row("suppliers"))
+    cache._after_flush(committed, None)
+    cache._after_commit(committed)
+    assert await get(("buy_orders", "suppliers")) == b"[2]"
+
+    bulk = _session()
+    cache.touch(bulk, ["buy_orders"])
+    cache._after_commit(bulk)
+    assert await get(("buy_orders", "suppliers")) == b"[3]"
+    assert len(loads) == 3
+
+
+async def test_disabled_by_default_ttl():
+    cache = ResponseCache(maxsize=10, ttl=0)
+    loads: list[int] = []
+
+    async def load() -> list[int]:
+        loads.append(1)
+        return []
+
+    await cache.json(_request(""), ("products",), load)
+    await cache.json(_request(""), ("products",), load)
+    assert len(loads) == 2
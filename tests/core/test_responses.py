@@ -0,0 +1,72 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.responses import FastJSONResponse, ModelResponse
+from app.schemas.buy_order import BuyOrderWithItems
+
+
+def _order() -> SimpleNamespace:
+    now = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    supplier = SimpleNamespace(
+        id=uuid.uuid4(), name="Proveedor Ñandú — 東京", email=None, phone="555",
+        address="Calle \"Mayor\" 1\n", created_at=now, updated_at=now,
+    )
+    product = SimpleNamespace(
+        id=uuid.uuid4(), name="Bolt ⌀8", sku="B-8", description=None, unit="pcs",
+        stock=12.5, created_at=now, updated_at=now,
+    )
+    order_id = uuid.uuid4()
+    item = SimpleNamespace(
+        id=uuid.uuid4(), order_id=order_id, product_id=product.id, quantity=3.0,
+        unit_price=Decimal("7.1000"), subtotal=Decimal("21.3000"),
+        created_at=now, updated_at=now, product=product,
+    )
+    return SimpleNamespace(
+        id=order_id, supplier_id=supplier.id, status="CONFIRMED", notes="Ünïcödé\tnotes",
+        total=Decimal("21.3000"), created_at=now, updated_at=now,
+        supplier=supplier, items=[item],
+    )
+
+
+def _default_path_body(schema: object, content: object) -> bytes:
+    # What FastAPI does for response_model: validate, dump to JSON-native Python, json.dumps.
+    adapter = TypeAdapter(schema)
+    return JSONResponse(adapter.dump_python(adapter.validate_python(content, from_attributes=True), mode="json")).body
+
+
+def test_model_response_is_byte_identical_to_default_path() -> None:
+    order = _order()
+    assert ModelResponse(BuyOrderWithItems, order).body == _default_path_body(BuyOrderWithItems, order)
+
+
+def test_model_response_list_is_byte_identical_to_default_path() -> None:
+    orders = [_order(), _order()]
+    schema = list[BuyOrderWithItems]
+    assert ModelResponse(schema, orders).body == _default_path_body(schema, orders)
+
+
+def test_fast_json_response_matches_json_response() -> None:
+    content = {"a": [1, 2.5, None, True], "b": "Ñandú \"q\" \n", "c": {"nested": 0.1}}
+    assert FastJSONResponse(content).body == JSONResponse(content).body
+
+
+def test_edge_floats_decode_to_the_same_values() -> None:
+    # Exponent spelling differs between encoders (1e+16 / 1e16, 1e-07 / 1e-7); the values
+    # must not.
+    order = _order()
+    edges = [1e16, 1e-7, -0.0, 5e-324, 1.7976931348623157e308, 0.1 + 0.2]
+    for value in edges:
+        order.items[0].quantity = value
+        order.items[0].product.stock = abs(value)
+        body = ModelResponse(BuyOrderWithItems, order).body
+        assert json.loads(body) == json.loads(_default_path_body(BuyOrderWithItems, order))
+        assert json.loads(body)["items"][0]["quantity"] == value
+    content = {"values": edges}
+    assert json.loads(FastJSONResponse(content).body) == json.loads(JSONResponse(content).body)
+
@@ -0,0 +1,32 @@
+from typing import Any
+
+from sqlalchemy import create_mock_engine
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.db.base import Base
+
+
+def _create_all_ddl() -> list[str]:
+    statements: list[str] = []
+
+    def executor(sql: Any, *args: Any, **kwargs: Any) -> None:
+        statements.append(str(sql.compile(dialect=engine.dialect)))
+
+    engine = create_mock_engine("postgresql+asyncpg://", executor)
+    Base.metadata.create_all(engine, checkfirst=False)
+    return statements
+
+
+def _position(statements: list[str], needle: str) -> int:
+    return next(i for i, sql in enumerate(statements) if needle in sql)
+
+
+def test_create_all_installs_pg_trgm_before_trigram_indexes():
+    statements = _create_all_ddl()
+    extension = _position(statements, "CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index in (
+        "ix_buy_orders_notes_trgm",
+        "ix_products_name_trgm",
+        "ix_products_description_trgm",
+    ):
+        assert extension < _position(statements, index)
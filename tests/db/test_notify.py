@@ -0,0 +1,41 @@
+import uuid
+
+from app.db.notify import PgListener, asyncpg_dsn
+from app.repositories.cache import NOTIFY_CHANNEL, CacheKind, CatalogCache
+
+
+def _listener(cache: CatalogCache) -> PgListener:
+    return PgListener("postgresql://localhost/db", NOTIFY_CHANNEL, cache.handle_notification)
+
+
+def test_asyncpg_dsn_drops_driver_and_keeps_credentials():
+    dsn = asyncpg_dsn("postgresql+asyncpg://app:s3cret@db:5432/orders")
+    assert dsn == "postgresql://app:s3cret@db:5432/orders"
+
+
+def test_notifications_evict_matching_entries():
+    cache = CatalogCache(maxsize=10, ttl=60)
+    supplier_id, product_id, other_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    cache.caches[CacheKind.SUPPLIERS].set(supplier_id, "supplier")
+    cache.caches[CacheKind.SUPPLIERS].set(other_id, "other")
+    cache.caches[CacheKind.OFFERS].set((supplier_id, product_id), "offer")
+    listener = _listener(cache)
+
+    listener.dispatch(f"suppliers:{supplier_id}")
+    listener.dispatch(f"offers:{supplier_id}:{product_id}")
+
+    assert cache.caches[CacheKind.SUPPLIERS].get(supplier_id) is None
+    assert cache.caches[CacheKind.SUPPLIERS].get(other_id) == "other"
+    assert cache.caches[CacheKind.OFFERS].get((supplier_id, product_id)) is None
+
+
+def test_malformed_notifications_are_ignored():
+    cache = CatalogCache(maxsize=10, ttl=60)
+    product_id = uuid.uuid4()
+    cache.caches[CacheKind.PRODUCTS].set(product_id, "product")
+    listener = _listener(cache)
+
+    for payload in ("", "widgets:1", "products:not-a-uuid", "offers:only-one"):
+        listener.dispatch(payload)
+
+    assert cache.caches[CacheKind.PRODUCTS].get(product_id) == "product"
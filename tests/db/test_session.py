@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.metrics import PoolWaitStats, pool_wait_stats
+from app.db.session import TimedQueuePool
+
+
+async def test_checkouts_and_timeouts_are_recorded() -> None:
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    before = pool_wait_stats.snapshot()
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        with pytest.raises(PoolTimeoutError):
+            async with engine.connect():
+                pass
+    after = pool_wait_stats.snapshot()
+    await engine.dispose()
+
+    assert after.acquisitions == before.acquisitions + 1
+    assert after.timeouts == before.timeouts + 1
+    assert after.wait_max_ms >= before.wait_max_ms
+
+
+def test_wait_peak_covers_the_window_since_the_last_reset() -> None:
+    stats = PoolWaitStats()
+    stats.record(0.5)
+    assert stats.snapshot(reset_peak=True).wait_peak_ms == 500
+
+    stats.record(0.1)
+    snapshot = stats.snapshot(reset_peak=True)
+    assert snapshot.wait_peak_ms == 100
+    assert snapshot.wait_max_ms == 500
+    assert stats.snapshot().wait_peak_ms == 0
@@ -0,0 +1,72 @@
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.product import Product
+from app.models.supplier import Supplier
+from app.models.supplier_product import SupplierProduct
+from app.repositories.cache import CacheKind
+from app.repositories.price_matrix import PriceMatrixStore
+from app.repositories.supplier_product import SupplierProductRepository
+
+
+async def _offer(db: AsyncSession, name: str, price: str) -> SupplierProduct:
+    supplier = Supplier(name=f"Matrix {name}")
+    product = Product(name=f"Matrix {name}", sku=f"MTX-{name}", unit="pcs")
+    db.add_all([supplier, product])
+    await db.flush()
+    offer = SupplierProduct(
+        supplier_id=supplier.id,
+        product_id=product.id,
+        minimum_quantity=2.0,
+        optimal_quantity=8.0,
+        unit_price=Decimal(price),
+    )
+    db.add(offer)
+    await db.flush()
+    return offer
+
+
+async def _rebuild(store: PriceMatrixStore, db: AsyncSession) -> None:
+    assert await store.build(db) is not None
+    store.reload()
+
+
+async def test_full_then_incremental_rebuilds(db_session: AsyncSession, tmp_path) -> None:
+    kept = await _offer(db_session, "A", "4.00")
+    changed = await _offer(db_session, "B", "5.00")
+    removed = await _offer(db_session, "C", "6.00")
+    store = PriceMatrixStore(tmp_path / "offers.matrix", 30, 3600)
+
+    await _rebuild(store, db_session)
+    terms = store.lookup(kept.supplier_id, kept.product_id)
+    assert terms is not None and terms.unit_price == Decimal("4.00")
+    assert terms.minimum_quantity == 2.0
+    full_build = store._matrix.header.full_started_at
+
+    changed.unit_price = Decimal("5.50")
+    await db_session.flush()
+    await SupplierProductRepository.delete(db_session, removed)
+    await _rebuild(store, db_session)
+
+    assert store._matrix.header.full_started_at == full_build  # merged, not rebuilt
+    assert store.lookup(changed.supplier_id, changed.product_id).unit_price == Decimal("5.50")
+    assert store.lookup(removed.supplier_id, removed.product_id) is None
+    assert store.lookup(kept.supplier_id, kept.product_id) is not None
+    store.close()
+
+
+async def test_changed_keys_bypass_the_snapshot_until_rebuilt(
+    db_session: AsyncSession, tmp_path
+) -> None:
+    offer = await _offer(db_session, "D", "1.00")
+    store = PriceMatrixStore(tmp_path / "offers.matrix", 30, 3600)
+    await _rebuild(store, db_session)
+    key = (offer.supplier_id, offer.product_id)
+
+    store.note_change(CacheKind.OFFERS, key)
+    assert store.lookup(*key) is None
+
+    await _rebuild(store, db_session)
+    assert store.lookup(*key) is not None
+    store.close()
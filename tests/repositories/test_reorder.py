@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy.dialects import postgresql
+
+from app.repositories.reorder import REORDER_LOCK_KEY, ReorderRepository
+
+
+class _PostgresSession:
+    """Records statements instead of running them, reporting a Postgres bind."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def get_bind(self) -> Any:
+        return SimpleNamespace(dialect=postgresql.dialect())
+
+    async def execute(self, stmt: Any, *args: Any) -> Any:
+        compiled = stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+        self.statements.append(str(compiled))
+        return SimpleNamespace(all=lambda: [])
+
+
+async def test_draft_orders_take_the_reorder_lock_before_reading_suggestions() -> None:
+    session = _PostgresSession()
+
+    assert await ReorderRepository.create_draft_orders(session) == []  # type: ignore[arg-type]
+
+    lock, suggestions = session.statements
+    assert f"pg_advisory_xact_lock({REORDER_LOCK_KEY})" in lock
+    assert "buy_order_items" in suggestions
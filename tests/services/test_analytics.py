@@ -0,0 +1,21 @@
+import uuid
+from decimal import Decimal
+
+from app.services.analytics import classify_abc
+
+
+def _rows(*spends: str) -> list[tuple[uuid.UUID, str, Decimal]]:
+    return [(uuid.uuid4(), f"item {i}", Decimal(s)) for i, s in enumerate(spends)]
+
+
+def test_classify_abc_ranks_and_labels_by_cumulative_share():
+    total, items = classify_abc(_rows("5", "70", "10", "15"), a_share=0.8, b_share=0.95)
+    assert total == Decimal("100")
+    assert [i["spend"] for i in items] == [Decimal(s) for s in ("70", "15", "10", "5")]
+    assert [i["cumulative_share"] for i in items] == [0.7, 0.85, 0.95, 1.0]
+    # 70 is below 80%, so the item that crosses the line (15) is still A.
+    assert [i["abc_class"] for i in items] == ["A", "A", "B", "C"]
+
+
+def test_classify_abc_without_spend():
+    assert classify_abc([], 0.8, 0.95) == (Decimal("0"), [])
@@ -0,0 +1,99 @@
+import random
+import time
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from app.services.cart import plan_cart
+
+A, B, C = (uuid.UUID(int=i) for i in (1, 2, 3))
+
+
+def _offer(supplier_id: uuid.UUID, price: str | None, minimum: float = 0.0) -> dict:
+    return {
+        "supplier_id": supplier_id,
+        "unit_price": None if price is None else Decimal(price),
+        "minimum_quantity": minimum,
+    }
+
+
+def _products(n: int) -> list[uuid.UUID]:
+    return [uuid.uuid4() for _ in range(n)]
+
+
+def test_without_order_cost_every_line_takes_its_cheapest_offer() -> None:
+    p1, p2 = _products(2)
+    offers = {p1: [_offer(A, "1"), _offer(B, "2")], p2: [_offer(A, "3"), _offer(B, "2")]}
+    plan = plan_cart({p1: 1, p2: 1}, offers)
+    assert {p: o.supplier_id for p, o in plan.items()} == {p1: A, p2: B}
+
+
+def test_order_cost_consolidates_suppliers() -> None:
+    p1, p2 = _products(2)
+    offers = {p1: [_offer(A, "1"), _offer(B, "2")], p2: [_offer(A, "2.5"), _offer(B, "2")]}
+    plan = plan_cart({p1: 1, p2: 1}, offers, order_cost=Decimal("5"))
+    assert {p: o.supplier_id for p, o in plan.items()} == {p1: A, p2: A}
+
+
+def test_closing_a_supplier_counts_the_order_cost_of_its_replacement() -> None:
+    (p1,) = _products(1)
+    offers = {p1: [_offer(A, "1"), _offer(B, "2")]}
+    plan = plan_cart({p1: 1}, offers, order_cost=Decimal("10"))
+    assert plan[p1].supplier_id == A
+
+
+def test_order_cost_can_favour_a_supplier_that_is_never_cheapest() -> None:
+    p1, p2 = _products(2)
+    offers = {
+        p1: [_offer(A, "1"), _offer(C, "1.5")],
+        p2: [_offer(B, "1"), _offer(C, "1.5")],
+    }
+    plan = plan_cart({p1: 1, p2: 1}, offers, order_cost=Decimal("10"))
+    assert {o.supplier_id for o in plan.values()} == {C}
+
+
+def test_sole_offers_keep_their_supplier_open() -> None:
+    p1, p2 = _products(2)
+    offers = {p1: [_offer(A, "1")], p2: [_offer(A, "2"), _offer(B, "1")]}
+    plan = plan_cart({p1: 1, p2: 1}, offers, order_cost=Decimal("5"))
+    assert {p: o.supplier_id for p, o in plan.items()} == {p1: A, p2: A}
+
+
+def test_minimum_quantity_is_respected_and_costed() -> None:
+    (p1,) = _products(1)
+    offers = {p1: [_offer(A, "1", minimum=100), _offer(B, "2", minimum=0)]}
+    plan = plan_cart({p1: 10}, offers)
+    assert plan[p1].supplier_id == B
+    assert plan[p1].cost == Decimal("20")
+
+    plan = plan_cart({p1: 80}, offers)
+    assert plan[p1].supplier_id == A
+    assert plan[p1].quantity == 100
+
+
+def test_lines_without_a_priced_offer_are_left_out() -> None:
+    p1, p2 = _products(2)
+    plan = plan_cart({p1: 1, p2: 1}, {p1: [_offer(A, None)]})
+    assert plan == {}
+
+
+@pytest.mark.parametrize("order_cost", ["5", "500"])
+def test_large_cart_plans_in_well_under_a_second(order_cost: str) -> None:
+    rng = random.Random(0)
+    suppliers = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(2000)]
+    demand: dict[uuid.UUID, float] = {}
+    offers: dict[uuid.UUID, list[dict]] = {}
+    for product_id in _products(5000):
+        demand[product_id] = float(rng.randint(1, 20))
+        offers[product_id] = [
+            _offer(s, str(rng.randint(100, 10000) / 100), minimum=rng.choice([0, 1, 5, 10]))
+            for s in rng.sample(suppliers, 50)
+        ]
+
+    started = time.perf_counter()
+    plan = plan_cart(demand, offers, order_cost=Decimal(order_cost))
+    elapsed = time.perf_counter() - started
+
+    assert len(plan) == len(demand)
+    assert elapsed < 1.0
@@ -0,0 +1,29 @@
+import uuid
+
+from app.main import handle_catalog_notification
+from app.repositories.cache import CacheKind, catalog_cache
+from app.services.analytics import SPEND_CHANGED_PAYLOAD, abc_cache
+
+
+def test_spend_notification_clears_analytics_only():
+    supplier_id = uuid.uuid4()
+    abc_cache.set("abc", {"items": []})
+    catalog_cache.caches[CacheKind.SUPPLIERS].set(supplier_id, "supplier")
+
+    handle_catalog_notification(SPEND_CHANGED_PAYLOAD)
+
+    assert abc_cache.get("abc") is None
+    assert catalog_cache.caches[CacheKind.SUPPLIERS].get(supplier_id) == "supplier"
+    catalog_cache.clear()
+
+
+def test_catalog_notification_evicts_the_entry():
+    supplier_id = uuid.uuid4()
+    abc_cache.set("abc", {"items": []})
+    catalog_cache.caches[CacheKind.SUPPLIERS].set(supplier_id, "supplier")
+
+    handle_catalog_notification(f"suppliers:{supplier_id}")
+
+    assert catalog_cache.caches[CacheKind.SUPPLIERS].get(supplier_id) is None
+    assert abc_cache.get("abc") == {"items": []}
+    abc_cache.clear()